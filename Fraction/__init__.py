@@ -0,0 +1,70 @@
+"""Exact fractions and their optional subsystems.
+
+Seul le type Fraction (module core) est importé immédiatement. Les sous-systèmes plus
+lourds (matrices, conteneurs triés, noyaux parallèles, ...) ne sont chargés qu'au premier
+accès, via le __getattr__ du module : `import Fraction` reste quasi instantané pour les
+processus courts.
+"""
+from .core import Fraction, DenominatorIsZero, WrongTypeError
+
+__all__ = ["Fraction", "DenominatorIsZero", "WrongTypeError"]
+
+_SUBMODULES = {"farey", "fraction_matrix", "sorted_fractions", "interop", "small_table", "parallel",
+               "small_fraction", "modular",
+               "series", "rounding", "stats", "bounded", "egyptian", "roots", "interning", "polynomial"}
+
+_LAZY_ATTRIBUTES = {
+    "AdjacencyIndex": "farey",
+    "farey_sequence": "farey",
+    "simplest_between": "farey",
+    "simplest_between_all": "farey",
+    "FractionMatrix": "fraction_matrix",
+    "SingularMatrixError": "fraction_matrix",
+    "SortedFractionList": "sorted_fractions",
+    "sort_exact": "sorted_fractions",
+    "to_float_array": "interop",
+    "SmallFraction": "small_fraction",
+    "SmallFractionArray": "small_fraction",
+    "enable_small_table": "small_table",
+    "disable_small_table": "small_table",
+    "batch_apply": "parallel",
+    "parallel_sum": "parallel",
+    "parallel_product": "parallel",
+    "parallel_cumsum": "parallel",
+    "parallel_cumprod": "parallel",
+    "modular_sum": "modular",
+    "modular_dot": "modular",
+    "series_sum": "series",
+    "hypergeometric_sum": "series",
+    "floor_all": "rounding",
+    "ceil_all": "rounding",
+    "trunc_all": "rounding",
+    "round_all": "rounding",
+    "divmod_all": "rounding",
+    "MomentAccumulator": "stats",
+    "BoundedContext": "bounded",
+    "egyptian_fractions": "egyptian",
+    "egyptian_fractions_all": "egyptian",
+    "exact_root": "roots",
+    "root_interval": "roots",
+    "enable_interning": "interning",
+    "disable_interning": "interning",
+    "FractionPolynomial": "polynomial",
+}
+
+
+def __getattr__(name):
+    import importlib
+
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | set(_LAZY_ATTRIBUTES))
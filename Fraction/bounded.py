@@ -0,0 +1,114 @@
+from contextvars import ContextVar
+from math import gcd
+
+from .core import Fraction
+
+# Contexte actif et pile des jetons de ses __enter__, propres à chaque thread et à chaque tâche asyncio
+_active = ContextVar("bounded_context", default=None)
+_tokens = ContextVar("bounded_context_tokens", default=())
+Fraction._bounded_context = _active
+
+
+class BoundedContext:
+    """Arithmetic context snapping every operator result to a bounded denominator
+
+    Dans un bloc `with BoundedContext(max_denominator):`, le résultat de chaque opérateur
+    +, -, * et / de Fraction est remplacé par sa meilleure approximation de dénominateur
+    <= max_denominator (limit_denominator). Les dénominateurs ne doublent plus de taille à
+    chaque itération : le coût de chaque opération reste borné, et l'erreur d'un arrondi
+    est inférieure à 1 / (q * max_denominator) où q est le nouveau dénominateur, bien en
+    dessous de celle d'un float dès que max_denominator dépasse 2**27.
+
+    Les erreurs d'arrondi sont mesurées et cumulées (voir stats). Le contexte actif est tenu
+    dans une variable de contexte (contextvars) : il ne s'applique qu'au thread (ou à la
+    tâche asyncio) qui est entré dans le bloc `with`, les autres gardent leur propre contexte.
+    Une même instance peut être active dans plusieurs threads ou tâches ; ses compteurs sont alors
+    partagés et incrémentés sans verrou (approchés sous forte concurrence). Seuls les
+    opérateurs sont concernés : le constructeur et les noyaux des autres modules restent exacts.
+    """
+
+    def __init__(self, max_denominator):
+        """Create a context for the given denominator bound.
+
+        PRE : max_denominator est un entier >= 1
+        POST : crée un contexte inactif dont les compteurs sont à zéro
+        RAISE :
+            - TypeError si max_denominator n'est pas un entier
+            - ValueError si max_denominator < 1
+        """
+        if not isinstance(max_denominator, int) or isinstance(max_denominator, bool):
+            raise TypeError(f"{max_denominator} n'est pas un entier")
+        if max_denominator < 1:
+            raise ValueError("Le dénominateur maximal doit être >= 1")
+        self.max_denominator = max_denominator
+        self.reset()
+
+    def reset(self):
+        """Reset the operation counters and the accumulated error.
+
+        PRE : -
+        POST : les compteurs et les erreurs cumulées sont remis à zéro
+        """
+        self.operations = 0
+        self.snapped = 0
+        self.total_error = 0.0
+        self.max_error = 0.0
+
+    def snap(self, num, den):
+        """Return the reduced num/den, or its best approximation if its denominator is too large.
+
+        PRE : den != 0
+        POST : renvoie une Fraction de dénominateur <= max_denominator, la plus proche de num/den ;
+               l'erreur commise est ajoutée aux statistiques du contexte
+        """
+        if den < 0:
+            num, den = -num, -den
+        g = gcd(num, den)
+        if g != 1:
+            num //= g
+            den //= g
+        self.operations += 1
+        if den <= self.max_denominator:
+            return Fraction._from_reduced(num, den)
+        approximation = Fraction._from_reduced(num, den).limit_denominator(self.max_denominator)
+        k = approximation.denominator
+        error = Fraction._to_float(abs(approximation.numerator * den - num * k), den * k)
+        self.snapped += 1
+        self.total_error += error
+        if error > self.max_error:
+            self.max_error = error
+        return approximation
+
+    def stats(self):
+        """Return the counters and the approximation errors of the context.
+
+        total_error est la somme des erreurs absolues des arrondis : l'écart réel au calcul
+        exact dépend aussi de la propagation de ces erreurs par les opérations suivantes.
+
+        PRE : -
+        POST : renvoie un dictionnaire des mesures du contexte
+        """
+        return {
+            "max_denominator": self.max_denominator,
+            "operations": self.operations,
+            "snapped": self.snapped,
+            "snap_rate": self.snapped / self.operations if self.operations else 0.0,
+            "total_error": self.total_error,
+            "max_error": self.max_error,
+        }
+
+    def __enter__(self):
+        """Activate the context in the current thread or task (the previous one is restored at exit)."""
+        _tokens.set(_tokens.get() + (_active.set(self),))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        tokens = _tokens.get()
+        _tokens.set(tokens[:-1])
+        _active.reset(tokens[-1])
+        return False
+
+
+def current_context():
+    """Return the bounded context active in the current thread, or None if the arithmetic is exact."""
+    return _active.get()
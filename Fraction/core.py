@@ -0,0 +1,1024 @@
+import math
+import sys
+from itertools import zip_longest
+
+# Marque de fin d'un itérable plus court que l'autre (voir Fraction.dot)
+_MISSING = object()
+
+
+class DenominatorIsZero(Exception):
+    """Exception raised when the denominator is zero."""
+    pass
+
+
+class WrongTypeError(Exception):
+    """Exception raised when the input type is incorrect."""
+    pass
+
+
+class Fraction:
+    """Class representing a fraction and operations on it
+
+    Author : D. Alhssanesanee
+    Date : October 2024
+    This class allows fraction manipulations through several operations.
+    """
+
+    # Table optionnelle des petites fractions (voir small_table.py)
+    _small_table = None
+
+    # Variable de contexte (contextvars.ContextVar) du contexte d'arithmétique à dénominateur
+    # borné actif, installée au chargement de bounded.py
+    _bounded_context = None
+
+    # Pool optionnel d'internement des valeurs répétées (voir interning.py) ; _interned_by est
+    # remplacé, sur chaque instance canonique, par la marque de génération du pool
+    _intern_pool = None
+    _interned_by = None
+
+    # Plus grand indice de racine tenté exactement par ** avec un exposant float
+    _EXACT_ROOT_MAX_DEGREE = 64
+
+    # Routine de conversion en Fraction de chaque type d'opérande rencontré (None : type refusé)
+    _coercions = {}
+
+    def __new__(cls, num=0, den=1):
+        """This builds a fraction based on some numerator and denominator.
+
+        Si une table des petites fractions est activée et contient num/den, l'instance
+        canonique (partagée) de la table est renvoyée sans calcul de pgcd. Sinon, si un pool
+        d'internement est activé, l'instance canonique de la forme réduite est renvoyée.
+
+        PRE :
+        POST :
+            - créer une fraction "numerateur"/"denominateur" sous sa forme réduite
+        RAISE :
+            - TypError si le type des parametres est différent d'un entier
+            - DenominatorIsZero si le denominateur est 0
+        """
+        if not isinstance(num, int) or not isinstance(den, int):
+            raise TypeError("Le numérateur et le dénominateur doivent être des entiers ")
+        if den == 0:
+            raise DenominatorIsZero("le dénominateur ne peut pas être égal à zero ")
+
+        table = cls._small_table
+        if table is not None:
+            limit = table.limit
+            if 0 < den <= limit and -limit <= num <= limit:
+                table.hits += 1
+                return table.instances[den * table.width + num + limit]
+            table.misses += 1
+
+        pgcd = cls.pgcd(num, den)
+        pool = cls._intern_pool
+        if pool is not None:
+            return pool.canonical(num // pgcd, den // pgcd)
+        fraction = object.__new__(cls)
+        fraction.__denominator = den // pgcd
+        fraction.__numerator = num // pgcd
+        return fraction
+
+    def __reduce__(self):
+        # Les instances peuvent être partagées : copie et pickle repassent par le constructeur
+        return Fraction, (self.numerator, self.denominator)
+
+    @property
+    def numerator(self):
+        return self.__numerator
+
+    @property
+    def denominator(self):
+        return self.__denominator
+
+    # ------------------ Textual representations ------------------
+
+    def __str__(self):
+        """Return a textual representation of the reduced form of the fraction
+
+        PRE : -
+        POST :
+            - renvoie la chaine "numerator/denominator"
+        """
+        return f"{self.numerator}" if self.is_integer() else f"{self.numerator}/{self.denominator}"
+
+    def as_mixed_number(self):
+        """Return a textual representation of the reduced form of the fraction as a mixed number
+
+        A mixed number is the sum of an integer and a proper fraction
+
+        PRE : -
+        POST :
+            - renvoie la chaine "numerator + 1/denominator"
+        """
+        entier = self.__trunc__()  # Exact, même au-delà de 2**53
+        reste = abs(self.numerator) % abs(self.denominator)
+        signe = "-" if self.numerator < 0 else "+"
+
+        return f"{entier} {signe} {reste}/{self.denominator}" if reste != 0 else str(entier)
+
+    # ------------------ Operators overloading ------------------
+
+    def __add__(self, other):
+        """Overloading of the + operator for fractions
+
+         PRE :
+         POST :
+            - renvoie la somme de la fraction de type Fraction
+         RAISE:
+            - WrongTypeError si other est différent de int, float ou une Fraction
+         """
+
+        other = self._coerce(other)
+
+        den = other.denominator * self.denominator
+        num = self.numerator * other.denominator + other.numerator * self.denominator
+        scope = Fraction._bounded_context
+        if scope is not None:
+            context = scope.get()
+            if context is not None:
+                return context.snap(num, den)
+        return Fraction(num, den)
+
+    def __sub__(self, other):
+        """Overloading of the - operator for fractions
+
+         PRE :
+         POST :
+            - renvoie la différence de la fraction de type Fraction
+         RAISE:
+            - WrongTypeError si other est différent de int, float ou une Fraction
+         """
+
+        other = self._coerce(other)
+
+        den = other.denominator * self.denominator
+        num = self.numerator * other.denominator - other.numerator * self.denominator
+        scope = Fraction._bounded_context
+        if scope is not None:
+            context = scope.get()
+            if context is not None:
+                return context.snap(num, den)
+        return Fraction(num, den)
+
+    def __mul__(self, other):
+        """Overloading of the * operator for fractions
+
+         PRE :
+         POST :
+            - renvoie la multiplication de la fraction de type Fraction
+         RAISE:
+            - WrongTypeError si other est différent de int, float ou une Fraction
+         """
+
+        other = self._coerce(other)
+
+        num = self.numerator * other.numerator
+        den = self.denominator * other.denominator
+        scope = Fraction._bounded_context
+        if scope is not None:
+            context = scope.get()
+            if context is not None:
+                return context.snap(num, den)
+        return Fraction(num, den)
+
+    def __truediv__(self, other):
+        """Overloading of the / operator for fractions
+        PRE :
+         POST :
+            - renvoie la division entière de la fraction de type Fraction
+        RAISE:
+            - WrongTypeError si other est différent de int, float ou une Fraction
+            - DivisionZeroError si other.numérateur est égal à  zero
+         """
+
+        other = self._coerce(other)
+        return self.__mul__(Fraction(other.denominator, other.numerator))
+
+    def __radd__(self, other):
+        """Overloading of the reflected + operator (other + self)
+
+        PRE : -
+        POST :
+            - renvoie la somme other + self de type Fraction
+        RAISE:
+            - WrongTypeError si other n'est pas d'un type numérique accepté
+        """
+        return self._coerce(other).__add__(self)
+
+    def __rsub__(self, other):
+        """Overloading of the reflected - operator (other - self)
+
+        PRE : -
+        POST :
+            - renvoie la différence other - self de type Fraction
+        RAISE:
+            - WrongTypeError si other n'est pas d'un type numérique accepté
+        """
+        return self._coerce(other).__sub__(self)
+
+    def __rmul__(self, other):
+        """Overloading of the reflected * operator (other * self)
+
+        PRE : -
+        POST :
+            - renvoie le produit other * self de type Fraction
+        RAISE:
+            - WrongTypeError si other n'est pas d'un type numérique accepté
+        """
+        return self._coerce(other).__mul__(self)
+
+    def __rtruediv__(self, other):
+        """Overloading of the reflected / operator (other / self)
+
+        PRE : -
+        POST :
+            - renvoie le quotient other / self de type Fraction
+        RAISE:
+            - WrongTypeError si other n'est pas d'un type numérique accepté
+            - DenominatorIsZero si self vaut zero
+        """
+        return self._coerce(other).__truediv__(self)
+
+    def __pow__(self, other):
+
+        """Overloading of the ** operator for fractions
+
+        Une puissance entière est calculée exactement sur les entiers. Un exposant float p/q
+        (0.5, 0.25, 1.5, ...) donne un résultat exact si le numérateur et le dénominateur
+        sont des puissances q-ièmes parfaites ; sinon le calcul passe par les floats (voir
+        roots.root_interval pour un encadrement certifié). Une fraction négative n'a pas de
+        puissance réelle d'exposant non entier : elle est refusée.
+
+        PRE : -
+        POST :
+            - renvoie la fraction à la puissance other
+        RAISES :
+            - TypeError si other est différent de int ou float
+            - DenominatorIsZero si la fraction vaut zero et other est un entier négatif
+            - ValueError si la fraction est négative et other est un float fini non entier
+        """
+
+        if not isinstance(other, (int, float)):
+            raise TypeError(f"{other} is not a float or integer")
+        if isinstance(other, int):
+            if other >= 0:
+                num, den = self.numerator ** other, self.denominator ** other
+            elif self.numerator == 0:
+                raise DenominatorIsZero("le dénominateur ne peut pas être égal à zero ")
+            else:
+                num, den = self.denominator ** -other, self.numerator ** -other
+            scope = Fraction._bounded_context
+            if scope is not None:
+                context = scope.get()
+                if context is not None:
+                    return context.snap(num, den)
+            return Fraction(num, den)
+        if other.is_integer():
+            return self.__pow__(int(other))
+        if math.isfinite(other):
+            if self.numerator < 0:
+                raise ValueError(f"{self} est négative : pas de puissance réelle d'exposant {other}")
+            p, q = other.as_integer_ratio()
+            if q <= self._EXACT_ROOT_MAX_DEGREE:
+                from .roots import exact_root
+                root = exact_root(self, q)
+                if root is not None:
+                    return root.__pow__(p)
+        num = self.numerator ** other
+        den = self.denominator ** other
+        return self.convert_to_fraction(num / den)
+
+    def __eq__(self, other):
+        """Overloading of the == operator for fractions
+        PRE :
+        POST :
+            - Renvoie un booleen True si les numérateur et le denominateur des
+                fractions sous leur formes réduites sont égaux et False sinon
+        RAISES :
+            - WrongTypeError si other est différent de int, float ou une Fraction
+        """
+        if self is other:
+            return True
+        if type(other) is Fraction:
+            # Une génération de pool n'a jamais deux instances vivantes de même valeur
+            generation = self._interned_by
+            if generation is not None and generation is other._interned_by:
+                return False
+        other = self._coerce(other)
+        return (self.numerator == other.numerator and
+                self.denominator == other.denominator)
+
+    def __lt__(self, other):
+        """Overloading of the < operator for fractions
+
+        PRE : -
+        POST :
+            - renvoie True si self est strictement plus petite que other (produit en croix exact)
+        RAISES :
+            - WrongTypeError si other est différent de int, float ou une Fraction
+        """
+        other = self._coerce(other)
+        return self.numerator * other.denominator < other.numerator * self.denominator
+
+    def __le__(self, other):
+        """Overloading of the <= operator for fractions
+
+        PRE : -
+        POST :
+            - renvoie True si self est plus petite ou égale à other
+        RAISES :
+            - WrongTypeError si other est différent de int, float ou une Fraction
+        """
+        other = self._coerce(other)
+        return self.numerator * other.denominator <= other.numerator * self.denominator
+
+    def __gt__(self, other):
+        """Overloading of the > operator for fractions
+
+        PRE : -
+        POST :
+            - renvoie True si self est strictement plus grande que other
+        RAISES :
+            - WrongTypeError si other est différent de int, float ou une Fraction
+        """
+        other = self._coerce(other)
+        return self.numerator * other.denominator > other.numerator * self.denominator
+
+    def __ge__(self, other):
+        """Overloading of the >= operator for fractions
+
+        PRE : -
+        POST :
+            - renvoie True si self est plus grande ou égale à other
+        RAISES :
+            - WrongTypeError si other est différent de int, float ou une Fraction
+        """
+        other = self._coerce(other)
+        return self.numerator * other.denominator >= other.numerator * self.denominator
+
+    def __float__(self):
+        """Returns the decimal value of the fraction
+
+        PRE : -
+        POST : renvoie le float le plus proche de numerator / denominator quelle que soit la taille
+               des entiers, +/- inf si la valeur dépasse le plus grand float et 0.0 si elle est plus
+               petite que le plus petit float positif
+        """
+        return self._to_float(self.numerator, self.denominator)
+
+    # ------------------ Integer parts and remainders ------------------
+
+    def __floor__(self):
+        """Return the largest integer lower than or equal to the fraction (math.floor)
+
+        PRE : -
+        POST : renvoie l'entier exact numerator // denominator
+        """
+        return self.numerator // self.denominator
+
+    def __ceil__(self):
+        """Return the smallest integer greater than or equal to the fraction (math.ceil)
+
+        PRE : -
+        POST : renvoie l'entier exact -(-numerator // denominator)
+        """
+        return -(-self.numerator // self.denominator)
+
+    def __trunc__(self):
+        """Return the integer part of the fraction, rounded towards zero (math.trunc)
+
+        PRE : -
+        POST : renvoie l'entier exact de même signe que la fraction et de valeur absolue inférieure
+        """
+        num = self.numerator
+        return num // self.denominator if num >= 0 else -(-num // self.denominator)
+
+    def __round__(self, ndigits=None):
+        """Round the fraction half to even (round)
+
+        PRE : ndigits est None ou un entier
+        POST :
+            - sans ndigits, renvoie l'entier le plus proche (à égale distance, l'entier pair)
+            - avec ndigits, renvoie la Fraction multiple de 10**-ndigits la plus proche
+              (ndigits peut être négatif : arrondi à la dizaine, la centaine, ...)
+        RAISE :
+            - TypeError si ndigits n'est pas un entier
+        """
+        if ndigits is None:
+            return self._round_half_even(self.numerator, self.denominator)
+        if not isinstance(ndigits, int):
+            raise TypeError(f"{ndigits} n'est pas un entier")
+        shift = 10 ** abs(ndigits)
+        if ndigits >= 0:
+            return Fraction(self._round_half_even(self.numerator * shift, self.denominator), shift)
+        return Fraction(self._round_half_even(self.numerator, self.denominator * shift) * shift, 1)
+
+    def __floordiv__(self, other):
+        """Overloading of the // operator for fractions
+
+        PRE : -
+        POST : renvoie l'entier exact floor(self / other)
+        RAISE :
+            - WrongTypeError si other n'est pas d'un type numérique accepté
+            - DenominatorIsZero si other vaut zero
+        """
+        dividend, divisor = self._divmod_terms(self, self._coerce(other))
+        return dividend // divisor
+
+    def __mod__(self, other):
+        """Overloading of the % operator for fractions
+
+        PRE : -
+        POST : renvoie le reste self - other * (self // other), du signe de other, de type Fraction
+        RAISE :
+            - WrongTypeError si other n'est pas d'un type numérique accepté
+            - DenominatorIsZero si other vaut zero
+        """
+        return self.__divmod__(other)[1]
+
+    def __divmod__(self, other):
+        """Overloading of divmod() for fractions
+
+        PRE : -
+        POST : renvoie le couple (self // other, self % other) : un entier et une Fraction
+        RAISE :
+            - WrongTypeError si other n'est pas d'un type numérique accepté
+            - DenominatorIsZero si other vaut zero
+        """
+        other = self._coerce(other)
+        dividend, divisor = self._divmod_terms(self, other)
+        quotient, remainder = divmod(dividend, divisor)
+        return quotient, Fraction(remainder, self.denominator * other.denominator)
+
+    def __rfloordiv__(self, other):
+        other = self._coerce(other)
+        dividend, divisor = self._divmod_terms(other, self)
+        return dividend // divisor
+
+    def __rmod__(self, other):
+        return self._coerce(other).__divmod__(self)[1]
+
+    def __rdivmod__(self, other):
+        return self._coerce(other).__divmod__(self)
+
+    # ------------------ Conversions with the standard library ------------------
+
+    @staticmethod
+    def from_std_fraction(value):
+        """Build a fraction from a fractions.Fraction without going through a string
+
+        PRE : value est une instance de fractions.Fraction
+        POST : renvoie la Fraction de même valeur (déjà réduite, pgcd non recalculé)
+        """
+        return Fraction._from_reduced(value.numerator, value.denominator)
+
+    def to_std_fraction(self):
+        """Return the fraction as a fractions.Fraction
+
+        PRE : -
+        POST : renvoie la fractions.Fraction de même valeur
+        """
+        import fractions
+        return fractions.Fraction(self.numerator, self.denominator)
+
+    @staticmethod
+    def from_decimal(value):
+        """Build a fraction from a decimal.Decimal exactly
+
+        PRE : value est un Decimal fini
+        POST : renvoie la Fraction de même valeur exacte (0.1 donne 1/10)
+        RAISE :
+            - ValueError si value est NaN
+            - OverflowError si value est infini
+        """
+        num, den = value.as_integer_ratio()
+        return Fraction._from_reduced(num, den)
+
+    def to_decimal(self, context=None):
+        """Return the fraction as a decimal.Decimal rounded with the given context
+
+        PRE : context est un decimal.Context ou None (contexte courant)
+        POST : renvoie numerator / denominator arrondi à la précision du contexte
+        """
+        import decimal
+        if context is None:
+            context = decimal.getcontext()
+        return context.divide(decimal.Decimal(self.numerator), decimal.Decimal(self.denominator))
+
+    # ------------------ Integer accumulation ------------------
+
+    @staticmethod
+    def _partial_sums(pairs, num=0, den=1):
+        """Generate the unreduced running sums of num/den and the (n, d) pairs (d > 0), over the LCM so far.
+
+        Le dénominateur courant reste le ppcm des dénominateurs rencontrés : une valeur dont le
+        dénominateur le divise ne coûte qu'une multiplication et une addition d'entiers. Les
+        couples générés ne sont pas réduits (voir _from_pair).
+
+        PRE : pairs est un itérable de couples d'entiers (n, d) avec d > 0, den > 0
+        POST : génère, après chaque couple, le couple (num, den) de la somme courante,
+               den étant un multiple du ppcm des dénominateurs
+        """
+        gcd = math.gcd
+        for n, d in pairs:
+            if d == den:
+                num += n
+            else:
+                g = gcd(den, d)
+                if g == d:
+                    num += n * (den // d)
+                else:
+                    num, den = num * (d // g) + n * (den // g), den // g * d
+            yield num, den
+
+    @staticmethod
+    def _accumulate(pairs, num=0, den=1):
+        """Return the unreduced (num, den) sum of num/den and the (n, d) pairs (see _partial_sums)."""
+        for num, den in Fraction._partial_sums(pairs, num, den):
+            pass
+        return num, den
+
+    @staticmethod
+    def _from_pair(num, den):
+        """Return the reduced Fraction num/den, for num/den of any sign with den != 0."""
+        if den < 0:
+            num, den = -num, -den
+        g = math.gcd(num, den)
+        return Fraction._from_reduced(num // g, den // g)
+
+    # ------------------ Linear combinations ------------------
+
+    @staticmethod
+    def linear_combination(pairs):
+        """Return the exact sum of coefficient * value over (coefficient, value) pairs
+
+        Chaque produit est formé sur les numérateurs et dénominateurs bruts des deux facteurs,
+        sans Fraction intermédiaire, et rangé avec les produits de même dénominateur ; les
+        groupes sont ensuite réunis par _accumulate et le résultat réduit une seule fois.
+
+        PRE : pairs est un itérable (éventuellement un générateur) de couples de Fraction,
+              int, float ou scalaires numériques acceptés par Fraction
+        POST : renvoie la somme exacte sous forme de Fraction réduite (0 pour un itérable vide)
+        RAISE :
+            - WrongTypeError si un coefficient ou une valeur n'est pas d'un type accepté
+        """
+        coerce = Fraction._coerce
+        by_denominator = {}
+        get = by_denominator.get
+        for weight, value in pairs:
+            if type(weight) is int:
+                wn, wd = weight, 1
+            else:
+                weight = coerce(weight)
+                wn, wd = weight.__numerator, weight.__denominator
+            if type(value) is int:
+                xn, xd = value, 1
+            else:
+                value = coerce(value)
+                xn, xd = value.__numerator, value.__denominator
+            den = wd * xd
+            by_denominator[den] = get(den, 0) + wn * xn
+
+        return Fraction._from_pair(*Fraction._accumulate((n, d) for d, n in by_denominator.items()))
+
+    @staticmethod
+    def dot(weights, values):
+        """Return the exact dot product sum(w * x) of two sequences
+
+        Voir linear_combination. Les tableaux NumPy sont convertis d'un bloc (tolist) en
+        entiers ou floats Python au lieu d'être lus scalaire par scalaire.
+
+        PRE : weights et values sont des itérables (listes, générateurs, tableaux NumPy, ...)
+              de même longueur de Fraction, int, float ou scalaires numériques
+        POST : renvoie le produit scalaire exact sous forme de Fraction réduite
+        RAISE :
+            - ValueError si les longueurs diffèrent
+            - WrongTypeError si une valeur n'est pas d'un type accepté
+        """
+        return Fraction.linear_combination(Fraction._paired(Fraction._bulk(weights), Fraction._bulk(values)))
+
+    @staticmethod
+    def _bulk(values):
+        # Conversion en liste Python (en C) des tableaux NumPy
+        if type(values).__module__ == "numpy" and hasattr(values, "tolist"):
+            return values.tolist()
+        return values
+
+    # ------------------ Running totals ------------------
+
+    @staticmethod
+    def cumsum(values):
+        """Generate the running sums of values, lazily
+
+        La somme courante est tenue sur le ppcm des dénominateurs rencontrés, mis à jour de
+        proche en proche : une valeur dont le dénominateur divise ce ppcm ne coûte qu'une
+        multiplication et une addition d'entiers. Chaque somme est réduite par un seul pgcd,
+        au moment où elle est produite.
+
+        PRE : values est un itérable (éventuellement un générateur ou un tableau NumPy) de
+              Fraction, int, float ou scalaires numériques acceptés par Fraction
+        POST : génère les Fraction réduites v0, v0 + v1, v0 + v1 + v2, ...
+        RAISE :
+            - WrongTypeError si une valeur n'est pas d'un type accepté (quand elle est lue)
+        """
+        return Fraction._running_sums(Fraction._ratios(values))
+
+    @staticmethod
+    def cumprod(values):
+        """Generate the running products of values, lazily
+
+        Le produit courant reste réduit : les facteurs communs sont simplifiés en croix
+        (numérateur de la valeur avec le dénominateur courant, et inversement) avant la
+        multiplication, sur des entiers plus petits que le produit.
+
+        PRE : values est un itérable (éventuellement un générateur ou un tableau NumPy) de
+              Fraction, int, float ou scalaires numériques acceptés par Fraction
+        POST : génère les Fraction réduites v0, v0 * v1, v0 * v1 * v2, ...
+        RAISE :
+            - WrongTypeError si une valeur n'est pas d'un type accepté (quand elle est lue)
+        """
+        return Fraction._running_products(Fraction._ratios(values))
+
+    @staticmethod
+    def _ratios(values):
+        """Generate the reduced (numerator, denominator) pair of every value."""
+        coerce = Fraction._coerce
+        for value in Fraction._bulk(values):
+            if type(value) is int:
+                yield value, 1
+            else:
+                value = coerce(value)
+                yield value.__numerator, value.__denominator
+
+    @staticmethod
+    def _running_sums(pairs, num=0, den=1):
+        """Generate the reduced running sums of (num, den) pairs, starting from num/den (den > 0)."""
+        gcd, build = math.gcd, Fraction._from_reduced
+        for num, den in Fraction._partial_sums(pairs, num, den):
+            g = gcd(num, den)
+            yield build(num // g, den // g)
+
+    @staticmethod
+    def _running_products(pairs, num=1, den=1):
+        """Generate the reduced running products of (num, den) pairs, starting from the reduced num/den."""
+        gcd, build = math.gcd, Fraction._from_reduced
+        for n, d in pairs:
+            g1, g2 = gcd(n, den), gcd(num, d)
+            num, den = (num // g2) * (n // g1), (den // g1) * (d // g2)
+            if num == 0:
+                den = 1
+            yield build(num, den)
+
+    @staticmethod
+    def _paired(weights, values):
+        """Generate the pairs of two iterables, raising ValueError if their lengths differ."""
+        for pair in zip_longest(weights, values, fillvalue=_MISSING):
+            if pair[0] is _MISSING or pair[1] is _MISSING:
+                raise ValueError("Les deux listes d'opérandes doivent avoir la même longueur")
+            yield pair
+
+    # ------------------ Properties checking  ------------------
+
+    def is_zero(self):
+        """Check if a fraction's value is 0
+
+        PRE : -
+        POST : renvoie un booleen True si le numérateur vaut 0 et False sinon
+        """
+        return self.numerator == 0
+
+    def is_integer(self):
+        """Check if a fraction is integer (ex : 8/4, 3, 2/2, ...)
+
+        PRE : -
+        POST : renvoie un boleen True si le denominateur vaut 1 et False sinon
+        """
+        return self.denominator == 1
+
+    def is_proper(self):
+        """Check if the absolute value of the fraction is < 1
+
+        PRE : -
+        POST : renvoie un booleen True si la fraction est propre et False sinon
+        """
+        return abs(self.numerator) < abs(self.denominator)
+
+    def is_unit(self):
+        """Check if a fraction's numerator is 1 in its reduced form
+
+        PRE :   -
+        POST :  renvoie True si le numérateur vaut 1 sous sa forme réduite et False sinon
+        """
+        return abs(self.numerator) == 1
+
+    def is_adjacent_to(self, other):
+        """Check if two fractions differ by a unit fraction.
+
+        PRE :
+        POST :
+            - Renvoie True si |self - other| = 1/(n) pour un entier n > 0
+        """
+
+        other = self._coerce(other)
+
+        diff = self - other  # Différence entre les deux fractions
+        return diff.is_unit()
+
+    # ------------------ Continued fractions ------------------
+
+    def to_continued_fraction(self):
+        """Return the terms of the continued fraction expansion of the fraction
+
+        PRE : -
+        POST :
+            - renvoie la liste [a0, a1, ..., an] telle que fraction = a0 + 1/(a1 + 1/(... + 1/an))
+              avec a1, ..., an > 0 (a0 peut être négatif ou nul)
+        """
+        return list(self._continued_fraction_terms(self.numerator, self.denominator))
+
+    @staticmethod
+    def from_continued_fraction(terms):
+        """Build a fraction from the terms of its continued fraction expansion
+
+        PRE : terms est une séquence non vide d'entiers, tous > 0 sauf éventuellement le premier
+        POST :
+            - renvoie la Fraction a0 + 1/(a1 + 1/(... + 1/an))
+        RAISE :
+            - TypeError si un des termes n'est pas un entier
+            - ValueError si terms est vide ou si un terme autre que le premier est <= 0
+        """
+        num, den = None, None
+        for num, den in Fraction._convergent_pairs(terms):
+            pass
+        if num is None:
+            raise ValueError("Une fraction continue doit contenir au moins un terme")
+        return Fraction._from_reduced(num, den)
+
+    def convergents(self, semiconvergents=False):
+        """Generate the convergents of the fraction, in order, ending with the fraction itself
+
+        Chaque étape coûte O(1) opérations sur des grands entiers (une division euclidienne
+        et deux multiplications-additions), sans calcul de pgcd : les réduites sont déjà réduites.
+
+        PRE : -
+        POST :
+            - génère les réduites successives h_n/k_n du développement en fraction continue
+            - si semiconvergents est vrai, génère aussi avant chaque réduite h_n/k_n les
+              fractions intermédiaires (m*h_(n-1) + h_(n-2))/(m*k_(n-1) + k_(n-2)) pour 0 < m < a_n
+        """
+        h_prev, k_prev, h, k = 0, 1, 1, 0
+        for a in self._continued_fraction_terms(self.numerator, self.denominator):
+            if semiconvergents and k != 0:
+                for m in range(1, a):
+                    yield Fraction._from_reduced(m * h + h_prev, m * k + k_prev)
+            h_prev, k_prev, h, k = h, k, a * h + h_prev, a * k + k_prev
+            yield Fraction._from_reduced(h, k)
+
+    def limit_denominator(self, max_denominator):
+        """Return the closest fraction whose denominator is at most max_denominator
+
+        PRE : max_denominator est un entier >= 1
+        POST :
+            - renvoie la meilleure approximation de la fraction de dénominateur <= max_denominator
+        RAISE :
+            - TypeError si max_denominator n'est pas un entier
+            - ValueError si max_denominator < 1
+        """
+        if not isinstance(max_denominator, int) or isinstance(max_denominator, bool):
+            raise TypeError(f"{max_denominator} n'est pas un entier")
+        if max_denominator < 1:
+            raise ValueError("Le dénominateur maximal doit être >= 1")
+        if self.denominator <= max_denominator:
+            return self
+
+        num, den = self.numerator, self.denominator
+        h_prev, k_prev, h, k = 0, 1, 1, 0
+        for a in self._continued_fraction_terms(num, den):
+            if a * k + k_prev > max_denominator:
+                break
+            h_prev, k_prev, h, k = h, k, a * h + h_prev, a * k + k_prev
+
+        # Meilleure semi-réduite entre h_prev/k_prev et la réduite suivante
+        m = (max_denominator - k_prev) // k
+        h_semi, k_semi = m * h + h_prev, m * k + k_prev
+        if abs(h * den - num * k) * k_semi <= abs(h_semi * den - num * k_semi) * k:
+            return Fraction._from_reduced(h, k)
+        return Fraction._from_reduced(h_semi, k_semi)
+
+    def compare(self, other):
+        """Compare two fractions by expanding them lazily as continued fractions
+
+        Les développements sont calculés terme à terme et la comparaison s'arrête dès le
+        premier terme différent, ce qui évite les produits croisés sur de très grands entiers.
+
+        PRE : -
+        POST :
+            - renvoie -1 si self < other, 0 si self == other et 1 si self > other
+        RAISE :
+            - WrongTypeError si other est différent de int, float ou une Fraction
+        """
+        other = self._coerce(other)
+
+        # Un développement terminé se comporte comme un terme infini
+        left = self._continued_fraction_terms(self.numerator, self.denominator)
+        right = self._continued_fraction_terms(other.numerator, other.denominator)
+        index = 0
+        while True:
+            a, b = next(left, None), next(right, None)
+            if a is None and b is None:
+                return 0
+            if a != b:
+                if a is None:
+                    bigger = True
+                elif b is None:
+                    bigger = False
+                else:
+                    bigger = a > b
+                # Aux rangs impairs, un terme plus grand donne une fraction plus petite
+                return 1 if bigger == (index % 2 == 0) else -1
+            index += 1
+
+    # ------------------------------------------------------Ajouts personnel pour me simplifier la tache------------------------------------------------------------------
+
+    @staticmethod
+    def pgcd(a, b):
+        while b != 0:
+            a, b = b, a % b
+        return a
+
+    @staticmethod
+    def _from_reduced(num, den):
+        """Build a fraction already known to be reduced with den > 0, without calling pgcd."""
+        fraction = object.__new__(Fraction)
+        fraction.__numerator = num
+        fraction.__denominator = den
+        return fraction
+
+    @staticmethod
+    def _round_half_even(num, den):
+        """Return num / den rounded to the nearest integer, half to even (den > 0)."""
+        quotient, remainder = divmod(num, den)
+        twice = 2 * remainder
+        if twice > den or (twice == den and quotient % 2 == 1):
+            quotient += 1
+        return quotient
+
+    @staticmethod
+    def _divmod_terms(left, right):
+        """Return integers (a, b) with left / right == a / b, for an exact integer division.
+
+        a/b // c/d == (a * d) // (b * c), et le reste vaut ((a * d) % (b * c)) / (b * d).
+        """
+        if right.numerator == 0:
+            raise DenominatorIsZero("Division par une fraction nulle")
+        return left.numerator * right.denominator, left.denominator * right.numerator
+
+    @staticmethod
+    def _to_float(num, den):
+        """Return the correctly rounded float of num / den, saturating to +/- inf.
+
+        La division entière vraie de Python décale déjà les deux entiers pour n'en garder que
+        les bits utiles : le résultat est correctement arrondi même quand num et den dépassent
+        les floats. Elle ne lève OverflowError que si le quotient lui-même est trop grand.
+        """
+        try:
+            return num / den
+        except OverflowError:
+            return float("inf") if (num > 0) == (den > 0) else float("-inf")
+
+    @staticmethod
+    def _continued_fraction_terms(num, den):
+        """Generate lazily the continued fraction terms of num/den (den > 0)."""
+        while den != 0:
+            a, rest = divmod(num, den)
+            yield a
+            num, den = den, rest
+
+    @staticmethod
+    def _convergent_pairs(terms):
+        """Generate the (h, k) convergents of a sequence of continued fraction terms."""
+        h_prev, k_prev, h, k = 0, 1, 1, 0
+        for index, a in enumerate(terms):
+            if not isinstance(a, int) or isinstance(a, bool):
+                raise TypeError(f"{a} n'est pas un entier")
+            if index > 0 and a <= 0:
+                raise ValueError("Les termes d'une fraction continue (sauf le premier) doivent être > 0")
+            h_prev, k_prev, h, k = h, k, a * h + h_prev, a * k + k_prev
+            yield h, k
+
+    @staticmethod
+    def _identity(value):
+        return value
+
+    @staticmethod
+    def _from_int(value):
+        return Fraction._from_reduced(value, 1)
+
+    @staticmethod
+    def _from_index(value):
+        # Sous-classes d'int et entiers étrangers (scalaires entiers NumPy, ...)
+        return Fraction._from_reduced(value.__index__(), 1)
+
+    @staticmethod
+    def _from_float(value):
+        # Passage par l'écriture décimale la plus courte du float (repr), lue sur des entiers :
+        # 0.1 donne 1/10, 0.29 donne 29/100 et 1e-05 donne 1/100000
+        if not math.isfinite(value):
+            if value != value:
+                raise ValueError(f"{value} ne peut pas être converti en Fraction")
+            raise OverflowError(f"{value} ne peut pas être converti en Fraction")
+        mantissa, _, exponent = float.__repr__(value).partition("e")
+        whole, _, decimals = mantissa.partition(".")
+        exponent = int(exponent or 0) - len(decimals)
+        num = int(whole + decimals)
+        if exponent >= 0:
+            return Fraction(num * 10 ** exponent, 1)
+        return Fraction(num, 10 ** -exponent)
+
+    @staticmethod
+    def _from_float_like(value):
+        # Scalaires flottants NumPy qui ne dérivent pas de float (float16, float32, ...)
+        return Fraction._from_float(float(value))
+
+    @staticmethod
+    def _from_small_fraction(value):
+        return value.to_fraction()
+
+    @staticmethod
+    def _resolve_coercion(kind):
+        """Return the routine converting instances of kind into Fraction, or None if kind is rejected.
+
+        Les booléens (bool et numpy.bool_) sont refusés comme l'a toujours fait
+        convert_to_fraction. Les types des modules fractions, decimal et small_fraction ne
+        sont reconnus que si ces modules sont chargés, ce qui est forcément le cas dès
+        qu'une de leurs instances existe.
+        """
+        module = getattr(kind, "__module__", "")
+        if issubclass(kind, Fraction):
+            return Fraction._identity
+        if issubclass(kind, bool) or (module == "numpy" and kind.__name__ in ("bool_", "bool")):
+            return None
+        if kind is int:
+            return Fraction._from_int
+        if issubclass(kind, float):
+            return Fraction._from_float
+        if hasattr(kind, "__index__"):
+            return Fraction._from_index
+        if module == "numpy" and ("float" in kind.__name__ or kind.__name__ == "longdouble"):
+            return Fraction._from_float_like
+        foreign = {
+            "decimal": ("Decimal", Fraction.from_decimal),
+            "fractions": ("Fraction", Fraction.from_std_fraction),
+            f"{__package__}.small_fraction": ("SmallFraction", Fraction._from_small_fraction),
+        }
+        for module_name, (type_name, routine) in foreign.items():
+            loaded = sys.modules.get(module_name)
+            if loaded is not None and issubclass(kind, getattr(loaded, type_name)):
+                return routine
+        return None
+
+    @staticmethod
+    def _coercion(kind):
+        """Return the cached coercion routine of a type, resolving it on the first call."""
+        try:
+            return Fraction._coercions[kind]
+        except KeyError:
+            routine = Fraction._coercions[kind] = Fraction._resolve_coercion(kind)
+            return routine
+
+    @staticmethod
+    def _coerce(other):
+        """Return other as a Fraction through the routine cached for its type.
+
+        PRE : -
+        POST : renvoie la Fraction équivalente à other (other lui-même si c'est une Fraction)
+        RAISE : WrongTypeError si le type de other n'est pas accepté
+        """
+        try:
+            routine = Fraction._coercions[type(other)]
+        except KeyError:
+            routine = Fraction._coercion(type(other))
+        if routine is None:
+            raise WrongTypeError(f"{other} n'est pas de type Fraction mais de type {type(other)}")
+        return routine(other)
+
+    @staticmethod
+    def is_correct(other):
+        if Fraction._coercion(type(other)) is None:
+            raise WrongTypeError(
+                f"{other} n'est pas de type Fraction mais de type {type(other)}")  # Suppression des parenthèses inutiles
+
+    @staticmethod
+    def convert_to_fraction(other):
+        """Converti un integer, un float, une fractions.Fraction, un Decimal ou une SmallFraction en une Fraction.
+        PRE :
+        POST :
+        - renvoie une instance Fraction équivalente à other
+        - si other ne peut pas etre convertit en Fraction, soulève une erreur
+        """
+        routine = Fraction._coercion(type(other))
+        if routine is None:
+            raise TypeError(f"Cannot convert {type(other)} to Fraction")
+        return routine(other)
+
+    # Ajout d'une ligne vide à la fin du fichier
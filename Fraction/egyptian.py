@@ -0,0 +1,218 @@
+import time
+from math import gcd
+
+from .core import Fraction
+from .parallel import _check_workers, _run, chunk_bounds
+
+STRATEGIES = ("greedy", "binary", "shortest")
+_DEADLINE_CHECK = 1024  # Nombre de nœuds de recherche entre deux lectures de l'horloge
+
+
+class SearchLimitError(Exception):
+    """Raised when no decomposition is found within the term-count or time limit."""
+
+
+class _Timeout(Exception):
+    pass
+
+
+def _deadline(time_limit):
+    if time_limit is None:
+        return None
+    if time_limit < 0:
+        raise ValueError("La limite de temps doit être >= 0")
+    return time.perf_counter() + time_limit
+
+
+def _check_strategy(strategy):
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Stratégie inconnue : {strategy} (attendu : {', '.join(STRATEGIES)})")
+
+
+def _check_terms(terms, max_terms):
+    if max_terms is not None and len(terms) > max_terms:
+        raise SearchLimitError(f"La décomposition demande plus de {max_terms} termes")
+
+
+def _greedy(num, den, max_terms, deadline):
+    """Fibonacci-Sylvester decomposition: take the largest unit fraction below the remainder.
+
+    Calcul sur des entiers uniquement (plafond, produit et pgcd de math) ; le nombre de
+    termes est au plus num, mais les dénominateurs peuvent croître de façon doublement
+    exponentielle.
+    """
+    terms = []
+    while num != 1:
+        if max_terms is not None and len(terms) + 1 >= max_terms:
+            raise SearchLimitError(f"La décomposition demande plus de {max_terms} termes")
+        if deadline is not None and time.perf_counter() > deadline:
+            raise SearchLimitError("Limite de temps atteinte par la méthode gloutonne")
+        c = -(-den // num)
+        terms.append(c)
+        num, den = num * c - den, den * c
+        g = gcd(num, den)
+        num //= g
+        den //= g
+    terms.append(den)
+    return terms
+
+
+def _binary(num, den):
+    """Binary remainder decomposition, with O(log den) terms all below 2 * den ** 2.
+
+    Avec 2 ** (k - 1) < den <= 2 ** k, on écrit num * 2 ** k = q * den + r : num / den vaut
+    q / 2 ** k + r / (den * 2 ** k). Chaque bit de q donne un terme 1 / 2 ** (k - j), chaque
+    bit de r un terme 1 / (den * 2 ** (k - i)) ; ces termes sont distincts car den (réduit)
+    n'est une puissance de 2 que si r est nul.
+    """
+    if num == 1:
+        return [den]
+    k = (den - 1).bit_length()
+    q, r = divmod(num << k, den)
+    terms = [1 << (k - j) for j in range(k) if q >> j & 1]
+    terms.extend(den << (k - i) for i in reversed(range(k)) if r >> i & 1)
+    terms.sort()
+    return terms
+
+
+class _Search:
+    """Depth-first search of decompositions with a fixed number of terms.
+
+    Les dénominateurs sont choisis croissants ; un dénominateur c est élagué si 1 / c ne
+    laisse pas de reste positif, si les termes restants (tous <= 1 / c) ne suffisent pas à
+    compléter la somme, ou s'il dépasse le plus grand dénominateur de la meilleure solution.
+    """
+
+    def __init__(self, best, deadline):
+        self.best = best
+        self.limit = best[-1]
+        self.deadline = deadline
+        self.nodes = 0
+
+    def run(self, num, den, length, limit):
+        self.limit = limit
+        self._extend(num, den, length, 1, [])
+
+    def _extend(self, num, den, left, smallest, prefix):
+        if left == 1:
+            if num == 1 and smallest <= den < self.limit:
+                self.best = prefix + [den]
+                self.limit = den
+            return
+        self.nodes += 1
+        if self.deadline is not None and self.nodes % _DEADLINE_CHECK == 0 and time.perf_counter() > self.deadline:
+            raise _Timeout
+        first = max(smallest, den // num + 1)
+        last = left * den // num
+        if left == 2:
+            # 1 / a + 1 / b = num / den donne b = a * den / (num * a - den) : pas de récursion
+            for a in range(first, last + 1):
+                if a + 1 >= self.limit:
+                    break
+                b, rest = divmod(a * den, num * a - den)
+                if rest == 0 and a < b < self.limit:
+                    self.best = prefix + [a, b]
+                    self.limit = b
+            return
+        prefix.append(0)
+        for c in range(first, last + 1):
+            if c + left - 1 >= self.limit:
+                break
+            rest_num, rest_den = num * c - den, den * c
+            g = gcd(rest_num, rest_den)
+            prefix[-1] = c
+            self._extend(rest_num // g, rest_den // g, left - 1, c + 1, prefix)
+        prefix.pop()
+
+
+def _shortest(num, den, max_terms, deadline):
+    """Return the decomposition with fewest terms, then with the smallest largest denominator.
+
+    La recherche part de la décomposition binaire (toujours valide) et essaie les longueurs
+    croissantes : à chaque longueur, toute solution l'emporte sur une solution plus longue,
+    puis la borne sur le plus grand dénominateur se resserre à chaque solution trouvée. Si la
+    limite de temps est atteinte, la meilleure solution trouvée est renvoyée.
+    """
+    search = _Search(_binary(num, den), deadline)
+    longest = len(search.best) if max_terms is None else min(max_terms, len(search.best))
+    try:
+        for length in range(1, longest + 1):
+            search.run(num, den, length, search.best[-1] if len(search.best) <= length else float("inf"))
+            if len(search.best) <= length:
+                break
+    except _Timeout:
+        pass
+    return search.best
+
+
+def egyptian_fractions(value, strategy="binary", max_terms=None, time_limit=None):
+    """Decompose a fraction into a sum of distinct unit fractions.
+
+    Stratégies :
+        - "greedy" : méthode gloutonne de Fibonacci-Sylvester (au plus num termes, dénominateurs
+          pouvant devenir gigantesques) ;
+        - "binary" : méthode du reste binaire (O(log den) termes, dénominateurs < 2 * den ** 2) ;
+        - "shortest" : recherche élaguée du moins de termes possible puis, à nombre de termes
+          égal, du plus petit dénominateur maximal ; si la limite de temps est atteinte, la
+          meilleure solution trouvée est renvoyée (au pire la décomposition binaire).
+
+    PRE : value est une Fraction, un int ou un float, avec 0 < value <= 1 ;
+          max_terms est None ou un entier >= 1, time_limit est None ou une durée en secondes
+    POST : renvoie la liste des fractions unitaires 1 / c, par dénominateurs strictement croissants,
+           dont la somme vaut value
+    RAISE :
+        - ValueError si value n'est pas dans ]0, 1] ou si la stratégie est inconnue
+        - SearchLimitError si aucune décomposition ne respecte max_terms, ou si la méthode
+          gloutonne dépasse la limite de temps
+        - WrongTypeError si value est différent de int, float ou une Fraction
+    """
+    return [Fraction._from_reduced(1, c) for c in _denominators(Fraction._coerce(value), strategy, max_terms,
+                                                                _deadline(time_limit))]
+
+
+def _denominators(value, strategy, max_terms, deadline):
+    num, den = value.numerator, value.denominator
+    if not 0 < num <= den:
+        raise ValueError(f"{value} doit être strictement positive et au plus égale à 1")
+    if strategy == "greedy":
+        return _greedy(num, den, max_terms, deadline)
+    if strategy == "binary":
+        terms = _binary(num, den)
+    elif strategy == "shortest":
+        terms = _shortest(num, den, max_terms, deadline)
+    else:
+        _check_strategy(strategy)
+    _check_terms(terms, max_terms)
+    return terms
+
+
+def egyptian_fractions_all(values, strategy="binary", max_terms=None, time_limit=None, workers=None):
+    """Decompose every value into distinct unit fractions.
+
+    Les valeurs égales ne sont décomposées qu'une fois ; time_limit s'applique à chaque valeur.
+
+    PRE : values est un itérable de Fraction, int ou float dans ]0, 1]
+    POST : renvoie la liste des décompositions, dans l'ordre des valeurs (voir egyptian_fractions)
+    RAISE :
+        - ValueError si une valeur n'est pas dans ]0, 1], si la stratégie est inconnue
+          ou si workers n'est pas un entier >= 1
+        - SearchLimitError si une valeur ne respecte pas les limites
+        - WrongTypeError si une valeur est différente de int, float ou une Fraction
+    """
+    _check_strategy(strategy)
+    workers = _check_workers(workers)
+    keys = [(f.numerator, f.denominator) for f in map(Fraction._coerce, values)]
+    unique = list(dict.fromkeys(keys))
+
+    def kernel(bounds):
+        start, stop = bounds
+        return [_denominators(Fraction._from_reduced(num, den), strategy, max_terms, _deadline(time_limit))
+                for num, den in unique[start:stop]]
+
+    chunks = chunk_bounds(len(unique), workers)
+    decompositions = {}
+    for (start, stop), chunk in zip(chunks, _run(kernel, chunks, workers)):
+        decompositions.update(zip(unique[start:stop], chunk))
+    unit = Fraction._from_reduced
+    return [[unit(1, c) for c in decompositions[key]] for key in keys]
+
@@ -0,0 +1,283 @@
+from functools import cmp_to_key
+
+from .core import Fraction
+
+
+def farey_pairs(n):
+    """Generate the terms of the Farey sequence of order n as (numerator, denominator) pairs.
+
+    Chaque terme est déduit des deux précédents (a/b, c/d) par la relation
+    k = (n + b) // d, terme suivant = (k*c - a) / (k*d - b), soit O(1) par terme.
+
+    PRE : n est un entier >= 1
+    POST :
+        - génère les couples (num, den) réduits de 0/1 à 1/1 dans l'ordre croissant
+    RAISE :
+        - TypeError si n n'est pas un entier
+        - ValueError si n < 1
+    """
+    if not isinstance(n, int) or isinstance(n, bool):
+        raise TypeError(f"{n} n'est pas un entier")
+    if n < 1:
+        raise ValueError("L'ordre d'une suite de Farey doit être >= 1")
+
+    a, b, c, d = 0, 1, 1, n
+    yield a, b
+    while c <= n:
+        k = (n + b) // d
+        a, b, c, d = c, d, k * c - a, k * d - b
+        yield a, b
+
+
+def farey_sequence(n):
+    """Generate the terms of the Farey sequence of order n as Fraction instances.
+
+    PRE : n est un entier >= 1
+    POST :
+        - génère les fractions de 0 à 1 de dénominateur <= n dans l'ordre croissant
+    """
+    build = Fraction._from_reduced  # Les termes de Farey sont déjà réduits : pas de pgcd
+    for num, den in farey_pairs(n):
+        yield build(num, den)
+
+
+def _divisors(n):
+    """Return the sorted positive divisors of n (n > 0) by trial division."""
+    small, large = [], []
+    i = 1
+    while i * i <= n:
+        if n % i == 0:
+            small.append(i)
+            if i * i != n:
+                large.append(n // i)
+        i += 1
+    return small + large[::-1]
+
+
+class AdjacencyIndex:
+    """Index of fractions grouped by denominator for bulk adjacency queries
+
+    Deux fractions réduites a/b et c/d sont adjacentes (au sens de Fraction.is_adjacent_to)
+    si |a/b - c/d| est une fraction unité. En posant g = pgcd(b, d), b = g*b' et d = g*d',
+    cela revient à : a*d' - c*b' est un diviseur non nul (au signe près) de g.
+    Pour une requête a/b, il suffit donc, pour chaque dénominateur d présent dans l'index,
+    de tester au plus 2 * (nombre de diviseurs de b) numérateurs candidats.
+    Une requête coûte O(D * div(b)) où D est le nombre de dénominateurs distincts,
+    indépendamment du nombre N de fractions stockées.
+    """
+
+    def __init__(self, fractions=()):
+        """Build an index, optionally filled with some fractions.
+
+        PRE : fractions est un itérable de Fraction, int ou float
+        POST : crée un index contenant les fractions données
+        """
+        self.__buckets = {}
+        self.__divisors = {}
+        self.__size = 0
+        for f in fractions:
+            self.add(f)
+
+    def __len__(self):
+        return self.__size
+
+    def __contains__(self, other):
+        other = Fraction._coerce(other)
+        return other.numerator in self.__buckets.get(other.denominator, ())
+
+    def __iter__(self):
+        """Iterate over the stored fractions, grouped by increasing denominator."""
+        build = Fraction._from_reduced  # L'index ne contient que des couples réduits
+        for den in sorted(self.__buckets):
+            for num in sorted(self.__buckets[den]):
+                yield build(num, den)
+
+    def add(self, other):
+        """Add a fraction to the index.
+
+        PRE : -
+        POST : other est présent dans l'index (sans doublon)
+        RAISE :
+            - WrongTypeError si other est différent de int, float ou une Fraction
+        """
+        other = Fraction._coerce(other)
+        bucket = self.__buckets.setdefault(other.denominator, set())
+        if other.numerator not in bucket:
+            bucket.add(other.numerator)
+            self.__size += 1
+
+    def discard(self, other):
+        """Remove a fraction from the index if it is present.
+
+        PRE : -
+        POST : other n'est plus présent dans l'index
+        RAISE :
+            - WrongTypeError si other est différent de int, float ou une Fraction
+        """
+        other = Fraction._coerce(other)
+        bucket = self.__buckets.get(other.denominator)
+        if bucket is not None and other.numerator in bucket:
+            bucket.remove(other.numerator)
+            self.__size -= 1
+            if not bucket:
+                del self.__buckets[other.denominator]
+
+    def neighbours(self, other):
+        """Return the stored fractions adjacent to other.
+
+        PRE : -
+        POST :
+            - renvoie la liste triée des fractions x de l'index telles que other.is_adjacent_to(x)
+        RAISE :
+            - WrongTypeError si other est différent de int, float ou une Fraction
+        """
+        other = Fraction._coerce(other)
+        pairs = sorted(self.__neighbour_pairs(other.numerator, other.denominator),
+                       key=cmp_to_key(lambda p, q: p[0] * q[1] - q[0] * p[1]))
+        return [Fraction._from_reduced(num, den) for num, den in pairs]
+
+    def adjacent_pairs(self):
+        """Generate every unordered pair of adjacent fractions stored in the index.
+
+        PRE : -
+        POST :
+            - génère chaque couple (x, y) de fractions adjacentes une seule fois, avec x < y
+        """
+        build = Fraction._from_reduced
+        for den in sorted(self.__buckets):
+            for num in sorted(self.__buckets[den]):
+                for c, d in self.__neighbour_pairs(num, den):
+                    if num * d < c * den:
+                        yield build(num, den), build(c, d)
+
+    # ------------------ Helpers ------------------
+
+    def __neighbour_pairs(self, a, b):
+        """Return the (num, den) pairs of the index adjacent to the reduced fraction a/b."""
+        divs = self.__divisors.get(b)
+        if divs is None:
+            divs = self.__divisors[b] = _divisors(b)
+
+        found = []
+        for d, bucket in self.__buckets.items():
+            g = Fraction.pgcd(b, d)
+            b_prime, d_prime = b // g, d // g
+            base = a * d_prime
+            for m in divs:
+                if m > g:
+                    break
+                if g % m != 0:
+                    continue
+                for diff in (m, -m):
+                    c, rest = divmod(base - diff, b_prime)
+                    if rest == 0 and c in bucket:
+                        found.append((c, d))
+        return found
+
+
+# ------------------ Simplest fraction in an interval ------------------
+
+def _check_inclusive(inclusive):
+    if not isinstance(inclusive, (tuple, list)) or len(inclusive) != 2:
+        raise ValueError(f"inclusive doit être un couple (inclure_lo, inclure_hi) et non {inclusive!r}")
+    return bool(inclusive[0]), bool(inclusive[1])
+
+
+def _pair(value):
+    """Return the reduced (numerator, denominator) of value, without building a Fraction for Fraction and int.
+
+    Les autres types passent par Fraction._coerce : un float est lu par son écriture décimale,
+    comme partout ailleurs (0.3 est la borne 3/10).
+    """
+    kind = type(value)
+    if kind is Fraction:
+        return value.numerator, value.denominator
+    if kind is int:
+        return value, 1
+    value = Fraction._coerce(value)
+    return value.numerator, value.denominator
+
+
+def _simplest_positive(a, b, c, d, lo_closed, hi_closed):
+    """Return the (num, den) pair of the simplest fraction between a/b >= 0 and c/d (d == 0 : +infini).
+
+    Descente dans l'arbre de Stern-Brocot par fractions continues : si l'intervalle contient
+    un entier, le plus petit convient ; sinon, avec q = floor(a/b), x = q + 1/y où y parcourt
+    l'intervalle inverse [d/(c - q d), b/(a - q b)] (bornes et inclusions échangées). Les
+    réduites sont accumulées dans la matrice (p1 p0 / q1 q0) de déterminant ±1 : le résultat
+    est réduit sans pgcd.
+    """
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    while True:
+        q, r = divmod(a, b)
+        n = q if r == 0 and lo_closed else q + 1
+        if n * d < c or (n * d == c and hi_closed):
+            return p1 * n + p0, q1 * n + q0
+        p0, q0, p1, q1 = p1, q1, q * p1 + p0, q * q1 + q0
+        a, b, c, d = d, c - q * d, b, r
+        lo_closed, hi_closed = hi_closed, lo_closed
+
+
+def _simplest(a, b, c, d, lo_closed, hi_closed):
+    """Return the (num, den) pair of the simplest fraction between the reduced a/b and c/d."""
+    order = a * d - c * b
+    if order > 0 or (order == 0 and not (lo_closed and hi_closed)):
+        raise ValueError(f"L'intervalle entre {a}/{b} et {c}/{d} est vide")
+    if (a < 0 or a == 0 and lo_closed) and (c > 0 or c == 0 and hi_closed):
+        return 0, 1
+    if c <= 0:
+        num, den = _simplest_positive(-c, d, -a, b, hi_closed, lo_closed)
+        return -num, den
+    return _simplest_positive(a, b, c, d, lo_closed, hi_closed)
+
+
+def simplest_between(lo, hi, inclusive=(True, True)):
+    """Return the simplest fraction between lo and hi.
+
+    La fraction la plus simple est celle de plus petit dénominateur ; à dénominateur égal,
+    celle de plus petit numérateur en valeur absolue (c'est l'ancêtre commun de l'intervalle
+    dans l'arbre de Stern-Brocot). Le calcul est exact et se fait sur des entiers, en un
+    nombre d'étapes égal à la longueur du développement en fraction continue des bornes.
+
+    PRE : lo et hi sont des Fraction, int ou float avec lo <= hi ;
+          inclusive = (inclure_lo, inclure_hi) indique les bornes incluses dans l'intervalle
+          (comme SortedFractionList.irange) ; un float est lu par son écriture décimale
+    POST : renvoie la Fraction la plus simple de l'intervalle
+    RAISE :
+        - ValueError si l'intervalle est vide, si une borne est un float NaN
+          ou si inclusive n'est pas un couple
+        - OverflowError si une borne est un float infini
+        - WrongTypeError si lo ou hi est différent de int, float ou une Fraction
+    """
+    lo_closed, hi_closed = _check_inclusive(inclusive)
+    return Fraction._from_reduced(*_simplest(*_pair(lo), *_pair(hi), lo_closed, hi_closed))
+
+
+def simplest_between_all(lows, highs, inclusive=(True, True), workers=None):
+    """Return the simplest fraction of every interval [lows[i], highs[i]].
+
+    Les bornes Fraction et int sont lues sans conversion et la recherche ne manipule que
+    des entiers : une seule Fraction est construite par intervalle, pour le résultat.
+
+    PRE : lows et highs sont des itérables de même longueur de Fraction, int ou float ;
+          inclusive = (inclure_lo, inclure_hi), workers est None ou un entier >= 1
+    POST : renvoie la liste des fractions les plus simples, dans l'ordre des intervalles
+    RAISE :
+        - ValueError si un intervalle est vide, si une borne est un float NaN, si les deux listes
+          n'ont pas la même longueur, si inclusive n'est pas un couple ou si workers n'est pas
+          un entier >= 1
+        - OverflowError si une borne est un float infini
+        - WrongTypeError si une borne est différente de int, float ou une Fraction
+    """
+    from .parallel import _check_workers, _run, chunk_bounds
+
+    lo_closed, hi_closed = _check_inclusive(inclusive)
+    workers = _check_workers(workers)
+    bounds = [(*_pair(lo), *_pair(hi)) for lo, hi in Fraction._paired(lows, highs)]
+
+    def kernel(chunk):
+        start, stop = chunk
+        build, simplest = Fraction._from_reduced, _simplest
+        return [build(*simplest(a, b, c, d, lo_closed, hi_closed)) for a, b, c, d in bounds[start:stop]]
+
+    return [f for chunk in _run(kernel, chunk_bounds(len(bounds), workers), workers) for f in chunk]
@@ -0,0 +1,257 @@
+from math import gcd
+
+from .core import Fraction
+
+
+class SingularMatrixError(Exception):
+    """Exception raised when a matrix is not invertible."""
+    pass
+
+
+class FractionMatrix:
+    """Matrix of fractions with exact fraction-free linear algebra
+
+    La matrice est stockée sous la forme d'une matrice d'entiers et d'un dénominateur commun
+    positif : A = rows / denominator. Les éliminations (déterminant, rang, résolution, inverse)
+    utilisent l'algorithme de Bareiss sur les entiers : chaque division est exacte et la taille
+    des coefficients intermédiaires reste bornée par celle des mineurs de la matrice.
+    Les Fraction ne sont construites (et réduites) qu'à la sortie.
+    """
+
+    def __init__(self, rows):
+        """Build a matrix from a list of rows of Fraction, int or float.
+
+        PRE : rows est une liste non vide de lignes non vides et de même longueur
+        POST : crée la matrice dont les coefficients sont ceux de rows
+        RAISE :
+            - ValueError si rows est vide ou si les lignes n'ont pas toutes la même longueur
+            - WrongTypeError si un coefficient est différent de int, float ou une Fraction
+        """
+        if not rows or not rows[0]:
+            raise ValueError("Une matrice doit contenir au moins une ligne et une colonne")
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError("Toutes les lignes doivent avoir la même longueur")
+
+        entries = [[Fraction._coerce(value) for value in row] for row in rows]
+        den = 1
+        for row in entries:
+            for value in row:
+                den = den * value.denominator // gcd(den, value.denominator)
+        self.__rows = [[value.numerator * (den // value.denominator) for value in row] for row in entries]
+        self.__denominator = den
+
+    @staticmethod
+    def _from_integers(rows, den=1):
+        """Build a matrix rows/den from integer rows, reducing the common denominator once."""
+        if den < 0:
+            rows, den = [[-value for value in row] for row in rows], -den
+        common = den
+        for row in rows:
+            if common == 1:
+                break
+            common = gcd(common, *row)
+        if common != 1:
+            rows, den = [[value // common for value in row] for row in rows], den // common
+        matrix = FractionMatrix.__new__(FractionMatrix)
+        matrix.__rows = rows
+        matrix.__denominator = den
+        return matrix
+
+    @staticmethod
+    def identity(n):
+        """Return the n x n identity matrix.
+
+        PRE : n est un entier >= 1
+        POST : renvoie la matrice identité de taille n
+        """
+        return FractionMatrix._from_integers([[int(i == j) for j in range(n)] for i in range(n)])
+
+    # ------------------ Accessors and representations ------------------
+
+    @property
+    def shape(self):
+        return len(self.__rows), len(self.__rows[0])
+
+    def __getitem__(self, index):
+        """Return the coefficient at position (i, j) as a Fraction."""
+        i, j = index
+        return Fraction(self.__rows[i][j], self.__denominator)
+
+    def to_list(self):
+        """Return the matrix as a list of rows of Fraction.
+
+        PRE : -
+        POST : renvoie une liste de listes de Fraction réduites
+        """
+        den = self.__denominator
+        return [[Fraction(value, den) for value in row] for row in self.__rows]
+
+    def __str__(self):
+        return "\n".join("[" + ", ".join(str(value) for value in row) + "]" for row in self.to_list())
+
+    def __eq__(self, other):
+        """Overloading of the == operator for matrices
+
+        PRE : -
+        POST : renvoie True si les deux matrices ont la même taille et les mêmes coefficients
+        """
+        if not isinstance(other, FractionMatrix):
+            return NotImplemented
+        # Les deux représentations sont réduites : l'égalité est structurelle
+        return self.__denominator == other.__denominator and self.__rows == other.__rows
+
+    # ------------------ Linear algebra ------------------
+
+    def __matmul__(self, other):
+        """Overloading of the @ operator (matrix product)
+
+        PRE : -
+        POST : renvoie le produit matriciel self @ other
+        RAISE :
+            - ValueError si le nombre de colonnes de self diffère du nombre de lignes de other
+        """
+        if not isinstance(other, FractionMatrix):
+            return NotImplemented
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Tailles incompatibles : {self.shape} @ {other.shape}")
+        columns = list(zip(*other.__rows))
+        rows = [[sum(a * b for a, b in zip(row, column)) for column in columns] for row in self.__rows]
+        return FractionMatrix._from_integers(rows, self.__denominator * other.__denominator)
+
+    def determinant(self):
+        """Return the determinant of a square matrix.
+
+        PRE : -
+        POST : renvoie le déterminant sous forme de Fraction
+        RAISE :
+            - ValueError si la matrice n'est pas carrée
+        """
+        n = self.__check_square()
+        work = [row[:] for row in self.__rows]
+        sign, pivots = self._bareiss(work, n)
+        if len(pivots) < n:
+            return Fraction(0, 1)
+        return Fraction(sign * work[n - 1][n - 1], self.__denominator ** n)
+
+    def rank(self):
+        """Return the rank of the matrix.
+
+        PRE : -
+        POST : renvoie le nombre de lignes linéairement indépendantes
+        """
+        work = [row[:] for row in self.__rows]
+        return len(self._bareiss(work, len(work[0]))[1])
+
+    def inverse(self):
+        """Return the inverse of a square matrix.
+
+        PRE : -
+        POST : renvoie la matrice inverse
+        RAISE :
+            - ValueError si la matrice n'est pas carrée
+            - SingularMatrixError si la matrice n'est pas inversible
+        """
+        n = self.__check_square()
+        work = [row + [int(i == j) for j in range(n)] for i, row in enumerate(self.__rows)]
+        det, solution = self._bareiss_solve(work, n)
+        # A = N/d donc A^-1 = d * N^-1
+        return FractionMatrix._from_integers(solution, det).__scaled(self.__denominator)
+
+    def solve(self, rhs):
+        """Solve the linear system self * x = rhs.
+
+        PRE : rhs est une liste de n valeurs (Fraction, int ou float) ou une FractionMatrix à n lignes
+        POST :
+            - renvoie la liste des n Fraction solutions si rhs est une liste
+            - renvoie la FractionMatrix des solutions si rhs est une FractionMatrix
+        RAISE :
+            - ValueError si la matrice n'est pas carrée ou si rhs n'a pas n lignes
+            - SingularMatrixError si la matrice n'est pas inversible
+        """
+        n = self.__check_square()
+        as_vector = not isinstance(rhs, FractionMatrix)
+        if as_vector:
+            rhs = FractionMatrix([[value] for value in rhs])
+        if rhs.shape[0] != n:
+            raise ValueError(f"Le second membre doit avoir {n} lignes")
+
+        # (N/d) x = R/e  <=>  N (e*x) = d*R
+        scale = self.__denominator
+        work = [row + [scale * b for b in rhs_row] for row, rhs_row in zip(self.__rows, rhs.__rows)]
+        det, solution = self._bareiss_solve(work, n)
+        den = det * rhs.__denominator
+        if as_vector:
+            return [Fraction(row[0], den) for row in solution]
+        return FractionMatrix._from_integers(solution, den)
+
+    # ------------------ Helpers ------------------
+
+    def __check_square(self):
+        rows, columns = self.shape
+        if rows != columns:
+            raise ValueError(f"La matrice doit être carrée, pas {rows}x{columns}")
+        return rows
+
+    def __scaled(self, factor):
+        """Return the matrix multiplied by the integer factor."""
+        return FractionMatrix._from_integers([[factor * value for value in row] for row in self.__rows],
+                                             self.__denominator)
+
+    @staticmethod
+    def _bareiss(work, columns):
+        """Reduce in place the integer matrix work to row echelon form with Bareiss' algorithm.
+
+        Seules les `columns` premières colonnes servent de pivots. Renvoie le signe introduit
+        par les échanges de lignes et la liste des colonnes pivots. Après l'appel, le dernier
+        pivot d'une matrice carrée régulière vaut son déterminant (au signe près).
+        """
+        rows = len(work)
+        sign, previous, row, pivots = 1, 1, 0, []
+        for col in range(columns):
+            if row == rows:
+                break
+            pivot_row = next((r for r in range(row, rows) if work[r][col] != 0), None)
+            if pivot_row is None:
+                continue
+            if pivot_row != row:
+                work[row], work[pivot_row] = work[pivot_row], work[row]
+                sign = -sign
+            pivot_tail = work[row][col + 1:]
+            pivot = work[row][col]
+            for r in range(row + 1, rows):
+                line = work[r]
+                factor = line[col]
+                # Division exacte : chaque coefficient est un mineur de la matrice de départ
+                line[col:] = [0] + [(pivot * a - factor * b) // previous
+                                    for a, b in zip(line[col + 1:], pivot_tail)]
+            previous = pivot
+            pivots.append(col)
+            row += 1
+        return sign, pivots
+
+    @staticmethod
+    def _bareiss_solve(work, n):
+        """Solve the augmented integer system work = [N | B] without fractions.
+
+        Élimination de Bareiss puis remontée entière : det(N) * x est un vecteur d'entiers
+        (règle de Cramer), donc chaque division de la remontée est exacte.
+        Renvoie (det, X) où X = det * N^-1 * B est une liste de lignes d'entiers.
+        RAISE :
+            - SingularMatrixError si N n'est pas inversible
+        """
+        _, pivots = FractionMatrix._bareiss(work, n)
+        if len(pivots) < n:
+            raise SingularMatrixError("La matrice n'est pas inversible")
+        det = work[n - 1][n - 1]
+        solution = [None] * n
+        for i in range(n - 1, -1, -1):
+            line = work[i]
+            values = [det * b for b in line[n:]]
+            for j in range(i + 1, n):
+                coefficient = line[j]
+                if coefficient:
+                    values = [v - coefficient * x for v, x in zip(values, solution[j])]
+            diagonal = line[i]
+            solution[i] = [v // diagonal for v in values]
+        return det, solution
@@ -0,0 +1,183 @@
+import sys
+import threading
+from weakref import KeyedRef
+
+from .core import Fraction
+
+_install_lock = threading.Lock()
+
+# Entiers préalloués et partagés par CPython : ils ne coûtent rien à une instance
+_SMALL_INT_MIN = -5
+_SMALL_INT_MAX = 256
+
+
+class InternPool:
+    """Bounded pool of canonical Fraction instances, held through weak references
+
+    Tant qu'une valeur réduite num/den est utilisée quelque part, le pool en garde l'instance
+    canonique : le constructeur (donc aussi les opérateurs) renvoie cette instance au lieu
+    d'en créer une nouvelle. Le pool ne garde que des références faibles : une valeur qui
+    n'est plus utilisée disparaît d'elle-même. Seules les valeurs de pinned sont gardées en
+    vie par le pool. Quand le pool contient max_size valeurs, les nouvelles valeurs ne sont
+    plus internées (instances ordinaires) jusqu'à ce que des entrées disparaissent.
+
+    Chaque instance canonique est marquée par la génération courante du pool (renouvelée par
+    clear) : deux instances distinctes de même marque ont forcément des valeurs différentes,
+    ce qui permet à __eq__ de conclure sans calcul. Les lectures se font sans verrou ;
+    l'ajout d'une valeur et le retrait d'une entrée morte sont protégés par un même verrou
+    pour garantir l'unicité de l'instance canonique. Ce verrou est réentrant : le ramasse-
+    miettes peut déclencher un retrait pendant un ajout, dans le même thread.
+    """
+
+    def __init__(self, max_size=65536, pinned=()):
+        """Create an empty pool, then intern and keep alive the pinned values.
+
+        PRE : max_size est un entier >= 1, pinned est un itérable de Fraction, int ou float
+        POST : crée le pool (inactif tant qu'il n'est pas installé par enable_interning)
+        RAISE :
+            - TypeError si max_size n'est pas un entier
+            - ValueError si max_size < 1
+            - WrongTypeError si une valeur de pinned n'est pas d'un type accepté
+        """
+        if not isinstance(max_size, int) or isinstance(max_size, bool):
+            raise TypeError(f"{max_size} n'est pas un entier")
+        if max_size < 1:
+            raise ValueError("La taille du pool doit être >= 1")
+        self.max_size = max_size
+        self._refs = {}
+        self._generation = object()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self._pinned = []
+        for value in pinned:
+            value = Fraction._coerce(value)
+            self._pinned.append(self.canonical(value.numerator, value.denominator))
+
+    def __len__(self):
+        return len(self._refs)
+
+    def _remove(self, ref):
+        # Rappel du weakref : l'instance canonique n'est plus utilisée. Le test et le retrait
+        # se font sous le verrou : une nouvelle instance canonique de la même valeur, ajoutée
+        # entre les deux, serait sinon retirée du pool
+        with self._lock:
+            if self._refs.get(ref.key) is ref:
+                del self._refs[ref.key]
+
+    def canonical(self, num, den):
+        """Return the canonical instance of the reduced fraction num/den.
+
+        PRE : num/den est réduite et den > 0
+        POST : renvoie l'instance canonique de num/den, créée et enregistrée si besoin ;
+               une instance ordinaire si le pool est plein
+        """
+        key = (num, den)
+        ref = self._refs.get(key)
+        if ref is not None:
+            instance = ref()
+            if instance is not None:
+                self.hits += 1
+                return instance
+        self.misses += 1
+        instance = Fraction._from_reduced(num, den)
+        with self._lock:
+            ref = self._refs.get(key)
+            existing = None if ref is None else ref()
+            if existing is not None:
+                return existing
+            if len(self._refs) >= self.max_size:
+                self.rejected += 1
+                return instance
+            instance._interned_by = self._generation
+            self._refs[key] = KeyedRef(instance, self._remove, key)
+        return instance
+
+    def clear(self):
+        """Forget every canonical instance, including the pinned ones.
+
+        PRE : -
+        POST : le pool est vide ; les instances déjà distribuées restent valides
+        """
+        with self._lock:
+            self._refs = {}
+            self._generation = object()
+            self._pinned = []
+
+    def memory_saved(self):
+        """Return an estimate of the memory saved by sharing the live canonical instances.
+
+        Chaque référence à une instance canonique, au-delà de la première, aurait sinon tenu
+        sa propre instance et ses deux entiers (sauf les petits entiers, partagés par CPython).
+        Le nombre de références est lu avec sys.getrefcount et le stockage des attributs n'est
+        pas compté (le __dict__ n'est pas lu, pour ne pas le matérialiser) : l'estimation est
+        approchée, plutôt par défaut.
+
+        PRE : -
+        POST : renvoie le nombre d'octets estimé
+        """
+        pinned = {id(instance) for instance in self._pinned}
+        saved = 0
+        for ref in list(self._refs.values()):
+            instance = ref()
+            if instance is None:
+                continue
+            # getrefcount compte aussi la variable locale et son propre argument
+            holders = sys.getrefcount(instance) - 2 - (id(instance) in pinned)
+            if holders > 1:
+                size = sys.getsizeof(instance)
+                for term in (instance.numerator, instance.denominator):
+                    if not _SMALL_INT_MIN <= term <= _SMALL_INT_MAX:
+                        size += sys.getsizeof(term)
+                saved += (holders - 1) * size
+        return saved
+
+    def stats(self):
+        """Return the size, hit rate and estimated memory saving of the pool.
+
+        PRE : -
+        POST : renvoie un dictionnaire des mesures du pool
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._refs),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "rejected": self.rejected,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_saved_bytes": self.memory_saved(),
+        }
+
+
+def enable_interning(max_size=65536, pinned=()):
+    """Create an interning pool and install it in the constructor of Fraction.
+
+    PRE : max_size est un entier >= 1, pinned est un itérable de Fraction, int ou float
+    POST : le constructeur et les opérateurs de Fraction renvoient les instances canoniques
+           du pool ; le pool est renvoyé
+    RAISE :
+        - TypeError si max_size n'est pas un entier
+        - ValueError si max_size < 1
+    """
+    pool = InternPool(max_size, pinned)
+    with _install_lock:
+        Fraction._intern_pool = pool
+    return pool
+
+
+def disable_interning():
+    """Uninstall the interning pool.
+
+    PRE : -
+    POST : le constructeur de Fraction crée de nouveau une instance à chaque appel
+    """
+    with _install_lock:
+        Fraction._intern_pool = None
+
+
+def interning_stats():
+    """Return the statistics of the installed pool, or None if no pool is installed."""
+    pool = Fraction._intern_pool
+    return None if pool is None else pool.stats()
@@ -0,0 +1,91 @@
+import fractions
+from array import array
+from decimal import Decimal, getcontext
+
+from .core import Fraction
+
+
+def from_std_fractions(values):
+    """Convert a list of fractions.Fraction into a list of Fraction.
+
+    PRE : values est un itérable de fractions.Fraction
+    POST : renvoie la liste des Fraction de mêmes valeurs (sans recalcul de pgcd ni chaîne intermédiaire)
+    """
+    build = Fraction._from_reduced
+    return [build(value.numerator, value.denominator) for value in values]
+
+
+def to_std_fractions(values):
+    """Convert a list of Fraction into a list of fractions.Fraction.
+
+    PRE : values est un itérable de Fraction
+    POST : renvoie la liste des fractions.Fraction de mêmes valeurs
+    """
+    build = fractions.Fraction
+    return [build(value.numerator, value.denominator) for value in values]
+
+
+def from_decimals(values):
+    """Convert a list of decimal.Decimal into a list of Fraction exactly.
+
+    PRE : values est un itérable de Decimal finis
+    POST : renvoie la liste des Fraction de mêmes valeurs exactes
+    RAISE :
+        - ValueError si une valeur est NaN
+        - OverflowError si une valeur est infinie
+    """
+    build = Fraction._from_reduced
+    return [build(*value.as_integer_ratio()) for value in values]
+
+
+def to_decimals(values, context=None):
+    """Convert a list of Fraction into a list of decimal.Decimal.
+
+    PRE : values est un itérable de Fraction, context est un decimal.Context ou None
+    POST : renvoie la liste des quotients numerator / denominator arrondis selon le contexte
+    """
+    divide = (context or getcontext()).divide
+    return [divide(Decimal(value.numerator), Decimal(value.denominator)) for value in values]
+
+
+def from_ints(values):
+    """Convert a list of integers into a list of Fraction.
+
+    PRE : values est un itérable d'entiers
+    POST : renvoie la liste des Fraction n/1
+    """
+    build = Fraction._from_reduced
+    return [build(value, 1) for value in values]
+
+
+def to_float_array(values, out=None):
+    """Convert a list of Fraction into a contiguous buffer of doubles.
+
+    Les quotients sont calculés en une seule passe sans appel de méthode par valeur ; le
+    chemin lent (saturation à +/- inf) n'est pris que si une valeur dépasse les floats.
+
+    PRE : values est un itérable de Fraction (lu une seule fois), out est None ou un tampon inscriptible et
+          contigu de doubles (array('d'), tableau NumPy float64, ...) d'au moins len(values) éléments
+    POST : renvoie un nouvel array('d') des float correctement arrondis des fractions, ou out
+           dont les len(values) premiers éléments ont été remplis
+    RAISE : ValueError si out n'est pas un tampon de doubles inscriptible ou s'il est trop court
+    """
+    if not isinstance(values, list):
+        values = list(values)  # Le chemin lent relit les valeurs : un générateur ne peut être lu qu'une fois
+    try:
+        floats = array("d", [value.numerator / value.denominator for value in values])
+    except OverflowError:
+        to_float = Fraction._to_float
+        floats = array("d", [to_float(value.numerator, value.denominator) for value in values])
+    if out is None:
+        return floats
+    try:
+        view = memoryview(out)
+    except TypeError:
+        raise ValueError(f"out doit être un tampon de doubles, pas un objet de type {type(out)}")
+    if view.format != "d" or view.ndim != 1 or view.readonly:
+        raise ValueError("out doit être un tampon inscriptible à une dimension de doubles")
+    if len(view) < len(floats):
+        raise ValueError(f"out contient {len(view)} éléments, {len(floats)} sont nécessaires")
+    view[:len(floats)] = floats
+    return out
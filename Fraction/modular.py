@@ -0,0 +1,220 @@
+import random
+from math import gcd, isqrt
+
+from .core import Fraction
+from .parallel import _check_workers, _run
+
+# Premiers de 62 bits : les produits de deux résidus restent de petits entiers Python
+PRIME_BITS = 62
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)  # Déterministe sous 3.3e24
+
+
+class ModularReconstructionError(Exception):
+    """Raised when the residues cannot give back a fraction although the bound is reached."""
+
+
+def is_prime(n):
+    """Deterministic Miller-Rabin primality test for integers below 3.3e24.
+
+    PRE : n est un entier
+    POST : renvoie True si n est premier
+    """
+    if n < 2:
+        return False
+    for p in _MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def word_primes():
+    """Generate the primes below 2 ** PRIME_BITS in decreasing order."""
+    candidate = 2 ** PRIME_BITS - 1
+    while True:
+        if is_prime(candidate):
+            yield candidate
+        candidate -= 2
+
+
+def random_primes(count):
+    """Return count primes drawn at random between 2 ** PRIME_BITS and 2 ** (PRIME_BITS + 1).
+
+    Tirage par random.SystemRandom (aléa du système, imprévisible) ; l'intervalle est
+    disjoint de celui de word_primes.
+
+    PRE : count est un entier >= 0
+    POST : renvoie la liste de count nombres premiers tirés au hasard
+    """
+    rng = random.SystemRandom()
+    primes = []
+    while len(primes) < count:
+        candidate = rng.getrandbits(PRIME_BITS) | 1 << PRIME_BITS | 1
+        if is_prime(candidate):
+            primes.append(candidate)
+    return primes
+
+
+def rational_reconstruction(residue, modulus):
+    """Find the fraction num/den congruent to residue modulo modulus with small terms.
+
+    Algorithme d'Euclide étendu arrêté à mi-parcours (Wang) : si une fraction réduite
+    vérifie |num|, den <= sqrt(modulus / 2) et num ≡ residue * den (mod modulus), elle
+    est unique et c'est celle-ci qui est renvoyée.
+
+    PRE : modulus >= 2, residue est un entier
+    POST : renvoie le couple (num, den) avec den > 0, ou None si aucune telle fraction n'existe
+    """
+    bound = isqrt(modulus // 2)
+    r0, r1 = modulus, residue % modulus
+    t0, t1 = 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        t0, t1 = t1, t0 - q * t1
+    if t1 < 0:
+        r1, t1 = -r1, -t1
+    if t1 == 0 or t1 > bound or gcd(r1, t1) != 1:
+        return None
+    return r1, t1
+
+
+def _bound_bits(terms):
+    """Return k such that the reduced result of sum(n / d) has |num| < 2 ** k and den < 2 ** k.
+
+    Le dénominateur divise le ppcm des dénominateurs, majoré par le produit des
+    dénominateurs distincts ; le numérateur est majoré par ce ppcm fois la somme des |n|.
+    """
+    den_bits = sum(d.bit_length() for d in {d for _, d in terms})
+    num_bits = den_bits + max((abs(n).bit_length() for n, _ in terms), default=0) + len(terms).bit_length()
+    return max(num_bits, den_bits)
+
+
+def _residue(terms, p):
+    """Return sum(n / d) modulo p, or None if p divides one of the denominators."""
+    num, den = 0, 1
+    for n, d in terms:
+        d %= p
+        num = (num * d + n * den) % p
+        den = den * d % p
+    if den == 0:
+        return None
+    return num * pow(den, -1, p) % p
+
+
+def _confirmed(terms, candidate, count, workers):
+    """Check candidate against the residues of sum(n / d) modulo count random primes."""
+    num, den = candidate
+    confirmed = 0
+    while confirmed < count:
+        for p, r in _run(lambda p: (p, _residue(terms, p)), random_primes(count - confirmed), workers):
+            if r is None:
+                continue  # p divise un dénominateur : un autre nombre premier est tiré
+            if den % p == 0 or (num - r * den) % p:
+                return False
+            confirmed += 1
+    return True
+
+
+def _modular_evaluate(terms, workers, check_primes):
+    """Evaluate sum(n / d) over the (n, d) pairs with the multi-modular engine.
+
+    Les résidus sont calculés par lots de nombres premiers de word_primes (en parallèle sur
+    plusieurs threads si demandé) et combinés par le théorème des restes chinois. Deux issues :
+        - le module dépasse la borne a priori de _bound_bits : la reconstruction est
+          unique, le résultat est certain ;
+        - si check_primes n'est pas None, avant cette borne, une fraction reconstruite (à
+          chaque doublement de la taille du module) qui concorde avec les résidus du lot suivant est confrontée aux résidus de check_primes
+          nombres premiers tirés au hasard (random_primes) ; elle est acceptée s'ils concordent
+          tous, sinon le calcul continue.
+    """
+    if not terms:
+        return 0, 1
+    needed_bits = 2 * _bound_bits(terms) + 2
+    primes = word_primes()
+    batch = max(check_primes or 1, workers)
+    residue, modulus, candidate = 0, 1, None
+    attempt_bits = 0
+    while True:
+        chosen = [next(primes) for _ in range(batch)]
+        results = _run(lambda p: (p, _residue(terms, p)), chosen, workers)
+        results = [(p, r) for p, r in results if r is not None]  # Premiers divisant un dénominateur
+        if candidate is not None and results:
+            num, den = candidate
+            if (all(den % p and (num - r * den) % p == 0 for p, r in results)
+                    and _confirmed(terms, candidate, check_primes, workers)):
+                return candidate
+        for p, r in results:
+            # Restes chinois : residue ≡ r (mod p) et residue inchangé modulo l'ancien module
+            residue += modulus * ((r - residue) * pow(modulus, -1, p) % p)
+            modulus *= p
+        if modulus.bit_length() > needed_bits or check_primes is not None and modulus.bit_length() >= attempt_bits:
+            # Tentatives à chaque doublement de la taille du module : leur coût total reste
+            # de l'ordre de celui de la dernière
+            candidate = rational_reconstruction(residue, modulus)
+            attempt_bits = 2 * modulus.bit_length()
+        if modulus.bit_length() > needed_bits:
+            if candidate is None:
+                raise ModularReconstructionError("Reconstruction impossible malgré la borne atteinte")
+            return candidate
+
+
+def modular_sum(values, workers=None, check_primes=2):
+    """Return the exact sum of values, computed modulo word-sized primes.
+
+    Adapté aux sommes dont les dénominateurs intermédiaires sont énormes mais dont le
+    résultat réduit est petit : le calcul s'arrête dès qu'une fraction reconstruite est
+    confirmée par check_primes nombres premiers de 63 bits tirés au hasard à chaque appel,
+    et le coût dépend de la taille du résultat, pas de celle du ppcm des dénominateurs.
+    Une fraction fausse ne passe une vérification que si le nombre premier tiré divise
+    l'écart (non nul) de leurs produits en croix, de B bits au plus (B = 2 * _bound_bits + 2) :
+    probabilité inférieure à B / 2 ** 57 par nombre premier, quelles que soient les valeurs,
+    puisque les nombres premiers tirés ne peuvent être connus d'avance. Avec check_primes
+    à None, les résidus sont accumulés jusqu'à la borne a priori : le résultat est certain,
+    mais le coût croît avec la taille de tous les dénominateurs.
+
+    PRE : values est un itérable de Fraction, int ou float, check_primes est None ou un entier >= 1
+    POST : renvoie la somme exacte sous forme de Fraction (0 pour une liste vide), avec une
+           probabilité d'erreur inférieure à (B / 2 ** 57) ** check_primes ; certaine si
+           check_primes est None
+    RAISE :
+        - WrongTypeError si une valeur est différente de int, float ou une Fraction
+        - ValueError si workers n'est pas un entier >= 1
+    """
+    terms = [(f.numerator, f.denominator) for f in map(Fraction._coerce, values)]
+    return Fraction._from_reduced(*_modular_evaluate(terms, _check_workers(workers), check_primes))
+
+
+def modular_dot(lefts, rights, workers=None, check_primes=2):
+    """Return the exact dot product sum(a * b), computed modulo word-sized primes.
+
+    Les produits a * b sont sommés comme dans modular_sum (même vérification par des
+    nombres premiers tirés au hasard, même signification de check_primes).
+
+    PRE : lefts et rights sont des itérables de même longueur de Fraction, int ou float,
+          check_primes est None ou un entier >= 1
+    POST : renvoie le produit scalaire exact sous forme de Fraction (voir modular_sum pour
+           la probabilité d'erreur)
+    RAISE :
+        - WrongTypeError si une valeur est différente de int, float ou une Fraction
+        - ValueError si les longueurs diffèrent ou si workers n'est pas un entier >= 1
+    """
+    lefts = [Fraction._coerce(value) for value in lefts]
+    rights = [Fraction._coerce(value) for value in rights]
+    if len(lefts) != len(rights):
+        raise ValueError("Les deux listes d'opérandes doivent avoir la même longueur")
+    terms = [(a.numerator * b.numerator, a.denominator * b.denominator) for a, b in zip(lefts, rights)]
+    return Fraction._from_reduced(*_modular_evaluate(terms, _check_workers(workers), check_primes))
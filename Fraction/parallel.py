@@ -0,0 +1,210 @@
+import operator
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from math import gcd
+
+from .core import Fraction
+
+OPERATIONS = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "truediv": operator.truediv,
+    "floordiv": operator.floordiv,
+    "mod": operator.mod,
+    "divmod": divmod,
+}
+
+# Avec le GIL, les threads n'accélèrent pas un calcul pur Python : on garde peu de gros blocs
+_CHUNKS_PER_WORKER_GIL = 1
+_CHUNKS_PER_WORKER_FREE_THREADED = 4
+_MIN_CHUNK_SIZE = 1024
+
+
+def gil_enabled():
+    """Return True if the interpreter runs with the GIL (always True before CPython 3.13)."""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def default_workers():
+    """Return the default number of threads: one per core on free-threaded builds, 1 otherwise."""
+    return 1 if gil_enabled() else (os.cpu_count() or 1)
+
+
+def chunk_bounds(length, workers, chunk_size=None):
+    """Split range(length) into contiguous (start, stop) chunks.
+
+    PRE : length >= 0, workers >= 1
+    POST : renvoie la liste des bornes ; sans chunk_size, la taille est choisie selon
+           la présence du GIL (un bloc par thread) ou non (quatre blocs par thread)
+    RAISE : ValueError si chunk_size n'est ni None ni un entier >= 1
+    """
+    _check_chunk_size(chunk_size)
+    if chunk_size is None:
+        per_worker = _CHUNKS_PER_WORKER_GIL if gil_enabled() else _CHUNKS_PER_WORKER_FREE_THREADED
+        chunk_size = max(_MIN_CHUNK_SIZE, -(-length // (workers * per_worker)))
+    return [(start, min(start + chunk_size, length)) for start in range(0, length, chunk_size)]
+
+
+def _run(kernel, chunks, workers):
+    """Apply kernel to every chunk, in a thread pool when there is more than one of each."""
+    if workers <= 1 or len(chunks) <= 1:
+        return [kernel(chunk) for chunk in chunks]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(kernel, chunks))
+
+
+def _check_workers(workers):
+    if workers is None:
+        return default_workers()
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError("Le nombre de threads doit être un entier >= 1")
+    return workers
+
+
+def _check_chunk_size(chunk_size):
+    if chunk_size is not None and (not isinstance(chunk_size, int) or isinstance(chunk_size, bool) or chunk_size < 1):
+        raise ValueError("La taille des blocs doit être un entier >= 1")
+
+
+# ------------------ Batch kernels ------------------
+
+def batch_apply(operation, lefts, rights, workers=None, chunk_size=None):
+    """Apply an operator elementwise to two lists of operands.
+
+    PRE : operation est "add", "sub", "mul", "truediv", "floordiv", "mod", "divmod"
+          ou une fonction à deux arguments,
+          lefts et rights ont la même longueur
+    POST : renvoie [operation(a, b) for a, b in zip(lefts, rights)], calculé par blocs
+    RAISE :
+        - ValueError si l'opération est inconnue, si les longueurs diffèrent
+          ou si workers n'est pas un entier >= 1
+    """
+    if not callable(operation):
+        if operation not in OPERATIONS:
+            raise ValueError(f"Opération inconnue : {operation}")
+        operation = OPERATIONS[operation]
+    lefts, rights = list(lefts), list(rights)
+    if len(lefts) != len(rights):
+        raise ValueError("Les deux listes d'opérandes doivent avoir la même longueur")
+    workers = _check_workers(workers)
+
+    def kernel(bounds):
+        start, stop = bounds
+        return list(map(operation, lefts[start:stop], rights[start:stop]))
+
+    result = []
+    for part in _run(kernel, chunk_bounds(len(lefts), workers, chunk_size), workers):
+        result.extend(part)
+    return result
+
+
+def _sum_pairs(pairs):
+    """Return the reduced (num, den) sum of a chunk of (num, den) pairs, combinable with other chunks."""
+    num, den = Fraction._accumulate(pairs)
+    g = gcd(num, den)
+    return num // g, den // g
+
+
+def _product_pairs(pairs):
+    """Multiply (num, den) pairs, reducing once at the end."""
+    num, den = 1, 1
+    for n, d in pairs:
+        num *= n
+        den *= d
+        if num == 0:
+            return 0, 1
+    g = gcd(num, den)
+    return num // g, den // g
+
+
+def parallel_sum(values, workers=None, chunk_size=None):
+    """Return the exact sum of values, computed by chunks in a thread pool.
+
+    PRE : values est un itérable de Fraction, int ou float
+    POST : renvoie la somme sous forme de Fraction (0 pour une liste vide)
+    RAISE :
+        - WrongTypeError si une valeur est différente de int, float ou une Fraction
+    """
+    values = list(values)
+    workers = _check_workers(workers)
+
+    def kernel(bounds):
+        start, stop = bounds
+        return _sum_pairs((f.numerator, f.denominator) for f in map(Fraction._coerce, values[start:stop]))
+
+    partial = _run(kernel, chunk_bounds(len(values), workers, chunk_size), workers)
+    return Fraction._from_reduced(*_sum_pairs(partial))
+
+
+def parallel_product(values, workers=None, chunk_size=None):
+    """Return the exact product of values, computed by chunks in a thread pool.
+
+    PRE : values est un itérable de Fraction, int ou float
+    POST : renvoie le produit sous forme de Fraction (1 pour une liste vide)
+    RAISE :
+        - WrongTypeError si une valeur est différente de int, float ou une Fraction
+    """
+    values = list(values)
+    workers = _check_workers(workers)
+
+    def kernel(bounds):
+        start, stop = bounds
+        return _product_pairs((f.numerator, f.denominator) for f in map(Fraction._coerce, values[start:stop]))
+
+    partial = _run(kernel, chunk_bounds(len(values), workers, chunk_size), workers)
+    return Fraction._from_reduced(*_product_pairs(partial))
+
+
+def _parallel_scan(values, workers, chunk_size, total, running):
+    """Chunked inclusive scan: chunk totals, then offsets, then every chunk scanned from its offset."""
+    values = list(Fraction._bulk(values))
+    workers = _check_workers(workers)
+    chunks = chunk_bounds(len(values), workers, chunk_size)
+    pairs = _run(lambda bounds: list(Fraction._ratios(values[bounds[0]:bounds[1]])), chunks, workers)
+    offsets, offset = [], None
+    for chunk_total in _run(total, pairs, workers):
+        offsets.append(offset)
+        offset = chunk_total if offset is None else total((offset, chunk_total))
+    tasks = list(zip(pairs, offsets))
+
+    def kernel(task):
+        chunk, offset = task
+        return list(running(chunk) if offset is None else running(chunk, *offset))
+
+    result = []
+    for part in _run(kernel, tasks, workers):
+        result.extend(part)
+    return result
+
+
+def parallel_cumsum(values, workers=None, chunk_size=None):
+    """Return the running sums of values, computed by chunks in a thread pool.
+
+    Chaque bloc calcule d'abord sa somme ; les sommes des blocs précédents donnent le
+    décalage de chaque bloc, à partir duquel ses sommes courantes sont calculées (voir
+    Fraction.cumsum) indépendamment des autres blocs.
+
+    PRE : values est un itérable de Fraction, int ou float
+    POST : renvoie la liste des Fraction réduites v0, v0 + v1, ... (vide pour une liste vide)
+    RAISE :
+        - WrongTypeError si une valeur est différente de int, float ou une Fraction
+        - ValueError si workers n'est pas un entier >= 1
+    """
+    return _parallel_scan(values, workers, chunk_size, _sum_pairs, Fraction._running_sums)
+
+
+def parallel_cumprod(values, workers=None, chunk_size=None):
+    """Return the running products of values, computed by chunks in a thread pool.
+
+    Voir parallel_cumsum : le décalage d'un bloc est le produit des blocs précédents.
+
+    PRE : values est un itérable de Fraction, int ou float
+    POST : renvoie la liste des Fraction réduites v0, v0 * v1, ... (vide pour une liste vide)
+    RAISE :
+        - WrongTypeError si une valeur est différente de int, float ou une Fraction
+        - ValueError si workers n'est pas un entier >= 1
+    """
+    return _parallel_scan(values, workers, chunk_size, _product_pairs, Fraction._running_products)
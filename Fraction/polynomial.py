@@ -0,0 +1,278 @@
+from math import gcd
+
+from .core import Fraction, DenominatorIsZero, WrongTypeError
+
+
+class FractionPolynomial:
+    """Polynomial with exact Fraction coefficients
+
+    Le polynôme est stocké sous la forme d'une liste de coefficients entiers (degré croissant)
+    et d'un dénominateur commun positif : P = (c0 + c1 x + ... + cn x^n) / denominator. Les
+    opérations (évaluation de Horner, produit, division, dérivée) se font sur ces entiers ;
+    les Fraction ne sont construites (et réduites) qu'à la sortie.
+    """
+
+    def __init__(self, coefficients):
+        """Build a polynomial from its coefficients, constant term first.
+
+        PRE : coefficients est un itérable de Fraction, int ou float (c0, c1, ..., cn)
+        POST : crée le polynôme c0 + c1 x + ... + cn x^n
+        RAISE :
+            - WrongTypeError si un coefficient est différent de int, float ou une Fraction
+        """
+        values = [Fraction._coerce(value) for value in coefficients]
+        den = 1
+        for value in values:
+            den = den * value.denominator // gcd(den, value.denominator)
+        self.__coefficients, self.__denominator = self.__normalized(
+            [value.numerator * (den // value.denominator) for value in values], den)
+
+    @staticmethod
+    def _from_integers(coefficients, den=1):
+        """Build the polynomial coefficients/den from integer coefficients, reducing it once."""
+        polynomial = FractionPolynomial.__new__(FractionPolynomial)
+        polynomial.__coefficients, polynomial.__denominator = FractionPolynomial.__normalized(coefficients, den)
+        return polynomial
+
+    @staticmethod
+    def __normalized(coefficients, den):
+        """Strip the zero leading coefficients and divide by the common content."""
+        if den < 0:
+            coefficients, den = [-c for c in coefficients], -den
+        while coefficients and coefficients[-1] == 0:
+            coefficients = coefficients[:-1]
+        if not coefficients:
+            return [], 1
+        common = gcd(den, *coefficients)
+        if common != 1:
+            coefficients, den = [c // common for c in coefficients], den // common
+        return coefficients, den
+
+    # ------------------ Accessors and representations ------------------
+
+    @property
+    def degree(self):
+        """Degree of the polynomial (-1 for the zero polynomial)."""
+        return len(self.__coefficients) - 1
+
+    def __getitem__(self, i):
+        """Return the coefficient of x^i as a Fraction (0 beyond the degree)."""
+        if i < 0:
+            raise IndexError("L'indice d'un coefficient doit être >= 0")
+        if i >= len(self.__coefficients):
+            return Fraction(0, 1)
+        return Fraction(self.__coefficients[i], self.__denominator)
+
+    def coefficients(self):
+        """Return the list of coefficients as Fraction, constant term first.
+
+        PRE : -
+        POST : renvoie [c0, c1, ..., cn] (liste vide pour le polynôme nul)
+        """
+        den = self.__denominator
+        return [Fraction(c, den) for c in self.__coefficients]
+
+    def __str__(self):
+        terms = []
+        for i in range(self.degree, -1, -1):
+            c = self[i]
+            if c.is_zero():
+                continue
+            power = "" if i == 0 else ("x" if i == 1 else f"x^{i}")
+            text = str(c) if not power else (power if str(c) == "1" else f"{c}*{power}")
+            terms.append(text)
+        return " + ".join(terms).replace("+ -", "- ") if terms else "0"
+
+    def __eq__(self, other):
+        """Overloading of the == operator for polynomials
+
+        PRE : -
+        POST : renvoie True si les deux polynômes ont les mêmes coefficients
+        """
+        if not isinstance(other, FractionPolynomial):
+            return NotImplemented
+        # Les deux représentations sont réduites : l'égalité est structurelle
+        return self.__denominator == other.__denominator and self.__coefficients == other.__coefficients
+
+    # ------------------ Evaluation ------------------
+
+    def __call__(self, x):
+        """Evaluate the polynomial at x.
+
+        PRE : x est une Fraction, un int ou un float
+        POST : renvoie P(x) sous forme de Fraction réduite
+        RAISE : WrongTypeError si x est différent de int, float ou une Fraction
+        """
+        return self.evaluate([x])[0]
+
+    def evaluate(self, points):
+        """Evaluate the polynomial at many points in one call.
+
+        En x = a/b, P(x) = (c0 b^n + c1 a b^(n-1) + ... + cn a^n) / (denominator * b^n) : le
+        schéma de Horner porte sur des entiers seulement, et un seul pgcd est calculé par point.
+        Les points sont regroupés par dénominateur : les coefficients ci * b^(n-i) sont calculés
+        une fois par dénominateur, puis chaque étape de Horner traite tous les points du groupe
+        dans une même compréhension de liste.
+
+        PRE : points est un itérable de Fraction, int ou float
+        POST : renvoie la liste des P(x), dans l'ordre des points
+        RAISE : WrongTypeError si un point est différent de int, float ou une Fraction
+        """
+        points = [Fraction._coerce(x) for x in points]
+        coefficients, n = self.__coefficients, self.degree
+        if n < 0:
+            return [Fraction(0, 1)] * len(points)
+        groups = {}
+        for index, x in enumerate(points):
+            groups.setdefault(x.denominator, []).append(index)
+        results = [None] * len(points)
+        for b, indexes in groups.items():
+            scaled, power = [0] * (n + 1), 1
+            for i in range(n, -1, -1):
+                scaled[i] = coefficients[i] * power
+                power *= b
+            den = self.__denominator * (power // b)  # denominator * b^n
+            nums = [points[index].numerator for index in indexes]
+            values = [scaled[n]] * len(nums)
+            for c in reversed(scaled[:n]):
+                values = [h * a + c for h, a in zip(values, nums)]
+            for index, value in zip(indexes, values):
+                g = gcd(value, den)
+                results[index] = Fraction._from_reduced(value // g, den // g)
+        return results
+
+    # ------------------ Arithmetic ------------------
+
+    @staticmethod
+    def __as_polynomial(value):
+        if isinstance(value, FractionPolynomial):
+            return value
+        try:
+            value = Fraction._coerce(value)
+        except WrongTypeError:
+            return None
+        return FractionPolynomial._from_integers([value.numerator], value.denominator)
+
+    def __add__(self, other):
+        """Overloading of the + operator (with a polynomial or a constant)
+
+        PRE : -
+        POST : renvoie le polynôme self + other
+        """
+        other = self.__as_polynomial(other)
+        if other is None:
+            return NotImplemented
+        return self.__combine(other, 1)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Overloading of the - operator (with a polynomial or a constant)
+
+        PRE : -
+        POST : renvoie le polynôme self - other
+        """
+        other = self.__as_polynomial(other)
+        if other is None:
+            return NotImplemented
+        return self.__combine(other, -1)
+
+    def __rsub__(self, other):
+        other = self.__as_polynomial(other)
+        if other is None:
+            return NotImplemented
+        return other.__combine(self, -1)
+
+    def __neg__(self):
+        return FractionPolynomial._from_integers([-c for c in self.__coefficients], self.__denominator)
+
+    def __combine(self, other, sign):
+        """Return self + sign * other over the least common denominator."""
+        d1, d2 = self.__denominator, other.__denominator
+        g = gcd(d1, d2)
+        f1, f2 = d2 // g, d1 // g
+        left, right = self.__coefficients, other.__coefficients
+        size = max(len(left), len(right))
+        left = [c * f1 for c in left] + [0] * (size - len(left))
+        right = [sign * c * f2 for c in right] + [0] * (size - len(right))
+        return FractionPolynomial._from_integers([a + b for a, b in zip(left, right)], d1 * f1)
+
+    def __mul__(self, other):
+        """Overloading of the * operator (with a polynomial or a constant)
+
+        PRE : -
+        POST : renvoie le polynôme produit self * other
+        """
+        other = self.__as_polynomial(other)
+        if other is None:
+            return NotImplemented
+        left, right = self.__coefficients, other.__coefficients
+        if not left or not right:
+            return FractionPolynomial._from_integers([])
+        product = [0] * (len(left) + len(right) - 1)
+        for i, a in enumerate(left):
+            if a:
+                for j, b in enumerate(right):
+                    product[i + j] += a * b
+        return FractionPolynomial._from_integers(product, self.__denominator * other.__denominator)
+
+    __rmul__ = __mul__
+
+    def __divmod__(self, other):
+        """Overloading of divmod() for polynomials (Euclidean division)
+
+        Pseudo-division sur les entiers : lc^e * p = q * d + r avec e = deg p - deg d + 1, où
+        lc est le coefficient dominant entier du diviseur ; le quotient et le reste rationnels
+        s'en déduisent en divisant par lc^e, sans aucune Fraction intermédiaire.
+
+        PRE : -
+        POST : renvoie le couple (quotient, reste) avec self = quotient * other + reste
+               et deg(reste) < deg(other)
+        RAISE :
+            - DenominatorIsZero si other est le polynôme nul
+        """
+        other = self.__as_polynomial(other)
+        if other is None:
+            return NotImplemented
+        divisor = other.__coefficients
+        if not divisor:
+            raise DenominatorIsZero("Division par le polynôme nul")
+        remainder, m, n = list(self.__coefficients), self.degree, other.degree
+        if m < n:
+            return FractionPolynomial._from_integers([]), self
+        lead = divisor[n]
+        quotient = [0] * (m - n + 1)
+        for k in range(m - n, -1, -1):
+            t = remainder[n + k]
+            quotient = [c * lead for c in quotient]
+            quotient[k] = t
+            remainder = [c * lead for c in remainder]
+            for i, c in enumerate(divisor):
+                remainder[i + k] -= t * c
+        scale = self.__denominator * lead ** (m - n + 1)
+        # P = p / Dp et D = d / Dd : P = (q * Dd / scale) * D + r / scale
+        return (FractionPolynomial._from_integers(quotient, scale).__scaled(other.__denominator),
+                FractionPolynomial._from_integers(remainder[:n], scale))
+
+    def __floordiv__(self, other):
+        result = self.__divmod__(other)
+        return result if result is NotImplemented else result[0]
+
+    def __mod__(self, other):
+        result = self.__divmod__(other)
+        return result if result is NotImplemented else result[1]
+
+    def derivative(self):
+        """Return the exact derivative of the polynomial.
+
+        PRE : -
+        POST : renvoie le polynôme dérivé c1 + 2 c2 x + ... + n cn x^(n-1)
+        """
+        return FractionPolynomial._from_integers([i * c for i, c in enumerate(self.__coefficients)][1:],
+                                                 self.__denominator)
+
+    # ------------------ Helpers ------------------
+
+    def __scaled(self, factor):
+        """Return the polynomial multiplied by the integer factor."""
+        return FractionPolynomial._from_integers([factor * c for c in self.__coefficients], self.__denominator)
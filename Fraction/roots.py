@@ -0,0 +1,111 @@
+from math import isqrt
+
+from .core import Fraction
+
+DEFAULT_PRECISION = Fraction(1, 2 ** 64)
+
+
+def _check_degree(k):
+    if not isinstance(k, int) or isinstance(k, bool):
+        raise TypeError(f"{k} n'est pas un entier")
+    if k < 1:
+        raise ValueError("L'indice de la racine doit être >= 1")
+
+
+def iroot(n, k):
+    """Return the integer kth root of n, rounded down.
+
+    Pour k = 2, math.isqrt ; sinon itération de Newton sur les entiers
+    x -> ((k - 1) * x + n // x ** (k - 1)) // k, partie d'une valeur supérieure à la racine
+    et strictement décroissante jusqu'au résultat.
+
+    PRE : n est un entier >= 0, k est un entier >= 1
+    POST : renvoie le plus grand entier r tel que r ** k <= n
+    RAISE :
+        - TypeError si n ou k n'est pas un entier
+        - ValueError si n < 0 ou k < 1
+    """
+    _check_degree(k)
+    if not isinstance(n, int) or isinstance(n, bool):
+        raise TypeError(f"{n} n'est pas un entier")
+    if n < 0:
+        raise ValueError("Pas de racine entière d'un entier négatif")
+    if k == 1 or n < 2:
+        return n
+    if k == 2:
+        return isqrt(n)
+    x = 1 << -(-n.bit_length() // k)
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+
+def _check_sign(num, k):
+    if num < 0 and k % 2 == 0:
+        raise ValueError("Pas de racine d'indice pair d'une valeur négative")
+
+
+def exact_root(value, k=2):
+    """Return the kth root of value if it is a fraction, or None.
+
+    La fraction étant réduite, sa racine est rationnelle si et seulement si le numérateur
+    et le dénominateur sont des puissances k-ièmes parfaites.
+
+    PRE : value est une Fraction, un int ou un float, k est un entier >= 1
+    POST : renvoie la Fraction r telle que r ** k == value (r >= 0 si k est pair), ou None
+    RAISE :
+        - ValueError si k < 1, ou si value < 0 et k est pair
+        - TypeError si k n'est pas un entier
+        - WrongTypeError si value est différent de int, float ou une Fraction
+    """
+    value = Fraction._coerce(value)
+    _check_degree(k)
+    num, den = value.numerator, value.denominator
+    _check_sign(num, k)
+    a = iroot(abs(num), k)
+    if a ** k != abs(num):
+        return None
+    b = iroot(den, k)
+    if b ** k != den:
+        return None
+    return Fraction._from_reduced(-a if num < 0 else a, b)
+
+
+def _dyadic(m, bits):
+    """Return the reduced Fraction m / 2 ** bits."""
+    shift = min((m & -m).bit_length() - 1, bits) if m else bits
+    return Fraction._from_reduced(m >> shift if m >= 0 else -(-m >> shift), 1 << (bits - shift))
+
+
+def root_interval(value, k=2, precision=DEFAULT_PRECISION):
+    """Return a certified interval enclosing the kth root of value.
+
+    Avec S = 2 ** b >= 1 / precision, la racine de value * S ** k est encadrée par sa partie
+    entière m = iroot(num * S ** k // den, k) et m + 1 (Newton sur les entiers) : la racine
+    de value est dans [m / S, (m + 1) / S]. Les bornes ont des dénominateurs puissances de 2
+    fixés par la précision, sans croissance au fil des itérations, et aucun float n'intervient
+    (pas de dépassement pour les grandes valeurs).
+
+    PRE : value est une Fraction, un int ou un float, k est un entier >= 1,
+          precision est une Fraction, un int ou un float > 0
+    POST : renvoie (low, high) avec low <= racine <= high et high - low <= precision ;
+           low == high est la racine exacte si elle est rationnelle
+    RAISE :
+        - ValueError si k < 1, si value < 0 et k est pair, ou si precision <= 0
+        - TypeError si k n'est pas un entier
+        - WrongTypeError si value ou precision est différent de int, float ou une Fraction
+    """
+    exact = exact_root(value, k)
+    if exact is not None:
+        return exact, exact
+    value, precision = Fraction._coerce(value), Fraction._coerce(precision)
+    if precision.numerator <= 0:
+        raise ValueError("La précision doit être > 0")
+    bits = (-(-precision.denominator // precision.numerator) - 1).bit_length()
+    num, den = value.numerator, value.denominator
+    m = iroot((abs(num) << (k * bits)) // den, k)
+    if num < 0:
+        return _dyadic(-m - 1, bits), _dyadic(-m, bits)
+    return _dyadic(m, bits), _dyadic(m + 1, bits)
@@ -0,0 +1,80 @@
+from math import gcd
+
+from .core import Fraction
+
+
+def floor_all(values):
+    """Return the floor of every value.
+
+    PRE : values est un itérable de Fraction, int ou float
+    POST : renvoie la liste des entiers exacts floor(value)
+    RAISE : WrongTypeError si une valeur n'est pas d'un type accepté
+    """
+    return [f.numerator // f.denominator for f in map(Fraction._coerce, values)]
+
+
+def ceil_all(values):
+    """Return the ceiling of every value.
+
+    PRE : values est un itérable de Fraction, int ou float
+    POST : renvoie la liste des entiers exacts ceil(value)
+    RAISE : WrongTypeError si une valeur n'est pas d'un type accepté
+    """
+    return [-(-f.numerator // f.denominator) for f in map(Fraction._coerce, values)]
+
+
+def trunc_all(values):
+    """Return the integer part (rounded towards zero) of every value.
+
+    PRE : values est un itérable de Fraction, int ou float
+    POST : renvoie la liste des entiers exacts trunc(value)
+    RAISE : WrongTypeError si une valeur n'est pas d'un type accepté
+    """
+    return [f.numerator // f.denominator if f.numerator >= 0 else -(-f.numerator // f.denominator)
+            for f in map(Fraction._coerce, values)]
+
+
+def round_all(values, ndigits=None):
+    """Round every value half to even, like round(value, ndigits).
+
+    PRE : values est un itérable de Fraction, int ou float, ndigits est None ou un entier
+    POST : renvoie la liste des entiers arrondis (sans ndigits) ou des Fraction multiples
+           de 10**-ndigits les plus proches
+    RAISE :
+        - WrongTypeError si une valeur n'est pas d'un type accepté
+        - TypeError si ndigits n'est pas un entier
+    """
+    values = list(map(Fraction._coerce, values))
+    round_half_even = Fraction._round_half_even
+    if ndigits is None:
+        return [round_half_even(f.numerator, f.denominator) for f in values]
+    return [f.__round__(ndigits) for f in values]
+
+
+def divmod_all(values, divisors):
+    """Return divmod(value, divisor) for every value.
+
+    PRE : values est un itérable de Fraction, int ou float ; divisors est une seule valeur
+          (diviseur commun) ou un itérable de même longueur que values
+    POST : renvoie la liste des couples (quotient entier, reste de type Fraction)
+    RAISE :
+        - WrongTypeError si une valeur n'est pas d'un type accepté
+        - DenominatorIsZero si un diviseur vaut zero
+        - ValueError si les deux listes n'ont pas la même longueur
+    """
+    values = list(map(Fraction._coerce, values))
+    if hasattr(divisors, "__iter__") and not isinstance(divisors, str):
+        divisors = list(map(Fraction._coerce, divisors))
+        if len(divisors) != len(values):
+            raise ValueError("Les deux listes doivent avoir la même longueur")
+    else:
+        divisors = [Fraction._coerce(divisors)] * len(values)
+    terms = Fraction._divmod_terms
+    build = Fraction._from_reduced
+    result = []
+    for value, divisor in zip(values, divisors):
+        quotient, remainder = divmod(*terms(value, divisor))
+        den = value.denominator * divisor.denominator
+        g = gcd(remainder, den)
+        result.append((quotient, build(remainder // g, den // g)))
+    return result
@@ -0,0 +1,91 @@
+from itertools import islice
+
+from .core import Fraction, DenominatorIsZero
+
+
+def _check_count(count):
+    if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+        raise ValueError("Le nombre de termes doit être un entier >= 0")
+
+
+def _reduced(num, den):
+    """Return the Fraction num/den of a series total, rejecting a zero denominator."""
+    if den == 0:
+        raise DenominatorIsZero("le dénominateur ne peut pas être égal à zero ")
+    return Fraction._from_pair(num, den)
+
+
+def _split_sum(pairs, start, stop):
+    """Sum pairs[start:stop] of (num, den) by binary splitting over a common denominator.
+
+    Les deux moitiés ont des tailles voisines : les produits se font entre entiers de
+    tailles comparables, ce qui profite à la multiplication de Karatsuba de Python. Le
+    dénominateur reste le ppcm des dénominateurs (pas leur produit) ; seul le résultat
+    final est réduit.
+    """
+    if stop - start == 1:
+        return pairs[start]
+    middle = (start + stop) // 2
+    return Fraction._accumulate((_split_sum(pairs, middle, stop),), *_split_sum(pairs, start, middle))
+
+
+def series_sum(term, count, start=0):
+    """Return the exact sum of count terms of a rational series.
+
+    PRE : term est une fonction k -> Fraction, int ou float, ou un itérable de tels termes ;
+          count est un entier >= 0, start est l'indice du premier terme (si term est une fonction)
+    POST : renvoie sum(term(k) for k in range(start, start + count)) sous forme de Fraction réduite
+           (seuls les count premiers éléments sont lus si term est un itérable)
+    RAISE :
+        - ValueError si count n'est pas un entier >= 0 ou si l'itérable a moins de count termes
+        - WrongTypeError si un terme est différent de int, float ou une Fraction
+    """
+    _check_count(count)
+    values = map(term, range(start, start + count)) if callable(term) else islice(term, count)
+    pairs = [(value.numerator, value.denominator) for value in map(Fraction._coerce, values)]
+    if len(pairs) < count:
+        raise ValueError(f"La série ne contient que {len(pairs)} termes, {count} sont demandés")
+    if not pairs:
+        return Fraction(0, 1)
+    return _reduced(*_split_sum(pairs, 0, count))
+
+
+def _split_ratio(p, q, start, stop):
+    """Return (P, Q, T) for the indexes start <= k < stop of a hypergeometric series.
+
+    P et Q sont les produits des p(k) et q(k), et T / Q est la somme des produits partiels
+    p(start) ... p(k) / (q(start) ... q(k)).
+    """
+    if stop - start == 1:
+        pk, qk = p(start), q(start)
+        if not isinstance(pk, int) or not isinstance(qk, int):
+            raise TypeError(f"p({start}) et q({start}) doivent être des entiers")
+        return pk, qk, pk
+    middle = (start + stop) // 2
+    p1, q1, t1 = _split_ratio(p, q, start, middle)
+    p2, q2, t2 = _split_ratio(p, q, middle, stop)
+    return p1 * p2, q1 * q2, t1 * q2 + p1 * t2
+
+
+def hypergeometric_sum(p, q, count, first=1):
+    """Return the exact sum of count terms of a series given by the ratio of its terms.
+
+    Les termes vérifient t(0) = first et t(k) = t(k - 1) * p(k) / q(k) pour k >= 1 ;
+    par exemple p(k) = 1 et q(k) = k donnent la série de l'exponentielle sum(1 / k!).
+
+    PRE : p et q sont des fonctions k -> entier, q(k) != 0 pour 1 <= k < count ;
+          count est un entier >= 0, first est une Fraction, un int ou un float
+    POST : renvoie t(0) + ... + t(count - 1) sous forme de Fraction réduite
+    RAISE :
+        - ValueError si count n'est pas un entier >= 0
+        - TypeError si p(k) ou q(k) n'est pas un entier
+        - DenominatorIsZero si un q(k) vaut zero
+        - WrongTypeError si first est différent de int, float ou une Fraction
+    """
+    _check_count(count)
+    first = Fraction._coerce(first)
+    if count <= 1:
+        return first if count else Fraction(0, 1)
+    _, q_product, t = _split_ratio(p, q, 1, count)
+    # sum = first * (1 + T / Q)
+    return _reduced(first.numerator * (q_product + t), first.denominator * q_product)
@@ -0,0 +1,338 @@
+import sys
+from array import array
+from math import gcd
+
+from .core import Fraction, DenominatorIsZero
+
+# Un mot de 64 bits contient le numérateur signé sur 32 bits (poids forts) et le dénominateur
+# non signé sur 32 bits (poids faibles) : word = (num << 32) | den.
+NUM_MIN = -2 ** 31
+NUM_MAX = 2 ** 31 - 1
+DEN_MAX = 2 ** 32 - 1
+_DEN_MASK = 0xFFFFFFFF
+
+
+def fits_word(num, den):
+    """Return True if the reduced pair num/den (den > 0) can be packed into a single word."""
+    return NUM_MIN <= num <= NUM_MAX and den <= DEN_MAX
+
+
+def _make(num, den):
+    """Reduce num/den and return a SmallFraction, or a Fraction if it does not fit in a word."""
+    if den == 0:
+        raise DenominatorIsZero("le dénominateur ne peut pas être égal à zero ")
+    if den < 0:
+        num, den = -num, -den
+    g = gcd(num, den)
+    if g != 1:
+        num //= g
+        den //= g
+    if NUM_MIN <= num <= NUM_MAX and den <= DEN_MAX:
+        small = object.__new__(SmallFraction)
+        small._word = (num << 32) | den
+        return small
+    return Fraction._from_reduced(num, den)
+
+
+def _pair(other):
+    """Return (num, den) of an operand handled by the word fast path, or None."""
+    if type(other) is SmallFraction:
+        word = other._word
+        return word >> 32, word & _DEN_MASK
+    if type(other) is int:
+        return other, 1
+    return None
+
+
+class SmallFraction:
+    """Compact fraction packed into a single machine word
+
+    Les fractions dont la forme réduite a un numérateur sur 32 bits signés et un dénominateur
+    sur 32 bits non signés sont stockées dans un seul entier (une seule référence par
+    instance, pas de __dict__). Les opérations entre SmallFraction et entiers restent sur ce
+    chemin rapide ; un résultat qui ne tient plus dans un mot est promu automatiquement en
+    Fraction, tout comme une opération avec une Fraction ou un float.
+    """
+
+    __slots__ = ("_word",)
+
+    def __new__(cls, num=0, den=1):
+        """Build the packed form of num/den, or a Fraction if it does not fit in a word.
+
+        PRE : -
+        POST : renvoie une SmallFraction réduite, ou une Fraction si num/den réduite dépasse un mot
+        RAISE :
+            - TypeError si num ou den n'est pas un entier
+            - DenominatorIsZero si den vaut 0
+        """
+        if not isinstance(num, int) or not isinstance(den, int):
+            raise TypeError("Le numérateur et le dénominateur doivent être des entiers ")
+        return _make(num, den)
+
+    @staticmethod
+    def from_fraction(fraction):
+        """Pack a Fraction if it fits in a word.
+
+        PRE : fraction est une Fraction
+        POST : renvoie la SmallFraction de même valeur, ou fraction elle-même si elle dépasse un mot
+        """
+        if fits_word(fraction.numerator, fraction.denominator):
+            return _make(fraction.numerator, fraction.denominator)
+        return fraction
+
+    def __reduce__(self):
+        return SmallFraction, (self.numerator, self.denominator)
+
+    @property
+    def numerator(self):
+        return self._word >> 32
+
+    @property
+    def denominator(self):
+        return self._word & _DEN_MASK
+
+    def to_fraction(self):
+        """Return the equivalent arbitrary-precision Fraction.
+
+        PRE : -
+        POST : renvoie la Fraction de même valeur
+        """
+        word = self._word
+        return Fraction._from_reduced(word >> 32, word & _DEN_MASK)
+
+    # ------------------ Textual representations ------------------
+
+    def __str__(self):
+        """Return the same text as the equivalent Fraction ("num/den", or "num" for integers)."""
+        word = self._word
+        den = word & _DEN_MASK
+        return f"{word >> 32}" if den == 1 else f"{word >> 32}/{den}"
+
+    def __repr__(self):
+        return f"SmallFraction({self.numerator}, {self.denominator})"
+
+    # ------------------ Operators overloading ------------------
+
+    def __add__(self, other):
+        """Overloading of the + operator
+
+        PRE : -
+        POST : renvoie self + other, en SmallFraction si le résultat tient dans un mot, en Fraction sinon
+        RAISE : WrongTypeError si other n'est pas d'un type numérique accepté par Fraction
+        """
+        pair = _pair(other)
+        if pair is None:
+            return self.to_fraction() + other
+        word = self._word
+        num, den = word >> 32, word & _DEN_MASK
+        return _make(num * pair[1] + pair[0] * den, den * pair[1])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Overloading of the - operator
+
+        PRE : -
+        POST : renvoie self - other, en SmallFraction si le résultat tient dans un mot, en Fraction sinon
+        RAISE : WrongTypeError si other n'est pas d'un type numérique accepté par Fraction
+        """
+        pair = _pair(other)
+        if pair is None:
+            return self.to_fraction() - other
+        word = self._word
+        num, den = word >> 32, word & _DEN_MASK
+        return _make(num * pair[1] - pair[0] * den, den * pair[1])
+
+    def __rsub__(self, other):
+        pair = _pair(other)
+        if pair is None:
+            return other - self.to_fraction()
+        word = self._word
+        num, den = word >> 32, word & _DEN_MASK
+        return _make(pair[0] * den - num * pair[1], den * pair[1])
+
+    def __mul__(self, other):
+        """Overloading of the * operator
+
+        PRE : -
+        POST : renvoie self * other, en SmallFraction si le résultat tient dans un mot, en Fraction sinon
+        RAISE : WrongTypeError si other n'est pas d'un type numérique accepté par Fraction
+        """
+        pair = _pair(other)
+        if pair is None:
+            return self.to_fraction() * other
+        word = self._word
+        return _make((word >> 32) * pair[0], (word & _DEN_MASK) * pair[1])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """Overloading of the / operator
+
+        PRE : -
+        POST : renvoie self / other, en SmallFraction si le résultat tient dans un mot, en Fraction sinon
+        RAISE :
+            - WrongTypeError si other n'est pas d'un type numérique accepté par Fraction
+            - DenominatorIsZero si other vaut zero
+        """
+        pair = _pair(other)
+        if pair is None:
+            return self.to_fraction() / other
+        word = self._word
+        return _make((word >> 32) * pair[1], (word & _DEN_MASK) * pair[0])
+
+    def __rtruediv__(self, other):
+        pair = _pair(other)
+        if pair is None:
+            return other / self.to_fraction()
+        word = self._word
+        return _make(pair[0] * (word & _DEN_MASK), pair[1] * (word >> 32))
+
+    def __neg__(self):
+        word = self._word
+        return _make(-(word >> 32), word & _DEN_MASK)
+
+    def __float__(self):
+        word = self._word
+        return (word >> 32) / (word & _DEN_MASK)
+
+    # ------------------ Comparisons ------------------
+
+    def __eq__(self, other):
+        """Overloading of the == operator, identical to Fraction.__eq__ on the same value
+
+        PRE : -
+        POST : renvoie True si self et other ont la même valeur
+        RAISE : WrongTypeError si other n'est pas d'un type numérique accepté par Fraction
+        """
+        if type(other) is SmallFraction:
+            return self._word == other._word
+        return self.to_fraction() == other
+
+    def __lt__(self, other):
+        return self.to_fraction() < other
+
+    def __le__(self, other):
+        return self.to_fraction() <= other
+
+    def __gt__(self, other):
+        return self.to_fraction() > other
+
+    def __ge__(self, other):
+        return self.to_fraction() >= other
+
+
+class SmallFractionArray:
+    """Collection of fractions stored as packed words in an array('q')
+
+    Chaque élément occupe 8 octets. Une valeur qui ne tient pas dans un mot est stockée à part
+    (dans un dictionnaire indice -> Fraction) et son mot porte un dénominateur nul, impossible
+    pour une fraction valide : la collection accepte donc n'importe quelle fraction.
+    """
+
+    def __init__(self, values=()):
+        """Build the collection from an iterable of fractions or integers.
+
+        PRE : values est un itérable de Fraction, SmallFraction, int ou float
+        POST : crée la collection contenant les valeurs dans l'ordre
+        RAISE : WrongTypeError si une valeur n'est pas d'un type accepté
+        """
+        self._words = array("q")
+        self._overflow = {}
+        self.extend(values)
+
+    def append(self, value):
+        """Append one value at the end of the collection.
+
+        PRE : value est une Fraction, SmallFraction, int ou float
+        POST : value est ajoutée en fin de collection
+        RAISE : WrongTypeError si value n'est pas d'un type accepté
+        """
+        if type(value) is SmallFraction:
+            self._words.append(value._word)
+            return
+        value = Fraction._coerce(value)
+        num, den = value.numerator, value.denominator
+        if fits_word(num, den):
+            self._words.append((num << 32) | den)
+        else:
+            self._overflow[len(self._words)] = value
+            self._words.append(0)
+
+    def extend(self, values):
+        """Append all the values of an iterable.
+
+        PRE : values est un itérable de Fraction, SmallFraction, int ou float
+        POST : les valeurs sont ajoutées en fin de collection dans l'ordre
+        RAISE : WrongTypeError si une valeur n'est pas d'un type accepté
+        """
+        for value in values:
+            self.append(value)
+
+    def __len__(self):
+        return len(self._words)
+
+    def __getitem__(self, index):
+        """Return the element at index, as a SmallFraction or a promoted Fraction, or a new array for a slice.
+
+        PRE : index est un entier (éventuellement négatif) ou une tranche
+        POST : renvoie la valeur stockée à cet indice, ou une nouvelle SmallFractionArray
+               contenant les valeurs de la tranche
+        RAISE :
+            - IndexError si l'indice est hors limites
+            - TypeError si index n'est ni un entier ni une tranche
+        """
+        if isinstance(index, slice):
+            positions = range(len(self._words))[index]
+            result = SmallFractionArray()
+            result._words = self._words[index]
+            result._overflow = {positions.index(position): value for position, value in self._overflow.items()
+                                if position in positions}
+            return result
+        word = self._words[index]
+        if word & _DEN_MASK == 0:
+            return self._overflow[index % len(self._words)]
+        small = object.__new__(SmallFraction)
+        small._word = word
+        return small
+
+    def __iter__(self):
+        overflow = self._overflow
+        for index, word in enumerate(self._words):
+            if word & _DEN_MASK == 0:
+                yield overflow[index]
+            else:
+                small = object.__new__(SmallFraction)
+                small._word = word
+                yield small
+
+    def sum(self):
+        """Return the exact sum of the collection, computed on integers.
+
+        Les mots sont décodés sans créer de SmallFraction : leurs numérateurs sont cumulés
+        par dénominateur, avec ceux des valeurs promues, puis les groupes sont réunis par
+        Fraction._accumulate ; seul le total est réduit (et empaqueté s'il tient dans un mot).
+
+        PRE : -
+        POST : renvoie la somme exacte, en SmallFraction si elle tient dans un mot, en Fraction sinon
+        """
+        by_denominator = {}
+        get = by_denominator.get
+        for word in self._words:
+            den = word & _DEN_MASK
+            if den:
+                by_denominator[den] = get(den, 0) + (word >> 32)
+        for value in self._overflow.values():
+            by_denominator[value.denominator] = get(value.denominator, 0) + value.numerator
+        return _make(*Fraction._accumulate((n, d) for d, n in by_denominator.items()))
+
+    def memory_bytes(self):
+        """Return the memory used by the packed storage and the promoted values.
+
+        PRE : -
+        POST : renvoie le nombre d'octets estimé
+        """
+        total = sys.getsizeof(self._words) + sys.getsizeof(self._overflow)
+        for value in self._overflow.values():
+            total += sys.getsizeof(value) + sys.getsizeof(value.numerator) + sys.getsizeof(value.denominator)
+        return total
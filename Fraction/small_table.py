@@ -0,0 +1,186 @@
+import os
+import sys
+import threading
+import time
+from array import array
+from math import gcd
+
+from .core import Fraction
+
+_CACHE_MAGIC = b"FRACTAB1"
+_install_lock = threading.Lock()
+
+
+class SmallFractionTable:
+    """Precomputed reduced forms and canonical instances of the small fractions
+
+    La table couvre toutes les fractions num/den avec |num| <= limit et 0 < den <= limit.
+    L'entrée d'indice den * width + num + limit (width = 2 * limit + 1) contient l'instance
+    canonique de la forme réduite de num/den : deux écritures d'une même valeur partagent
+    la même instance. Le constructeur de Fraction y cherche d'abord son résultat.
+
+    Une fois construite, la table n'est plus modifiée et peut être lue par plusieurs threads
+    sans verrou. Seuls les compteurs hits et misses sont incrémentés sans synchronisation :
+    sous forte concurrence ils peuvent perdre quelques incréments (taux de succès approché).
+    """
+
+    def __init__(self, limit, canonical_index=None):
+        """Build the table, optionally from a precomputed array of canonical indexes.
+
+        PRE : limit est un entier >= 1, canonical_index est None ou un array d'indices
+              renvoyé par _canonical_index(limit)
+        POST : crée la table complète des instances canoniques
+        """
+        start = time.perf_counter()
+        self.limit = limit
+        self.width = 2 * limit + 1
+        if canonical_index is None:
+            canonical_index = _canonical_index(limit)
+        self.canonical_index = canonical_index
+
+        build = Fraction._from_reduced
+        width = self.width
+        instances = [None] * len(canonical_index)
+        for index, canonical in enumerate(canonical_index):
+            if canonical == index and index >= width:
+                den, num = divmod(index, width)
+                instances[index] = build(num - limit, den)
+        self.instances = [instances[canonical] for canonical in canonical_index]
+        self.hits = 0
+        self.misses = 0
+        self.build_seconds = time.perf_counter() - start
+
+    def memory_bytes(self):
+        """Return an estimate of the memory used by the table (list, instances and their integers).
+
+        PRE : -
+        POST : renvoie le nombre d'octets estimé
+        """
+        total = sys.getsizeof(self.instances) + self.canonical_index.itemsize * len(self.canonical_index)
+        seen = set()
+        for instance in self.instances:
+            if instance is not None and id(instance) not in seen:
+                seen.add(id(instance))
+                total += sys.getsizeof(instance) + sys.getsizeof(instance.__dict__)
+        return total
+
+    def stats(self):
+        """Return the build time, memory cost and hit rate of the table.
+
+        PRE : -
+        POST : renvoie un dictionnaire des mesures de la table
+        """
+        lookups = self.hits + self.misses
+        return {
+            "limit": self.limit,
+            "entries": len(self.instances) - self.width,
+            "build_seconds": self.build_seconds,
+            "memory_bytes": self.memory_bytes(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def save(self, path):
+        """Write the canonical indexes of the table to a cache file.
+
+        PRE : path est un chemin de fichier accessible en écriture
+        POST : le fichier contient la limite et les indices canoniques de la table
+        """
+        # Écriture dans un fichier temporaire puis renommage atomique : un autre processus
+        # ou thread ne peut jamais lire un cache à moitié écrit
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as cache:
+            cache.write(_CACHE_MAGIC)
+            array("q", [self.limit]).tofile(cache)
+            self.canonical_index.tofile(cache)
+        os.replace(temporary, path)
+
+    @staticmethod
+    def load(path, limit):
+        """Load a table from a cache file written by save.
+
+        PRE : path est un fichier écrit par save
+        POST : renvoie la table, ou None si le fichier ne correspond pas à limit ou s'il est
+               tronqué (écriture interrompue) : le cache est alors à reconstruire
+        """
+        with open(path, "rb") as cache:
+            if cache.read(len(_CACHE_MAGIC)) != _CACHE_MAGIC:
+                return None
+            try:
+                header = array("q")
+                header.fromfile(cache, 1)
+                if header[0] != limit:
+                    return None
+                canonical_index = array(_index_typecode(limit))
+                canonical_index.fromfile(cache, (limit + 1) * (2 * limit + 1))
+            except (EOFError, ValueError):  # Fichier tronqué, éventuellement au milieu d'un indice
+                return None
+        return SmallFractionTable(limit, canonical_index)
+
+
+def _index_typecode(limit):
+    return "i" if (limit + 1) * (2 * limit + 1) < 2 ** 31 else "q"
+
+
+def _canonical_index(limit):
+    """Return, for every entry num/den of the table, the index of its reduced form.
+
+    La ligne den = 0 n'est pas utilisée (indices laissés à 0).
+    """
+    width = 2 * limit + 1
+    canonical_index = array(_index_typecode(limit), bytes(array(_index_typecode(limit)).itemsize * width))
+    for den in range(1, limit + 1):
+        row = []
+        for num in range(-limit, limit + 1):
+            divisor = gcd(num, den)
+            row.append((den // divisor) * width + num // divisor + limit)
+        canonical_index.extend(row)
+    return canonical_index
+
+
+def enable_small_table(limit=256, cache_path=None):
+    """Build (or load from cache_path) the small fraction table and install it in Fraction.
+
+    Si cache_path est donné et contient une table de même limite, elle est chargée ;
+    sinon (fichier absent, d'une autre limite ou tronqué) la table est construite puis
+    écrite dans cache_path.
+
+    PRE : limit est un entier >= 1
+    POST : le constructeur et les opérateurs de Fraction consultent la table ; elle est renvoyée
+    RAISE :
+        - TypeError si limit n'est pas un entier
+        - ValueError si limit < 1
+    """
+    if not isinstance(limit, int) or isinstance(limit, bool):
+        raise TypeError(f"{limit} n'est pas un entier")
+    if limit < 1:
+        raise ValueError("La limite de la table doit être >= 1")
+
+    with _install_lock:
+        table = None
+        if cache_path is not None and os.path.exists(cache_path):
+            table = SmallFractionTable.load(cache_path, limit)
+        if table is None:
+            table = SmallFractionTable(limit)
+            if cache_path is not None:
+                table.save(cache_path)
+        # Une seule affectation : les threads voient l'ancienne ou la nouvelle table, jamais un état partiel
+        Fraction._small_table = table
+    return table
+
+
+def disable_small_table():
+    """Uninstall the small fraction table.
+
+    PRE : -
+    POST : le constructeur de Fraction ne consulte plus aucune table
+    """
+    with _install_lock:
+        Fraction._small_table = None
+
+
+def small_table_stats():
+    """Return the statistics of the installed table, or None if no table is installed."""
+    table = Fraction._small_table
+    return None if table is None else table.stats()
@@ -0,0 +1,380 @@
+import heapq
+import os
+import tempfile
+from bisect import bisect_left, bisect_right
+from itertools import chain, compress, count, islice
+from operator import eq
+
+from .core import Fraction
+
+
+def float_key(fraction):
+    """Return an approximation of the fraction usable as a sort key.
+
+    L'arrondi d'un quotient d'entiers en float est croissant : si float_key(a) < float_key(b)
+    alors a < b. Seules les égalités de clés demandent une comparaison exacte.
+
+    PRE : fraction est une Fraction
+    POST : renvoie numerator / denominator, ou +/- inf si le quotient dépasse les floats
+    """
+    return Fraction._to_float(fraction.numerator, fraction.denominator)
+
+
+def _fast_key(fraction):
+    return fraction.numerator / fraction.denominator
+
+
+def _sort_with_keys(fractions):
+    """Sort fractions exactly and return (sorted fractions, their float keys).
+
+    Les fractions sont d'abord triées sur leur clé float seule (comparaisons de floats en C).
+    Le quotient étant correctement arrondi, deux clés différentes sont déjà dans le bon ordre :
+    seules les plages de clés égales (valeurs identiques ou trop proches pour les floats) sont
+    ensuite retriées exactement par produit en croix.
+    """
+    values = list(fractions)
+    try:
+        keys = [fraction.numerator / fraction.denominator for fraction in values]
+        values.sort(key=_fast_key)
+    except OverflowError:
+        keys = [float_key(fraction) for fraction in values]
+        values.sort(key=float_key)
+    keys.sort()  # Mêmes clés que celles des valeurs triées, dans le même ordre
+    ties = list(compress(count(1), map(eq, keys, islice(keys, 1, None))))
+    start = None
+    for position, index in enumerate(ties):
+        if start is None:
+            start = index - 1
+        if position + 1 == len(ties) or ties[position + 1] != index + 1:
+            values[start:index + 1] = sorted(values[start:index + 1])
+            start = None
+    return values, keys
+
+
+def sort_exact(fractions, reverse=False):
+    """Return a new list of the fractions sorted in exact order.
+
+    Tri sur les clés float, puis retri exact des seules plages de clés égales.
+
+    PRE : fractions est un itérable de Fraction
+    POST : renvoie la liste triée par ordre croissant (décroissant si reverse)
+    """
+    values = _sort_with_keys(fractions)[0]
+    if reverse:
+        values.reverse()
+    return values
+
+
+def _write_run(directory, index, fractions):
+    """Write a sorted run to a text file, one "num den" line in hexadecimal per fraction."""
+    path = os.path.join(directory, f"run{index}.txt")
+    with open(path, "w", encoding="ascii") as file:
+        file.writelines(f"{fraction.numerator:x} {fraction.denominator:x}\n" for fraction in fractions)
+    return path
+
+
+def _read_run(path):
+    """Generate the (float key, fraction) pairs of a run file."""
+    build = Fraction._from_reduced
+    to_float = Fraction._to_float
+    with open(path, encoding="ascii") as file:
+        for line in file:
+            num, den = line.split()
+            num, den = int(num, 16), int(den, 16)
+            yield to_float(num, den), build(num, den)
+
+
+def external_sort(fractions, chunk_size=1_000_000, directory=None):
+    """Sort an iterable of fractions too large for memory, by external merge sort.
+
+    Les valeurs sont lues par blocs de chunk_size, chaque bloc est trié en mémoire puis écrit
+    dans un fichier temporaire avant la lecture du bloc suivant ; les fichiers sont ensuite
+    fusionnés (heapq.merge) sur les couples (clé float, fraction). Au plus un bloc de
+    chunk_size valeurs (pendant le découpage), puis une ligne par fichier (pendant la fusion)
+    résident en mémoire. Les fichiers sont supprimés quand l'itération se termine ou est abandonnée.
+
+    PRE : fractions est un itérable de Fraction, int ou float, chunk_size est un entier >= 1,
+          directory est None ou le répertoire des fichiers temporaires
+    POST : renvoie un itérateur sur les fractions en ordre croissant exact
+    RAISE :
+        - ValueError si chunk_size n'est pas un entier >= 1
+        - WrongTypeError si une valeur est différente de int, float ou une Fraction
+    """
+    if not isinstance(chunk_size, int) or isinstance(chunk_size, bool) or chunk_size < 1:
+        raise ValueError("La taille des blocs doit être un entier >= 1")
+    return _external_sort(fractions, chunk_size, directory)
+
+
+def _external_sort(fractions, chunk_size, directory):
+    coerce = Fraction._coerce
+    values = iter(fractions)
+    first = _sort_with_keys(map(coerce, islice(values, chunk_size)))[0]
+    end = object()
+    following = next(values, end)  # Une seule valeur lue d'avance : y a-t-il plus d'un bloc ?
+    if following is end:
+        yield from first  # Tout tient dans un seul bloc : aucun fichier
+        return
+    values = chain([following], values)
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        # Chaque bloc est écrit avant la lecture du suivant : un seul bloc réside en mémoire
+        paths = [_write_run(tmp, 0, first)]
+        del first
+        for chunk in iter(lambda: _sort_with_keys(map(coerce, islice(values, chunk_size)))[0], []):
+            paths.append(_write_run(tmp, len(paths), chunk))
+        for _, fraction in heapq.merge(*map(_read_run, paths)):
+            yield fraction
+
+
+class SortedFractionList:
+    """Sorted multiset of fractions with logarithmic rank and range queries
+
+    Les fractions sont rangées dans une liste de blocs triés d'au plus 2 * LOAD éléments.
+    Chaque bloc garde en parallèle les clés float de ses éléments : la recherche se fait par
+    bisection sur ces clés et ne compare exactement (produit en croix) que les clés égales.
+    Un arbre de Fenwick sur la taille des blocs donne le rang et le k-ième élément en O(log n).
+    """
+
+    LOAD = 500
+
+    def __init__(self, fractions=()):
+        """Build a sorted list from an unsorted iterable in O(n log n).
+
+        PRE : fractions est un itérable de Fraction, int ou float
+        POST : crée une liste triée contenant les valeurs données
+        RAISE :
+            - WrongTypeError si une valeur est différente de int, float ou une Fraction
+        """
+        values, keys = _sort_with_keys(Fraction._coerce(value) for value in fractions)
+        load = self.LOAD
+        self.__values = [values[i:i + load] for i in range(0, len(values), load)]
+        self.__keys = [keys[i:i + load] for i in range(0, len(keys), load)]
+        self.__size = len(values)
+        self.__build_index()
+
+    def __len__(self):
+        return self.__size
+
+    def __iter__(self):
+        return chain.from_iterable(self.__values)
+
+    def __reversed__(self):
+        for block in reversed(self.__values):
+            yield from reversed(block)
+
+    def __contains__(self, value):
+        value = Fraction._coerce(value)
+        block, position = self.__locate(value, float_key(value), right=False)
+        return block < len(self.__values) and self.__values[block][position] == value
+
+    def __getitem__(self, index):
+        """Return the index-th smallest fraction (negative indexes count from the end).
+
+        RAISE :
+            - IndexError si l'indice est hors limites
+        """
+        if index < 0:
+            index += self.__size
+        if not 0 <= index < self.__size:
+            raise IndexError("Indice hors limites")
+        block, position = self.__find_kth(index)
+        return self.__values[block][position]
+
+    # ------------------ Updates ------------------
+
+    def add(self, value):
+        """Insert a fraction in O(log n).
+
+        PRE : -
+        POST : value est insérée à sa place (les doublons sont conservés)
+        RAISE :
+            - WrongTypeError si value est différente de int, float ou une Fraction
+        """
+        value = Fraction._coerce(value)
+        key = float_key(value)
+        if not self.__values:
+            self.__values.append([value])
+            self.__keys.append([key])
+            self.__size = 1
+            self.__build_index()
+            return
+
+        block, position = self.__locate(value, key, right=True)
+        if block == len(self.__values):
+            block, position = block - 1, len(self.__values[block - 1])
+        self.__values[block].insert(position, value)
+        self.__keys[block].insert(position, key)
+        self.__size += 1
+
+        if len(self.__values[block]) > 2 * self.LOAD:
+            half = self.LOAD
+            self.__values[block + 1:block + 1] = [self.__values[block][half:]]
+            self.__keys[block + 1:block + 1] = [self.__keys[block][half:]]
+            del self.__values[block][half:]
+            del self.__keys[block][half:]
+            self.__build_index()
+        else:
+            self.__update_index(block, 1)
+
+    def remove(self, value):
+        """Remove one occurrence of a fraction in O(log n).
+
+        PRE : -
+        POST : une occurrence de value est retirée
+        RAISE :
+            - ValueError si value n'est pas présente
+            - WrongTypeError si value est différente de int, float ou une Fraction
+        """
+        value = Fraction._coerce(value)
+        block, position = self.__locate(value, float_key(value), right=False)
+        if block == len(self.__values) or not self.__values[block][position] == value:
+            raise ValueError(f"{value} n'est pas dans la liste")
+        del self.__values[block][position]
+        del self.__keys[block][position]
+        self.__size -= 1
+
+        length = len(self.__values[block])
+        if length == 0 or (length < self.LOAD // 2 and len(self.__values) > 1):
+            self.__merge_block(block)
+            self.__build_index()
+        else:
+            self.__update_index(block, -1)
+
+    def discard(self, value):
+        """Remove one occurrence of a fraction if it is present.
+
+        PRE : -
+        POST : une occurrence de value est retirée si elle était présente
+        """
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+
+    # ------------------ Queries ------------------
+
+    def rank(self, value):
+        """Return the number of stored fractions strictly lower than value in O(log n).
+
+        PRE : -
+        POST : renvoie le rang de value (position où elle serait insérée à gauche)
+        RAISE :
+            - WrongTypeError si value est différente de int, float ou une Fraction
+        """
+        value = Fraction._coerce(value)
+        block, position = self.__locate(value, float_key(value), right=False)
+        return self.__prefix(block) + position
+
+    def irange(self, low=None, high=None, inclusive=(True, True)):
+        """Iterate in increasing order over the fractions between low and high.
+
+        PRE : low et high sont des Fraction, int, float ou None (pas de borne)
+        POST :
+            - génère les fractions x telles que low <= x <= high, les bornes étant
+              exclues selon inclusive = (inclure_low, inclure_high)
+        RAISE :
+            - WrongTypeError si une borne est différente de int, float, une Fraction ou None
+        """
+        if low is None:
+            block, position = 0, 0
+        else:
+            low = Fraction._coerce(low)
+            block, position = self.__locate(low, float_key(low), right=not inclusive[0])
+        if high is None:
+            stop = self.__size
+        else:
+            high = Fraction._coerce(high)
+            stop = self.rank(high) if not inclusive[1] else self.__rank_right(high)
+
+        remaining = stop - self.__prefix(block) - position
+        while remaining > 0 and block < len(self.__values):
+            chunk = self.__values[block][position:position + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            block, position = block + 1, 0
+
+    # ------------------ Helpers ------------------
+
+    def __rank_right(self, value):
+        block, position = self.__locate(value, float_key(value), right=True)
+        return self.__prefix(block) + position
+
+    def __locate(self, value, key, right):
+        """Return (block, position) of the bisection point of value.
+
+        Si right est faux, la position précède les éléments égaux à value, sinon elle les suit.
+        Renvoie (nombre de blocs, 0) si value est plus grande que tous les éléments.
+        """
+        keys, values = self.__keys, self.__values
+        for block in range(bisect_left(self.__maxes, key), len(keys)):
+            block_keys, block_values = keys[block], values[block]
+            lo = bisect_left(block_keys, key)
+            hi = bisect_right(block_keys, key, lo)
+            # Recherche exacte parmi les clés float égales
+            num, den = value.numerator, value.denominator
+            while lo < hi:
+                middle = (lo + hi) // 2
+                other = block_values[middle]
+                difference = other.numerator * den - num * other.denominator
+                if difference < 0 or (right and difference == 0):
+                    lo = middle + 1
+                else:
+                    hi = middle
+            if lo < len(block_keys):
+                return block, lo
+        return len(keys), 0
+
+    def __merge_block(self, block):
+        """Merge a block that became too small into a neighbour (or drop it if empty)."""
+        if not self.__values[block]:
+            del self.__values[block]
+            del self.__keys[block]
+            return
+        neighbour = block - 1 if block > 0 else block + 1
+        first, second = min(block, neighbour), max(block, neighbour)
+        self.__values[first].extend(self.__values[second])
+        self.__keys[first].extend(self.__keys[second])
+        del self.__values[second]
+        del self.__keys[second]
+        if len(self.__values[first]) > 2 * self.LOAD:
+            half = len(self.__values[first]) // 2
+            self.__values[first + 1:first + 1] = [self.__values[first][half:]]
+            self.__keys[first + 1:first + 1] = [self.__keys[first][half:]]
+            del self.__values[first][half:]
+            del self.__keys[first][half:]
+
+    def __build_index(self):
+        """Rebuild the block maxima and the Fenwick tree of block sizes in O(number of blocks)."""
+        self.__maxes = [block[-1] for block in self.__keys]
+        tree = [0] + [len(block) for block in self.__values]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.__tree = tree
+
+    def __update_index(self, block, delta):
+        self.__maxes[block] = self.__keys[block][-1]
+        i = block + 1
+        while i < len(self.__tree):
+            self.__tree[i] += delta
+            i += i & -i
+
+    def __prefix(self, block):
+        """Return the number of elements stored in the blocks before block."""
+        total, i = 0, block
+        while i > 0:
+            total += self.__tree[i]
+            i -= i & -i
+        return total
+
+    def __find_kth(self, index):
+        """Return (block, position) of the element of given index by descending the Fenwick tree."""
+        tree = self.__tree
+        block, step = 0, 1 << (len(tree).bit_length())
+        while step:
+            following = block + step
+            if following < len(tree) and tree[following] <= index:
+                block = following
+                index -= tree[following]
+            step >>= 1
+        return block, index
@@ -0,0 +1,364 @@
+import random
+
+from .core import Fraction
+
+DEFAULT_BUFFER_SIZE = 4096
+
+
+class StatisticsError(ValueError):
+    """Raised when a statistic is not defined for the given data (empty data, negative weight, ...)."""
+
+
+def _add(pair, num, den):
+    """Add num/den to one of the running (num, den) sums of an accumulator."""
+    return Fraction._accumulate(((num, den),), *pair)
+
+
+def _weight(weight):
+    weight = Fraction._coerce(weight)
+    if weight.numerator < 0:
+        raise StatisticsError(f"Le poids {weight} est négatif")
+    return weight
+
+
+class MomentAccumulator:
+    """Single-pass exact accumulator of the count, mean and variance of a stream
+
+    Seules trois sommes exactes sont conservées (poids, valeurs pondérées, carrés pondérés),
+    sous forme d'entiers sur un dénominateur commun : la mémoire ne dépend pas du nombre de
+    valeurs. Deux accumulateurs remplis sur des morceaux différents se fusionnent avec merge,
+    ce qui permet de traiter les morceaux en parallèle.
+    """
+
+    def __init__(self, values=()):
+        """Build an accumulator, optionally fed with an iterable of values of weight 1.
+
+        PRE : values est un itérable de Fraction, int ou float
+        POST : crée l'accumulateur des valeurs données
+        RAISE : WrongTypeError si une valeur n'est pas d'un type accepté
+        """
+        self.count = 0
+        self.__weight = (0, 1)
+        self.__sum = (0, 1)
+        self.__squares = (0, 1)
+        self.update(values)
+
+    def add(self, value, weight=1):
+        """Add one value with an optional weight (frequency).
+
+        PRE : value et weight sont des Fraction, int ou float, weight >= 0
+        POST : la valeur est prise en compte avec son poids
+        RAISE :
+            - WrongTypeError si value ou weight n'est pas d'un type accepté
+            - StatisticsError si le poids est négatif
+        """
+        value = Fraction._coerce(value)
+        num, den = value.numerator, value.denominator
+        self.count += 1
+        if type(weight) is int and weight == 1:
+            self.__weight = (self.__weight[0] + self.__weight[1], self.__weight[1])
+            self.__sum = _add(self.__sum, num, den)
+            self.__squares = _add(self.__squares, num * num, den * den)
+            return
+        weight = _weight(weight)
+        w_num, w_den = weight.numerator, weight.denominator
+        self.__weight = _add(self.__weight, w_num, w_den)
+        self.__sum = _add(self.__sum, num * w_num, den * w_den)
+        self.__squares = _add(self.__squares, num * num * w_num, den * den * w_den)
+
+    def update(self, values):
+        """Add every value of an iterable with weight 1.
+
+        PRE : values est un itérable de Fraction, int ou float
+        POST : les valeurs sont prises en compte
+        RAISE : WrongTypeError si une valeur n'est pas d'un type accepté
+        """
+        coerce = Fraction._coerce
+        values = [coerce(value) for value in values]
+        if not values:
+            return
+        self.count += len(values)
+        w_num, w_den = self.__weight
+        self.__weight = (w_num + len(values) * w_den, w_den)
+        self.__sum = Fraction._accumulate(((x.numerator, x.denominator) for x in values), *self.__sum)
+        self.__squares = Fraction._accumulate(
+            ((x.numerator * x.numerator, x.denominator * x.denominator) for x in values), *self.__squares)
+
+    def update_weighted(self, pairs):
+        """Add every (value, weight) pair of an iterable.
+
+        PRE : pairs est un itérable de couples (valeur, poids >= 0)
+        POST : les valeurs sont prises en compte avec leurs poids
+        RAISE :
+            - WrongTypeError si une valeur ou un poids n'est pas d'un type accepté
+            - StatisticsError si un poids est négatif
+        """
+        for value, weight in pairs:
+            self.add(value, weight)
+
+    def merge(self, other):
+        """Merge the values of another accumulator into this one.
+
+        PRE : other est un MomentAccumulator
+        POST : self contient les valeurs des deux accumulateurs ; renvoie self
+        """
+        self.count += other.count
+        self.__weight = _add(self.__weight, *other.__weight)
+        self.__sum = _add(self.__sum, *other.__sum)
+        self.__squares = _add(self.__squares, *other.__squares)
+        return self
+
+    @property
+    def total_weight(self):
+        return Fraction._from_pair(*self.__weight)
+
+    def mean(self):
+        """Return the exact (weighted) mean.
+
+        PRE : -
+        POST : renvoie somme(w * x) / somme(w) de type Fraction
+        RAISE : StatisticsError si le poids total est nul
+        """
+        (s_num, s_den), (w_num, w_den) = self.__sum, self.__weight
+        if w_num == 0:
+            raise StatisticsError("La moyenne d'un ensemble vide n'est pas définie")
+        return Fraction._from_pair(s_num * w_den, s_den * w_num)
+
+    def pvariance(self):
+        """Return the exact population variance somme(w * (x - moyenne)²) / somme(w).
+
+        PRE : -
+        POST : renvoie la variance de type Fraction
+        RAISE : StatisticsError si le poids total est nul
+        """
+        mean = self.mean()
+        (q_num, q_den), (w_num, w_den) = self.__squares, self.__weight
+        # Q / W - moyenne²
+        num = q_num * w_den * mean.denominator ** 2 - mean.numerator ** 2 * q_den * w_num
+        return Fraction._from_pair(num, q_den * w_num * mean.denominator ** 2)
+
+    def variance(self):
+        """Return the exact sample variance somme(w * (x - moyenne)²) / (somme(w) - 1).
+
+        Les poids sont des effectifs : une valeur de poids 3 compte comme trois valeurs.
+
+        PRE : -
+        POST : renvoie la variance de l'échantillon de type Fraction
+        RAISE : StatisticsError si le poids total est inférieur ou égal à 1
+        """
+        w_num, w_den = self.__weight
+        if w_num <= w_den:
+            raise StatisticsError("La variance d'un échantillon demande un poids total > 1")
+        population = self.pvariance()
+        # pvariance * W / (W - 1)
+        return Fraction._from_pair(population.numerator * w_num, population.denominator * (w_num - w_den))
+
+
+# ------------------ Selection in bounded memory ------------------
+
+def _source(data):
+    """Return a function giving a fresh iterator over data at each pass.
+
+    Une fonction sans argument est appelée à chaque passe (flux relu depuis un fichier, ...) ;
+    une séquence est simplement parcourue à nouveau. Un itérateur à usage unique ne peut
+    pas être relu : il est alors chargé en mémoire.
+    """
+    if callable(data):
+        return data
+    if iter(data) is data:
+        data = list(data)
+    return lambda: iter(data)
+
+
+def _weighted_items(source, weighted):
+    """Return a function giving fresh iterators of (Fraction, weight) pairs."""
+    if weighted:
+        return lambda: ((Fraction._coerce(value), _weight(weight)) for value, weight in source())
+    return lambda: ((Fraction._coerce(value), 1) for value in source())
+
+
+def _select(items, target, buffer_size, rng):
+    """Return the smallest value whose cumulative weight is positive and reaches target.
+
+    Sélection par passes successives : chaque passe ne garde qu'un échantillon (réservoir)
+    de buffer_size valeurs de chaque côté d'un pivot, et compte les poids de part et
+    d'autre. L'intervalle ]low, high[ qui contient la valeur cherchée se resserre autour du
+    pivot ; dès qu'il contient au plus buffer_size valeurs, elles sont toutes en mémoire et
+    triées. La mémoire reste en O(buffer_size) quelle que soit la taille des données.
+    """
+    def reached(cumulative):
+        return cumulative >= target and cumulative > 0
+
+    low = high = pivot = None
+    below = 0  # Poids total des valeurs <= low
+    while True:
+        reservoirs = ([], [])  # Échantillons des valeurs sous le pivot et au-dessus
+        counts, weights, equal = [0, 0], [0, 0], 0
+        for value, weight in items():
+            if (low is not None and value <= low) or (high is not None and value >= high):
+                continue
+            if pivot is not None and value == pivot:
+                equal += weight
+                continue
+            side = 1 if pivot is not None and value > pivot else 0
+            counts[side] += 1
+            weights[side] += weight
+            reservoir = reservoirs[side]
+            if len(reservoir) < buffer_size:
+                reservoir.append((value, weight))
+            else:
+                index = rng.randrange(counts[side])
+                if index < buffer_size:
+                    reservoir[index] = (value, weight)
+        if pivot is None:
+            side = 0
+        elif reached(below + weights[0]):
+            side, high = 0, pivot
+        elif reached(below + weights[0] + equal):
+            return pivot
+        else:
+            side, low = 1, pivot
+            below += weights[0] + equal
+        reservoir = sorted(reservoirs[side], key=lambda pair: pair[0])
+        if not reservoir:
+            raise StatisticsError("Le poids total est inférieur à la valeur cherchée")
+        if counts[side] <= buffer_size:
+            cumulative = below
+            for value, weight in reservoir:
+                cumulative += weight
+                if reached(cumulative):
+                    return value
+            raise StatisticsError("Le poids total est inférieur à la valeur cherchée")
+        # Pivot placé dans l'échantillon à la position relative du poids cherché
+        position = (target - below) * len(reservoir) // weights[side] if weights[side] != 0 else 0
+        pivot = reservoir[min(max(position, 0), len(reservoir) - 1)][0]
+
+
+def _totals(items):
+    count, total = 0, 0
+    for _, weight in items():
+        count += 1
+        total += weight
+    return count, total
+
+
+def quantile(data, q, buffer_size=DEFAULT_BUFFER_SIZE, seed=None):
+    """Return the exact q-quantile of data, interpolated between order statistics.
+
+    Avec n valeurs triées x[0] <= ... <= x[n - 1] et h = (n - 1) * q, le résultat vaut
+    x[floor(h)] + (h - floor(h)) * (x[floor(h) + 1] - x[floor(h)]) (méthode linéaire usuelle).
+    Les statistiques d'ordre sont obtenues par sélection, sans trier toutes les données.
+
+    PRE : data est une séquence, une fonction sans argument renvoyant un nouvel itérateur à
+          chaque appel (données relues sans les garder en mémoire) ou un itérateur (chargé en
+          mémoire) de Fraction, int ou float ; q est une Fraction, un int ou un float dans [0, 1]
+    POST : renvoie le quantile exact de type Fraction
+    RAISE :
+        - StatisticsError si data est vide ou si q n'est pas dans [0, 1]
+        - WrongTypeError si une valeur n'est pas d'un type accepté
+    """
+    q = Fraction._coerce(q)
+    if q < 0 or q > 1:
+        raise StatisticsError(f"Le quantile {q} n'est pas dans [0, 1]")
+    items = _weighted_items(_source(data), False)
+    count, _ = _totals(items)
+    if count == 0:
+        raise StatisticsError("Le quantile d'un ensemble vide n'est pas défini")
+    rng = random.Random(seed)
+    h = q * (count - 1)
+    index = h.numerator // h.denominator
+    lower = _select(items, index + 1, buffer_size, rng)
+    fraction = h - index
+    if fraction.is_zero():
+        return lower
+    upper = _select(items, index + 2, buffer_size, rng)
+    return lower + fraction * (upper - lower)
+
+
+def median(data, buffer_size=DEFAULT_BUFFER_SIZE, seed=None):
+    """Return the exact median of data (mean of the two middle values for an even count).
+
+    PRE : data comme pour quantile
+    POST : renvoie la médiane exacte de type Fraction
+    RAISE :
+        - StatisticsError si data est vide
+        - WrongTypeError si une valeur n'est pas d'un type accepté
+    """
+    return quantile(data, Fraction(1, 2), buffer_size, seed)
+
+
+def weighted_quantile(pairs, q, buffer_size=DEFAULT_BUFFER_SIZE, seed=None):
+    """Return the smallest value whose cumulative weight reaches q times the total weight.
+
+    PRE : pairs est une séquence, une fonction sans argument renvoyant un nouvel itérateur ou
+          un itérateur de couples (valeur, poids >= 0) ; q est dans [0, 1]
+    POST : renvoie le quantile pondéré exact (la plus petite valeur de poids non nul si q = 0)
+    RAISE :
+        - StatisticsError si le poids total est nul, si un poids est négatif
+          ou si q n'est pas dans [0, 1]
+        - WrongTypeError si une valeur ou un poids n'est pas d'un type accepté
+    """
+    q = Fraction._coerce(q)
+    if q < 0 or q > 1:
+        raise StatisticsError(f"Le quantile {q} n'est pas dans [0, 1]")
+    items = _weighted_items(_source(pairs), True)
+    total = _totals(items)[1]
+    if total == 0:
+        raise StatisticsError("Le quantile d'un ensemble de poids nul n'est pas défini")
+    return _select(items, q * total, buffer_size, random.Random(seed))
+
+
+def weighted_median(pairs, buffer_size=DEFAULT_BUFFER_SIZE, seed=None):
+    """Return the weighted median: the smallest value reaching half of the total weight.
+
+    PRE : pairs comme pour weighted_quantile
+    POST : renvoie la médiane pondérée exacte
+    RAISE :
+        - StatisticsError si le poids total est nul ou si un poids est négatif
+        - WrongTypeError si une valeur ou un poids n'est pas d'un type accepté
+    """
+    return weighted_quantile(pairs, Fraction(1, 2), buffer_size, seed)
+
+
+# ------------------ Single-pass shortcuts ------------------
+
+def mean(values):
+    """Return the exact mean of an iterable in a single pass and constant memory.
+
+    PRE : values est un itérable de Fraction, int ou float
+    POST : renvoie la moyenne exacte de type Fraction
+    RAISE : StatisticsError si values est vide
+    """
+    return MomentAccumulator(values).mean()
+
+
+def variance(values):
+    """Return the exact sample variance of an iterable in a single pass.
+
+    PRE : values est un itérable de Fraction, int ou float
+    POST : renvoie la variance de l'échantillon de type Fraction
+    RAISE : StatisticsError si values contient moins de deux valeurs
+    """
+    return MomentAccumulator(values).variance()
+
+
+def pvariance(values):
+    """Return the exact population variance of an iterable in a single pass.
+
+    PRE : values est un itérable de Fraction, int ou float
+    POST : renvoie la variance de la population de type Fraction
+    RAISE : StatisticsError si values est vide
+    """
+    return MomentAccumulator(values).pvariance()
+
+
+def weighted_mean(pairs):
+    """Return the exact weighted mean of (value, weight) pairs in a single pass.
+
+    PRE : pairs est un itérable de couples (valeur, poids >= 0)
+    POST : renvoie somme(w * x) / somme(w) de type Fraction
+    RAISE : StatisticsError si le poids total est nul ou si un poids est négatif
+    """
+    accumulator = MomentAccumulator()
+    accumulator.update_weighted(pairs)
+    return accumulator.mean()
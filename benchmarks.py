@@ -0,0 +1,857 @@
+"""Benchmarks of the Fraction subsystems against the naive operator-based approaches.
+
+Usage : python benchmarks.py [nom_du_benchmark ...]
+Sans argument, tous les benchmarks sont exécutés.
+"""
+import random
+import sys
+import time
+
+from Fraction import Fraction
+
+
+def timed(function, *args):
+    """Return the result of function(*args) and its duration in seconds."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def report(label, seconds, reference=None):
+    speedup = f"  (x{reference / seconds:.1f})" if reference else ""
+    print(f"  {label:<40} {seconds * 1000:10.1f} ms{speedup}")
+
+
+# ------------------ FractionMatrix ------------------
+
+def naive_solve(rows, rhs):
+    """Textbook Gaussian elimination on nested lists of Fraction."""
+    n = len(rows)
+    work = [row[:] + [value] for row, value in zip(rows, rhs)]
+    for k in range(n):
+        pivot_row = next(r for r in range(k, n) if not work[r][k].is_zero())
+        work[k], work[pivot_row] = work[pivot_row], work[k]
+        for r in range(k + 1, n):
+            factor = work[r][k] / work[k][k]
+            work[r] = [a - factor * b for a, b in zip(work[r], work[k])]
+    solution = [Fraction(0, 1)] * n
+    for i in range(n - 1, -1, -1):
+        total = work[i][n]
+        for j in range(i + 1, n):
+            total = total - work[i][j] * solution[j]
+        solution[i] = total / work[i][i]
+    return solution
+
+
+def bench_matrix(sizes=(50, 100, 200), naive_limit=50):
+    from Fraction.fraction_matrix import FractionMatrix
+
+    print("FractionMatrix.solve (Bareiss) vs élimination de Gauss sur des listes de Fraction")
+    rng = random.Random(28)
+    for n in sizes:
+        rows = [[Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(n)] for _ in range(n)]
+        rhs = [Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(n)]
+        print(f" {n}x{n}")
+        reference = None
+        if n <= naive_limit:
+            expected, reference = timed(naive_solve, rows, rhs)
+            report("naive Gauss (Fraction)", reference)
+        matrix = FractionMatrix(rows)
+        result, seconds = timed(matrix.solve, rhs)
+        report("FractionMatrix.solve", seconds, reference)
+        if reference is not None:
+            assert result == expected
+        _, seconds = timed(matrix.determinant)
+        report("FractionMatrix.determinant", seconds)
+
+
+# ------------------ SortedFractionList ------------------
+
+def bench_sorted(size=200_000, queries=20_000):
+    from Fraction.sorted_fractions import SortedFractionList
+
+    print(f"SortedFractionList sur {size} fractions vs listes retriées par float")
+    rng = random.Random(29)
+    values = [Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.randint(1, 10 ** 4)) for _ in range(size)]
+    reference = timed(lambda: sorted(values, key=float))[1]
+    report("sorted(values, key=float)", reference)
+    container, seconds = timed(SortedFractionList, values)
+    report("SortedFractionList(values)", seconds, reference)
+
+    extra = [Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.randint(1, 10 ** 4)) for _ in range(queries)]
+    _, seconds = timed(lambda: [container.add(f) for f in extra])
+    report(f"{queries} add", seconds)
+    _, seconds = timed(lambda: [container.rank(f) for f in extra])
+    report(f"{queries} rank", seconds)
+    _, seconds = timed(lambda: [container[i] for i in range(0, len(container), len(container) // queries)])
+    report(f"{queries} k-ième plus petit", seconds)
+    _, seconds = timed(lambda: sum(1 for _ in container.irange(Fraction(1, 3), Fraction(2, 5))))
+    report("irange(1/3, 2/5)", seconds)
+    _, seconds = timed(lambda: [container.remove(f) for f in extra])
+    report(f"{queries} remove", seconds)
+
+
+def bench_sort(sizes=(1_000_000, 10_000_000), memory_limit=1_000_000, chunk_size=1_000_000):
+    from Fraction.sorted_fractions import sort_exact, external_sort
+
+    print("Tri exact de grandes listes : clés float + retri des égalités, et tri externe par fusion")
+    for size in sizes:
+        print(f" {size} fractions")
+        rng = random.Random(40)
+
+        def generate():
+            for _ in range(size):
+                yield Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.randint(1, 10 ** 4))
+
+        if size <= memory_limit:
+            values = list(generate())
+            _, reference = timed(lambda: sorted(values, key=float))
+            report("sorted(key=float) (inexact)", reference)
+            _, seconds = timed(lambda: sorted((float(v), v) for v in values))
+            report("sorted((float, fraction))", seconds, reference)
+            _, seconds = timed(sort_exact, values)
+            report(f"sort_exact ({size / seconds / 1e6:.2f} M/s)", seconds, reference)
+            source = values
+        else:
+            source = generate()  # Les valeurs ne sont jamais toutes en mémoire
+        _, seconds = timed(lambda: sum(1 for _ in external_sort(source, chunk_size=chunk_size)))
+        report(f"external_sort ({size / seconds / 1e6:.2f} M/s)", seconds)
+
+
+# ------------------ Interop ------------------
+
+def _parse_std_string(value):
+    num, _, den = str(value).partition("/")
+    return Fraction(int(num), int(den or 1))
+
+
+def bench_interop(size=100_000):
+    import fractions
+    from decimal import Decimal
+    from Fraction import interop
+
+    print(f"Conversions sur {size} valeurs : chemins directs vs contournements par chaîne ou float")
+    rng = random.Random(30)
+    std = [fractions.Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.randint(1, 10 ** 6)) for _ in range(size)]
+    ours = interop.from_std_fractions(std)
+    decimals = [Decimal(rng.randint(-10 ** 6, 10 ** 6)).scaleb(-rng.randint(0, 6)) for _ in range(size)]
+
+    cases = [
+        ("fractions.Fraction -> Fraction", lambda: [_parse_std_string(v) for v in std],
+         lambda: interop.from_std_fractions(std)),
+        ("Fraction -> fractions.Fraction", lambda: [fractions.Fraction(str(v)) for v in ours],
+         lambda: interop.to_std_fractions(ours)),
+        ("Decimal -> Fraction", lambda: [Fraction.convert_to_fraction(float(v)) for v in decimals],
+         lambda: interop.from_decimals(decimals)),
+        ("Fraction -> Decimal", lambda: [Decimal(str(float(v))) for v in ours],
+         lambda: interop.to_decimals(ours)),
+        ("Fraction + fractions.Fraction", lambda: [a + _parse_std_string(b) for a, b in zip(ours, std)],
+         lambda: [a + b for a, b in zip(ours, std)]),
+    ]
+    for label, workaround, direct in cases:
+        print(f" {label}")
+        _, reference = timed(workaround)
+        report("contournement", reference)
+        _, seconds = timed(direct)
+        report("direct", seconds, reference)
+
+
+def bench_floats(size=200_000):
+    from array import array
+    from Fraction import interop
+
+    print(f"Export de {size} fractions vers un tampon de doubles")
+    rng = random.Random(34)
+    values = [Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.randint(1, 10 ** 6)) for _ in range(size)]
+    _, reference = timed(lambda: array("d", (float(v) for v in values)))
+    report("array('d', float(v) for v in values)", reference)
+    _, seconds = timed(interop.to_float_array, values)
+    report("to_float_array(values)", seconds, reference)
+    huge = [Fraction(rng.randint(1, 10 ** 400), rng.randint(1, 10 ** 400)) for _ in range(size // 10)]
+    _, seconds = timed(interop.to_float_array, huge)
+    report(f"to_float_array({size // 10} huge fractions)", seconds)
+
+# ------------------ SmallFraction ------------------
+
+def bench_small_fraction(size=200_000):
+    import tracemalloc
+    from Fraction.small_fraction import SmallFraction, SmallFractionArray
+
+    print(f"SmallFraction (mot de 64 bits) vs Fraction sur {size} valeurs 32 bits")
+    rng = random.Random(35)
+    pairs = [(rng.randint(-10 ** 4, 10 ** 4), rng.randint(1, 10 ** 4)) for _ in range(size)]
+    for label, build in [("list[Fraction]", lambda: [Fraction(n, d) for n, d in pairs]),
+                         ("list[SmallFraction]", lambda: [SmallFraction(n, d) for n, d in pairs]),
+                         ("SmallFractionArray", lambda: SmallFractionArray(Fraction(n, d) for n, d in pairs))]:
+        tracemalloc.start()
+        values = build()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"  {label:<40} {memory / size:10.1f} octets/valeur")
+        del values
+
+    small = [SmallFraction(n, d) for n, d in pairs[:size // 10]]
+    big = [Fraction(n, d) for n, d in pairs[:size // 10]]
+    _, reference = timed(lambda: [a * b + a for a, b in zip(big, big[1:])])
+    report("a * b + a (Fraction)", reference)
+    _, seconds = timed(lambda: [a * b + a for a, b in zip(small, small[1:])])
+    report("a * b + a (SmallFraction)", seconds, reference)
+    prices = [Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.choice((1, 2, 4, 5, 10, 20, 25, 50, 100)))
+              for _ in range(size)]
+    _, reference = timed(lambda: sum(prices, Fraction(0, 1)))
+    report("sum(list[Fraction]) (prix)", reference)
+    packed = SmallFractionArray(prices)
+    _, seconds = timed(packed.sum)
+    report("SmallFractionArray.sum()", seconds, reference)
+
+# ------------------ Small fraction table ------------------
+
+def bench_small_table(limits=(64, 256, 1000), operations=200_000):
+    from Fraction import small_table
+
+    print(f"Table des petites fractions : {operations} constructions et opérations sur des dénominateurs <= 1000")
+    rng = random.Random(31)
+    pairs = [(rng.randint(-1000, 1000), rng.randint(1, 1000)) for _ in range(operations)]
+    operands = [Fraction(n, d) for n, d in pairs[:operations // 10]]
+
+    def workload():
+        built = [Fraction(n, d) for n, d in pairs]
+        return [a + b for a, b in zip(operands, operands[1:])] + built
+
+    small_table.disable_small_table()
+    _, reference = timed(workload)
+    report("sans table", reference)
+    for limit in limits:
+        table = small_table.enable_small_table(limit)
+        _, seconds = timed(workload)
+        stats = table.stats()
+        report(f"table N={limit}", seconds, reference)
+        print(f"    construction {stats['build_seconds'] * 1000:.0f} ms, "
+              f"mémoire {stats['memory_bytes'] / 2 ** 20:.1f} Mo, taux de succès {stats['hit_rate']:.1%}")
+    small_table.disable_small_table()
+
+
+# ------------------ Thread-pool batch kernels ------------------
+
+def bench_parallel(size=200_000):
+    import os
+    from Fraction import parallel
+
+    mode = "avec GIL" if parallel.gil_enabled() else "sans GIL (free-threaded)"
+    print(f"Noyaux parallèles sur {size} fractions, CPython {mode}")
+    rng = random.Random(32)
+    lefts = [Fraction(rng.randint(-10 ** 4, 10 ** 4), rng.randint(1, 10 ** 4)) for _ in range(size)]
+    rights = [Fraction(rng.randint(-10 ** 4, 10 ** 4), rng.randint(1, 10 ** 4)) for _ in range(size)]
+
+    def naive_sum():
+        total = Fraction(0, 1)
+        for value in lefts[:size // 100]:
+            total = total + value
+        return total
+
+    _, seconds = timed(naive_sum)
+    report(f"boucle __add__ ({size // 100} termes)", seconds)
+    threads = sorted({1, 2, 4, os.cpu_count() or 1})
+    for label, job in (("batch_apply(mul)", lambda w: parallel.batch_apply("mul", lefts, rights, workers=w)),
+                       ("parallel_sum", lambda w: parallel.parallel_sum(lefts, workers=w, chunk_size=size // 16))):
+        print(f" {label}")
+        reference = None
+        for workers in threads:
+            _, seconds = timed(job, workers)
+            reference = reference or seconds
+            report(f"{workers} thread(s)", seconds, reference)
+
+
+# ------------------ Multi-modular sum ------------------
+
+def cancelling_values(size, seed=36):
+    """Return 2 * size + 1 shuffled fractions whose sum is 1/3."""
+    rng = random.Random(seed)
+    values = [Fraction(rng.randint(1, 10 ** 6), rng.randint(10 ** 5, 10 ** 6)) for _ in range(size)]
+    values += [Fraction(-v.numerator, v.denominator) for v in values] + [Fraction(1, 3)]
+    rng.shuffle(values)
+    return values
+
+
+def bench_modular(size=5000, naive_limit=500, certified_size=500):
+    from Fraction.modular import modular_sum
+    from Fraction.parallel import parallel_sum
+
+    values = cancelling_values(size)
+    print(f"Somme de {len(values)} fractions qui s'annulent : restes chinois vs sommes directes")
+
+    def naive():
+        total = Fraction(0, 1)
+        for value in values[:naive_limit]:
+            total = total + value
+        return total
+
+    _, seconds = timed(naive)
+    report(f"Fraction.__add__ ({naive_limit} premiers termes)", seconds)
+    expected, reference = timed(parallel_sum, values)
+    report("parallel_sum (dénominateur commun)", reference)
+    result, seconds = timed(modular_sum, values)
+    report("modular_sum", seconds, reference)
+    assert result == expected
+
+    values = cancelling_values(certified_size)
+    print(f"Somme de {len(values)} fractions qui s'annulent : vérification aléatoire vs borne a priori")
+    expected, reference = timed(parallel_sum, values)
+    report("parallel_sum (dénominateur commun)", reference)
+    result, seconds = timed(modular_sum, values)
+    report("modular_sum", seconds, reference)
+    assert result == expected
+    result, seconds = timed(modular_sum, values, None, None)
+    report("modular_sum certifié (check_primes=None)", seconds, reference)
+    assert result == expected
+
+
+# ------------------ Binary-splitting series ------------------
+
+def bench_series(sizes=(1_000, 10_000, 100_000), naive_limit=10_000):
+    from Fraction.series import series_sum, hypergeometric_sum
+
+    print("Sommes exactes de séries : scission binaire vs boucle Fraction.__add__")
+    series = [
+        ("harmonique sum(1/k)", lambda k: Fraction(1, k)),
+        ("télescopique sum(1/(k(k+1)))", lambda k: Fraction(1, k * (k + 1))),
+    ]
+    for label, term in series:
+        print(f" {label}")
+        for n in sizes:
+            reference = None
+            if n <= naive_limit:
+                def naive():
+                    total = Fraction(0, 1)
+                    for k in range(1, n + 1):
+                        total = total + term(k)
+                    return total
+                expected, reference = timed(naive)
+                report(f"boucle naive, {n} termes", reference)
+            result, seconds = timed(series_sum, term, n, 1)
+            report(f"series_sum, {n} termes", seconds, reference)
+            if reference is not None:
+                assert result == expected
+    print(" exponentielle sum(1/k!)")
+    for n in sizes:
+        _, seconds = timed(hypergeometric_sum, lambda k: 1, lambda k: k, n)
+        report(f"hypergeometric_sum, {n} termes", seconds)
+
+
+# ------------------ Operand coercion ------------------
+
+def legacy_coerce(other):
+    """Former operand check and conversion: chain of isinstance tests on every call."""
+    foreign = tuple(getattr(sys.modules[name], attr) for name, attr in (("fractions", "Fraction"),
+                                                                        ("decimal", "Decimal"))
+                    if name in sys.modules)
+    if not isinstance(other, (Fraction, int, float)) and not isinstance(other, foreign):
+        raise TypeError(other)
+    if isinstance(other, Fraction):
+        return other
+    if isinstance(other, int) and not isinstance(other, bool):
+        return Fraction(other, 1)
+    if isinstance(other, float):
+        denominator = 10 ** len(str(other).split(".")[1])
+        return Fraction(int(other * denominator), denominator)
+    if "decimal" in sys.modules and isinstance(other, sys.modules["decimal"].Decimal):
+        return Fraction.from_decimal(other)
+    return Fraction.from_std_fraction(other)
+
+
+def bench_coercion(size=200_000):
+    import fractions
+
+    print(f"Conversion de {size} opérandes de types mélangés : table par type vs chaîne d'isinstance")
+    rng = random.Random(38)
+    kinds = [lambda: Fraction(rng.randint(-99, 99), rng.randint(1, 99)), lambda: rng.randint(-99, 99),
+             lambda: rng.randint(-99, 99) / 4, lambda: fractions.Fraction(rng.randint(-99, 99), rng.randint(1, 99))]
+    operands = [rng.choice(kinds)() for _ in range(size)]
+    _, reference = timed(lambda: [legacy_coerce(v) for v in operands])
+    report("chaîne d'isinstance", reference)
+    _, seconds = timed(lambda: [Fraction._coerce(v) for v in operands])
+    report("Fraction._coerce (table par type)", seconds, reference)
+    base = Fraction(1, 3)
+    _, seconds = timed(lambda: [base + v for v in operands])
+    report("Fraction(1, 3) + opérande", seconds)
+
+
+# ------------------ Integer parts ------------------
+
+def bench_rounding(size=200_000):
+    import math
+    from Fraction.rounding import floor_all, divmod_all
+
+    print(f"Parties entières et restes de {size} montants : calcul entier exact vs passage par float")
+    rng = random.Random(39)
+    values = [Fraction(rng.randint(-10 ** 8, 10 ** 8), rng.choice((3, 7, 12, 100))) for _ in range(size)]
+    _, reference = timed(lambda: [math.floor(float(v)) for v in values])
+    report("math.floor(float(v)) (inexact > 2**53)", reference)
+    _, seconds = timed(lambda: [math.floor(v) for v in values])
+    report("math.floor(v)", seconds, reference)
+    _, seconds = timed(floor_all, values)
+    report("floor_all(values)", seconds, reference)
+    share = Fraction(7, 3)
+    _, reference = timed(lambda: [(int(float(v) // float(share)), v - share * int(float(v) // float(share)))
+                                  for v in values])
+    report("divmod via float + Fraction", reference)
+    _, seconds = timed(lambda: [divmod(v, share) for v in values])
+    report("divmod(v, share)", seconds, reference)
+    _, seconds = timed(divmod_all, values, share)
+    report("divmod_all(values, share)", seconds, reference)
+
+
+def bench_stats(size=20_000):
+    from Fraction.stats import MomentAccumulator, median
+
+    print(f"Statistiques exactes sur {size} montants : liste + opérateurs vs accumulateur et sélection")
+    rng = random.Random(41)
+    values = [Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.choice((4, 12, 100))) for _ in range(size)]
+
+    def naive_moments():
+        total = Fraction(0, 1)
+        for value in values:
+            total = total + value
+        average = total / size
+        spread = Fraction(0, 1)
+        for value in values:
+            spread = spread + (value - average) * (value - average)
+        return average, spread / (size - 1)
+
+    _, reference = timed(naive_moments)
+    report("moyenne et variance avec + et / sur Fraction", reference)
+    accumulator = MomentAccumulator()
+    _, seconds = timed(lambda: (accumulator.update(iter(values)), accumulator.mean(), accumulator.variance()))
+    report("MomentAccumulator (une passe)", seconds, reference)
+    _, reference = timed(lambda: sorted(values)[size // 2])
+    report("médiane via sorted(values)", reference)
+    _, seconds = timed(median, lambda: iter(values), 1024)
+    report("median(source, buffer_size=1024)", seconds, reference)
+
+
+def bench_bounded(steps=(10, 14, 16, 200), bound=10 ** 15):
+    from Fraction.bounded import BoundedContext
+
+    print(f"Itérations de la suite logistique x -> 7/2 x (1 - x) : exact vs dénominateur <= {bound:.0e} vs float")
+    r = Fraction(7, 2)
+
+    def iterate(x, count):
+        for _ in range(count):
+            x = r * x * (1 - x)
+        return x
+
+    for count in steps:
+        exact = None
+        if count <= 16:
+            exact, reference = timed(iterate, Fraction(1, 3), count)
+            report(f"{count} pas exacts (dénominateur de {exact.denominator.bit_length()} bits)", reference)
+        else:
+            reference = None
+        with BoundedContext(bound) as context:
+            bounded, seconds = timed(iterate, Fraction(1, 3), count)
+        report(f"{count} pas bornés (erreur cumulée {context.total_error:.1e})", seconds, reference)
+        value = 1 / 3
+        for _ in range(count):
+            value = 3.5 * value * (1 - value)
+        if exact is not None:
+            print(f"    écart au calcul exact : borné {abs(float(bounded - exact)):.1e}, "
+                  f"float {abs(value - float(exact)):.1e}")
+
+
+def naive_greedy(value):
+    """Greedy unit-fraction decomposition written with the Fraction operators."""
+    terms = []
+    while not value.is_unit():
+        unit = Fraction(1, -(-value.denominator // value.numerator))
+        terms.append(unit)
+        value = value - unit
+    return terms + [value]
+
+
+def bench_egyptian(size=200, max_den=1000, time_limit=0.05):
+    from Fraction.egyptian import egyptian_fractions_all
+
+    print(f"Décompositions en fractions unitaires de {size} fractions (dénominateurs <= {max_den})")
+    rng = random.Random(43)
+    values = [Fraction(rng.randint(1, den - 1), den) for den in (rng.randint(2, max_den) for _ in range(size))]
+
+    def describe(decompositions):
+        terms = sum(len(terms) for terms in decompositions) / size
+        bits = max(terms[-1].denominator.bit_length() for terms in decompositions)
+        return f"{terms:.1f} termes, {bits} bits max"
+
+    decompositions, reference = timed(lambda: [naive_greedy(value) for value in values])
+    report(f"glouton via Fraction.__sub__ ({describe(decompositions)})", reference)
+    for strategy in ("greedy", "binary", "shortest"):
+        decompositions, seconds = timed(egyptian_fractions_all, values, strategy, None, time_limit)
+        report(f"{strategy} ({describe(decompositions)})", seconds, reference)
+
+
+def bench_roots(size=20_000):
+    from Fraction.roots import root_interval
+
+    print(f"Racines carrées de {size} fractions : passage par float vs racine exacte et encadrement certifié")
+    rng = random.Random(44)
+    squares = [Fraction(rng.randint(1, 10 ** 9) ** 2, rng.randint(1, 10 ** 9) ** 2) for _ in range(size)]
+    values = [Fraction(rng.randint(1, 10 ** 12), rng.randint(1, 10 ** 12)) for _ in range(size)]
+    float_root = lambda f: Fraction.convert_to_fraction(f.numerator ** 0.5 / f.denominator ** 0.5)
+    roots, reference = timed(lambda: [float_root(f) for f in squares])
+    wrong = sum(root * root != f for root, f in zip(roots, squares))
+    report(f"carrés parfaits, float ({wrong} racines inexactes)", reference)
+    _, seconds = timed(lambda: [f ** 0.5 for f in squares])
+    report("carrés parfaits, f ** 0.5 exact", seconds, reference)
+    _, reference = timed(lambda: [float_root(f) for f in values])
+    report("autres valeurs, float (non certifié)", reference)
+    for bits in (53, 200):
+        _, seconds = timed(lambda: [root_interval(f, 2, Fraction(1, 2 ** bits)) for f in values])
+        report(f"root_interval à 2**-{bits}", seconds, reference)
+
+
+def bench_interning(size=200_000):
+    import tracemalloc
+    from Fraction.interning import enable_interning, disable_interning
+
+    print(f"Construction de {size} valeurs très répétées (0, 1, 1/2, 1/4, ...) : instances séparées vs pool")
+    rng = random.Random(45)
+    pairs = [(rng.choice((0, 1, 1, 2, 3)), rng.choice((1, 2, 4))) for _ in range(size)]
+
+    def build():
+        tracemalloc.start()
+        values = [Fraction(num, den) for num, den in pairs]
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return values, peak
+
+    (values, peak), reference = timed(build)
+    report(f"sans pool ({peak / 2 ** 20:.1f} Mio)", reference)
+    del values
+    pool = enable_interning(pinned=(0, 1, Fraction(1, 2)))
+    try:
+        (values, peak), seconds = timed(build)
+        stats = pool.stats()
+        report(f"avec pool ({peak / 2 ** 20:.1f} Mio, {stats['hit_rate']:.1%} de succès)", seconds, reference)
+        print(f"    mémoire économisée estimée : {stats['memory_saved_bytes'] / 2 ** 20:.1f} Mio")
+        half, others = values[0], values[1:2001]
+        _, reference = timed(lambda: [half.numerator == v.numerator and half.denominator == v.denominator
+                                      for v in others])
+        report("égalités par comparaison des termes", reference)
+        _, seconds = timed(lambda: [half == v for v in others])
+        report("égalités == entre instances internées", seconds, reference)
+    finally:
+        disable_interning()
+
+
+def bench_dot(size=100_000):
+    print(f"Sommes pondérées sum(w * x) sur {size} termes : boucle d'opérateurs vs Fraction.dot")
+    rng = random.Random(46)
+    cases = {
+        "entiers x centimes": ([rng.randint(1, 50) for _ in range(size)],
+                               [Fraction(rng.randint(1, 10 ** 6), 100) for _ in range(size)]),
+        "fractions x fractions": ([Fraction(rng.randint(1, 9), rng.choice((2, 3, 4, 6))) for _ in range(size)],
+                                  [Fraction(rng.randint(-999, 999), rng.choice((5, 8, 12, 25))) for _ in range(size)]),
+    }
+    for label, (weights, values) in cases.items():
+        def loop():
+            total = Fraction(0, 1)
+            for w, x in zip(weights, values):
+                total = total + w * x
+            return total
+
+        _, reference = timed(loop)
+        report(f"{label} : opérateurs", reference)
+        _, seconds = timed(Fraction.dot, weights, values)
+        report(f"{label} : dot (listes)", seconds, reference)
+        _, seconds = timed(Fraction.dot, iter(weights), (x for x in values))
+        report(f"{label} : dot (générateurs)", seconds, reference)
+
+
+def bench_polynomial(degree=12, sizes=(1_000, 10_000)):
+    from Fraction.polynomial import FractionPolynomial
+
+    print(f"Évaluation d'un polynôme de degré {degree} à coefficients rationnels en N points")
+    rng = random.Random(47)
+    coefficients = [Fraction(rng.randint(-99, 99), rng.randint(1, 24)) for _ in range(degree + 1)]
+    polynomial = FractionPolynomial(coefficients)
+
+    def operator_horner(x):
+        value = coefficients[-1]
+        for c in reversed(coefficients[:-1]):
+            value = value * x + c
+        return value
+
+    for size in sizes:
+        grid = [Fraction(k, 1000) for k in range(size)]
+        scattered = [Fraction(rng.randint(-999, 999), rng.randint(1, 999)) for _ in range(size)]
+        for label, points in (("grille k/1000", grid), ("points quelconques", scattered)):
+            _, reference = timed(lambda: [operator_horner(x) for x in points])
+            report(f"N={size}, {label} : Horner avec * et +", reference)
+            _, seconds = timed(lambda: [polynomial(x) for x in points])
+            report(f"N={size}, {label} : N appels polynomial(x)", seconds, reference)
+            _, seconds = timed(polynomial.evaluate, points)
+            report(f"N={size}, {label} : polynomial.evaluate(points)", seconds, reference)
+
+
+# ------------------ Running totals ------------------
+
+def bench_scan(size=100_000):
+    from Fraction.parallel import parallel_cumsum, parallel_cumprod
+
+    print(f"Sommes et produits cumulés de {size} valeurs : boucle d'opérateurs vs Fraction.cumsum / cumprod")
+    rng = random.Random(50)
+    cases = {
+        "sommes, centimes": (lambda a, b: a + b, Fraction.cumsum, parallel_cumsum,
+                             [Fraction(rng.randint(-10 ** 6, 10 ** 6), 100) for _ in range(size)]),
+        "sommes, mêlées": (lambda a, b: a + b, Fraction.cumsum, parallel_cumsum,
+                                        [Fraction(rng.randint(-999, 999), rng.choice((2, 3, 4, 5, 8, 12, 25)))
+                                         for _ in range(size)]),
+        "produits, taux": (lambda a, b: a * b, Fraction.cumprod, parallel_cumprod,
+                           [Fraction(rng.randint(95, 105), 100) for _ in range(size // 50)]),
+    }
+    for label, (operator, scan, parallel_scan, values) in cases.items():
+        def loop():
+            totals, total = [], values[0]
+            totals.append(total)
+            for value in values[1:]:
+                total = operator(total, value)
+                totals.append(total)
+            return totals
+
+        expected, reference = timed(loop)
+        report(f"{label} : opérateurs", reference)
+        result, seconds = timed(lambda: list(scan(values)))
+        assert result == expected
+        report(f"{label} : générateur", seconds, reference)
+        result, seconds = timed(parallel_scan, values, 4)
+        assert result == expected
+        report(f"{label} : parallèle (4 threads)", seconds, reference)
+
+
+# ------------------ Simplest fraction in an interval ------------------
+
+def naive_simplest_between(lo, hi):
+    """Try the denominators one at a time with Fraction operators."""
+    den = 1
+    while True:
+        scaled = lo * den
+        candidate = Fraction(-(-scaled.numerator // scaled.denominator), den)
+        if candidate <= hi:
+            return candidate
+        den += 1
+
+
+def bench_simplest(size=20_000):
+    from Fraction.farey import simplest_between, simplest_between_all
+
+    rng = random.Random(49)
+    lows = [Fraction(rng.randint(0, 10 ** 4), rng.randint(1, 10 ** 4)) for _ in range(size)]
+    highs = [low + Fraction(1, rng.randint(10 ** 3, 10 ** 5)) for low in lows]
+    print(f"Fraction la plus simple de {size} intervalles fermés")
+    expected, reference = timed(lambda: [naive_simplest_between(lo, hi) for lo, hi in zip(lows, highs)])
+    report("naïf (dénominateurs successifs)", reference)
+    result, seconds = timed(lambda: [simplest_between(lo, hi) for lo, hi in zip(lows, highs)])
+    assert result == expected
+    report("simplest_between", seconds, reference)
+    result, seconds = timed(simplest_between_all, lows, highs)
+    assert result == expected
+    report("simplest_between_all", seconds, reference)
+
+
+# ------------------ Memory footprint ------------------
+
+# Allocations de référence par appel, par version de CPython (le nombre de blocs d'une instance
+# dépend de la version) : nombre de blocs mémoire encore vivants après l'appel (résultat compris)
+# et octets du pic temporaire pendant l'appel
+MEMORY_BASELINES = {
+    (3, 11): {
+        "Fraction + Fraction": (2, 88),
+        "Fraction + int": (2, 176),
+        "Fraction + float": (2, 176),
+        "Fraction * Fraction": (2, 88),
+        "Fraction / Fraction": (2, 176),
+        "Fraction == Fraction": (0, 0),
+        "Fraction < Fraction": (0, 0),
+        "str(Fraction)": (1, 152),
+        "float(Fraction)": (1, 0),
+        "Fraction(num, den)": (2, 88),
+    },
+}
+# Référence de la version en cours d'exécution (None si aucune n'a été relevée)
+MEMORY_BASELINE = MEMORY_BASELINES.get(sys.version_info[:2])
+# Marge tolérée sur le pic temporaire avant de signaler une régression (variations entre versions)
+MEMORY_TOLERANCE = 1.25
+
+
+def memory_operations():
+    """Return the representative operator calls measured by the memory benchmark."""
+    a, b = Fraction(3, 4), Fraction(5, 6)
+    return {
+        "Fraction + Fraction": lambda: a + b,
+        "Fraction + int": lambda: a + 2,
+        "Fraction + float": lambda: a + 0.5,
+        "Fraction * Fraction": lambda: a * b,
+        "Fraction / Fraction": lambda: a / b,
+        "Fraction == Fraction": lambda: a == b,
+        "Fraction < Fraction": lambda: a < b,
+        "str(Fraction)": lambda: str(a),
+        "float(Fraction)": lambda: float(a),
+        "Fraction(num, den)": lambda: Fraction(6, 8),
+    }
+
+
+def memory_per_call(function, calls=2000):
+    """Return (blocks kept, bytes kept, temporary peak bytes) per call of function.
+
+    Les résultats de calls appels sont gardés en vie : la différence de deux instantanés de
+    tracemalloc donne les blocs et octets conservés par appel. Le pic temporaire est le
+    minimum, sur 5 appels isolés, de l'écart entre le pic de tracemalloc et la mémoire
+    avant l'appel (résultat compris).
+    """
+    import tracemalloc
+
+    results = [None] * calls
+    excluded = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    tracemalloc.start()
+    try:
+        function()  # Premier appel : caches de coercition, imports paresseux
+        before = tracemalloc.take_snapshot().filter_traces(excluded)
+        for i in range(calls):
+            results[i] = function()
+        after = tracemalloc.take_snapshot().filter_traces(excluded)
+        stats = after.compare_to(before, "filename")
+        blocks = sum(stat.count_diff for stat in stats) / calls
+        size = sum(stat.size_diff for stat in stats) / calls
+        peaks = []
+        for _ in range(5):
+            start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            function()
+            peaks.append(tracemalloc.get_traced_memory()[1] - start)
+    finally:
+        tracemalloc.stop()
+    return blocks, size, min(peaks)
+
+
+def memory_regressions(measures, baseline=MEMORY_BASELINE):
+    """Return the operations whose allocations exceed the baseline.
+
+    PRE : measures associe à un nom d'opération le triplet renvoyé par memory_per_call,
+          baseline associe à chaque nom le couple (blocs, pic) de référence
+    POST : renvoie la liste des (nom, mesure, référence) en régression : plus de blocs
+           conservés (arrondis) ou un pic temporaire au-delà de la marge MEMORY_TOLERANCE
+    """
+    regressions = []
+    for name, (blocks, _, peak) in measures.items():
+        baseline_blocks, baseline_peak = baseline[name]
+        if round(blocks) > baseline_blocks or peak > baseline_peak * MEMORY_TOLERANCE:
+            regressions.append((name, (round(blocks), peak), (baseline_blocks, baseline_peak)))
+    return regressions
+
+
+def peak_memory(function, *args):
+    """Return the result of function(*args) and the peak of memory allocated during the call."""
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        result = function(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def bench_memory(size=50_000):
+    import fractions
+    from Fraction.small_fraction import SmallFraction
+
+    print("Empreinte mémoire : octets par instance")
+    big = 10 ** 30
+    instances = {
+        "Fraction(3, 4)": lambda: Fraction(3, 4),
+        "Fraction(10**30 + 1, 3)": lambda: Fraction(big + 1, 3),
+        "SmallFraction(3, 4)": lambda: SmallFraction(3, 4),
+        "fractions.Fraction(3, 4)": lambda: fractions.Fraction(3, 4),
+        "float": lambda: float(size) / 7,
+    }
+    for label, build in instances.items():
+        _, kept, _ = memory_per_call(build)
+        print(f"  {label:<40} {kept:8.1f} octets (sys.getsizeof : {sys.getsizeof(build())})")
+
+    print("Allocations par appel d'opérateur (blocs conservés, pic temporaire) et référence")
+    measures = {name: memory_per_call(function) for name, function in memory_operations().items()}
+    for name, (blocks, kept, peak) in measures.items():
+        reference = ""
+        if MEMORY_BASELINE is not None:
+            baseline_blocks, baseline_peak = MEMORY_BASELINE[name]
+            reference = f"  (référence : {baseline_blocks} blocs, pic {baseline_peak})"
+        print(f"  {name:<40} {blocks:4.1f} blocs, {kept:6.1f} octets conservés, pic {peak:5d} octets{reference}")
+    if MEMORY_BASELINE is None:
+        print(f"  Pas de référence pour Python {sys.version_info[0]}.{sys.version_info[1]} : aucune comparaison")
+        regressions = []
+    else:
+        regressions = memory_regressions(measures)
+    for name, measure, baseline in regressions:
+        print(f"  RÉGRESSION {name} : {measure} au lieu de {baseline}")
+
+    print(f"Pic mémoire de traitements de {size} valeurs (hors données d'entrée)")
+    rng = random.Random(48)
+    # Petits dénominateurs : la somme reste de taille bornée et mesure les allocations, pas les pgcd
+    values = [Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.randint(1, 12)) for _ in range(size)]
+    texts = [f"{rng.randint(-10 ** 6, 10 ** 6)}/{rng.randint(1, 1000)}" for _ in range(size)]
+    floats = [rng.random() for _ in range(size)]
+
+    def summation():
+        total = Fraction(0, 1)
+        for value in values:
+            total = total + value
+        return total
+
+    def float_summation():
+        total = Fraction(0, 1)
+        for value in floats[:size // 10]:
+            total = total + value
+        return total
+
+    pipelines = {
+        "somme avec +": summation,
+        f"somme de {size // 10} floats avec +": float_summation,
+        "somme avec Fraction.dot": lambda: Fraction.dot([1] * size, values),
+        "lecture de textes num/den": lambda: [_parse_std_string(text) for text in texts],
+        "écriture avec str": lambda: [str(value) for value in values],
+    }
+    for label, pipeline in pipelines.items():
+        (_, peak), seconds = timed(peak_memory, pipeline)
+        print(f"  {label:<40} pic {peak / 2 ** 20:8.2f} Mio  ({seconds * 1000:.1f} ms)")
+    if regressions:
+        sys.exit(1)
+
+
+BENCHMARKS = {
+    "matrix": bench_matrix,
+    "sorted": bench_sorted,
+    "sort": bench_sort,
+    "interop": bench_interop,
+    "coercion": bench_coercion,
+    "floats": bench_floats,
+    "small_table": bench_small_table,
+    "small_fraction": bench_small_fraction,
+    "parallel": bench_parallel,
+    "modular": bench_modular,
+    "series": bench_series,
+    "rounding": bench_rounding,
+    "stats": bench_stats,
+    "bounded": bench_bounded,
+    "egyptian": bench_egyptian,
+    "roots": bench_roots,
+    "interning": bench_interning,
+    "dot": bench_dot,
+    "polynomial": bench_polynomial,
+    "simplest": bench_simplest,
+    "scan": bench_scan,
+    "memory": bench_memory,
+}
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        BENCHMARKS[name]()
@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import unittest
+
+from Fraction import Fraction
+from Fraction.bounded import BoundedContext, current_context
+
+
+def logistic(x, steps):
+    r = Fraction(7, 2)
+    for _ in range(steps):
+        x = r * x * (1 - x)
+    return x
+
+
+class TestBoundedContext(unittest.TestCase):
+    """Unit tests for the bounded-denominator arithmetic context."""
+
+    def test_results_are_bounded(self):
+        """Test that every operator result has a denominator within the bound."""
+        a, b = Fraction(1, 997), Fraction(3, 991)
+        with BoundedContext(1000):
+            for result in (a + b, a - b, a * b, a / b, 1 - a, 2 / b):
+                self.assertLessEqual(result.denominator, 1000)
+
+    def test_best_approximation(self):
+        """Test that a snapped result is the best approximation of the exact result."""
+        a, b = Fraction(1, 997), Fraction(3, 991)
+        exact = a + b
+        with BoundedContext(1000) as context:
+            result = a + b
+        self.assertEqual(result, exact.limit_denominator(1000))
+        self.assertEqual(context.snapped, 1)
+        self.assertAlmostEqual(context.max_error, abs(float(result - exact)), delta=1e-18)
+
+    def test_small_results_are_exact(self):
+        """Test that results within the bound are not modified nor counted as snapped."""
+        with BoundedContext(100) as context:
+            self.assertEqual(Fraction(1, 3) + Fraction(1, 6), Fraction(1, 2))
+            self.assertEqual(Fraction(3, 4) * 2, Fraction(3, 2))
+        stats = context.stats()
+        self.assertEqual(stats["operations"], 2)
+        self.assertEqual(stats["snapped"], 0)
+        self.assertEqual(stats["total_error"], 0.0)
+
+    def test_iteration_stays_close(self):
+        """Test that a bounded iteration stays close to the exact one and tracks its error."""
+        exact = logistic(Fraction(1, 3), 12)
+        with BoundedContext(10 ** 12) as context:
+            approximate = logistic(Fraction(1, 3), 12)
+        self.assertLessEqual(approximate.denominator, 10 ** 12)
+        self.assertGreater(context.snapped, 0)
+        self.assertLess(abs(float(approximate - exact)), 1e-9)
+        self.assertLess(context.max_error, 1e-12)
+
+    def test_exit_restores_exact_arithmetic(self):
+        """Test nested contexts and the exit of a context."""
+        self.assertIsNone(current_context())
+        outer, inner = BoundedContext(1000), BoundedContext(10)
+        with outer:
+            with inner:
+                self.assertIs(current_context(), inner)
+                self.assertLessEqual((Fraction(1, 97) + Fraction(1, 89)).denominator, 10)
+            self.assertIs(current_context(), outer)
+        self.assertIsNone(current_context())
+        self.assertEqual((Fraction(1, 97) + Fraction(1, 89)).denominator, 97 * 89)
+
+    def test_exit_on_error(self):
+        """Test that an exception leaves the arithmetic exact."""
+        with self.assertRaises(ZeroDivisionError):
+            with BoundedContext(10):
+                raise ZeroDivisionError
+        self.assertIsNone(current_context())
+
+    def test_isolated_between_threads(self):
+        """Test that a context only applies to the thread which entered it."""
+        results = []
+        with BoundedContext(10):
+            thread = threading.Thread(target=lambda: results.append((current_context(),
+                                                                     Fraction(1, 97) + Fraction(1, 89))))
+            thread.start()
+            thread.join()
+        self.assertIsNone(results[0][0])
+        self.assertEqual(results[0][1].denominator, 97 * 89)
+
+    def test_non_lifo_exits_between_threads(self):
+        """Test that contexts exited out of order by two threads leave exact arithmetic everywhere."""
+        first_entered, second_entered, first_exited = threading.Event(), threading.Event(), threading.Event()
+        seen = {}
+
+        def first():
+            with BoundedContext(10) as context:
+                first_entered.set()
+                second_entered.wait()
+                seen["first"] = current_context() is context
+            first_exited.set()
+
+        def second():
+            first_entered.wait()
+            with BoundedContext(1000) as context:
+                second_entered.set()
+                first_exited.wait()
+                seen["second"] = current_context() is context
+                seen["second_bounded"] = (Fraction(1, 97) + Fraction(1, 89)).denominator <= 1000
+            seen["second_after"] = current_context()
+
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(seen, {"first": True, "second": True, "second_bounded": True, "second_after": None})
+        self.assertIsNone(current_context())
+        self.assertEqual((Fraction(1, 97) + Fraction(1, 89)).denominator, 97 * 89)
+
+    def test_shared_between_asyncio_tasks(self):
+        """Test one instance entered by two interleaved asyncio tasks, and a task outside any context."""
+        context = BoundedContext(100)
+        seen = []
+
+        async def bounded(name):
+            with context:
+                await asyncio.sleep(0)
+                seen.append((name, current_context() is context,
+                             (Fraction(1, 97) + Fraction(1, 89)).denominator <= 100))
+                await asyncio.sleep(0)
+            seen.append((name, current_context() is None, True))
+
+        async def exact():
+            await asyncio.sleep(0)
+            exact_sum = Fraction(1, 97) + Fraction(1, 89)
+            seen.append(("exact", current_context() is None, exact_sum.denominator == 97 * 89))
+
+        async def main():
+            await asyncio.gather(bounded("a"), bounded("b"), exact())
+
+        asyncio.run(main())
+        self.assertEqual(len(seen), 5)
+        self.assertTrue(all(ok and arithmetic for _, ok, arithmetic in seen))
+        self.assertIsNone(current_context())
+
+    def test_reset(self):
+        """Test the reset of the counters."""
+        with BoundedContext(10) as context:
+            Fraction(1, 97) + Fraction(1, 89)
+        context.reset()
+        self.assertEqual((context.operations, context.snapped, context.max_error), (0, 0, 0.0))
+
+    def test_invalid_bound(self):
+        """Test the validation of the bound."""
+        with self.assertRaises(TypeError):
+            BoundedContext(10.5)
+        with self.assertRaises(ValueError):
+            BoundedContext(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
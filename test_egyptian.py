@@ -0,0 +1,89 @@
+import random
+import unittest
+
+from Fraction import Fraction, WrongTypeError
+from Fraction.egyptian import egyptian_fractions, egyptian_fractions_all, SearchLimitError, STRATEGIES
+
+
+class TestEgyptianFractions(unittest.TestCase):
+    """Unit tests for the unit-fraction decompositions."""
+
+    def assertDecomposes(self, terms, value):
+        denominators = [term.denominator for term in terms]
+        self.assertTrue(all(term.is_unit() for term in terms))
+        self.assertEqual(denominators, sorted(set(denominators)))
+        self.assertEqual(sum(terms, Fraction(0, 1)), value)
+
+    def test_all_strategies(self):
+        """Test that every strategy gives distinct unit fractions summing to the value."""
+        rng = random.Random(43)
+        values = [Fraction(rng.randint(1, d), d) for d in (rng.randint(1, 200) for _ in range(50))]
+        for strategy in STRATEGIES:
+            for value in values:
+                self.assertDecomposes(egyptian_fractions(value, strategy), value)
+
+    def test_greedy(self):
+        """Test the Fibonacci-Sylvester decomposition."""
+        terms = egyptian_fractions(Fraction(3, 7), "greedy")
+        self.assertEqual([t.denominator for t in terms], [3, 11, 231])
+        self.assertEqual(len(egyptian_fractions(Fraction(5, 121), "greedy")), 5)
+
+    def test_binary(self):
+        """Test that the binary remainder terms stay below 2 * den ** 2."""
+        rng = random.Random(43)
+        for den in (rng.randint(2, 10 ** 6) for _ in range(200)):
+            value = Fraction(rng.randint(1, den - 1), den)
+            terms = egyptian_fractions(value, "binary")
+            self.assertDecomposes(terms, value)
+            self.assertLess(terms[-1].denominator, 2 * value.denominator ** 2)
+            self.assertLessEqual(len(terms), 2 * value.denominator.bit_length())
+
+    def test_shortest(self):
+        """Test the search of the fewest terms, then of the smallest largest denominator."""
+        self.assertEqual([t.denominator for t in egyptian_fractions(Fraction(3, 7), "shortest")], [4, 7, 28])
+        self.assertEqual([t.denominator for t in egyptian_fractions(Fraction(5, 121), "shortest")], [33, 121, 363])
+        self.assertEqual([t.denominator for t in egyptian_fractions(Fraction(7, 15), "shortest")], [5, 6, 10])
+        self.assertEqual([t.denominator for t in egyptian_fractions(Fraction(1, 7), "shortest")], [7])
+        self.assertEqual(egyptian_fractions(1, "shortest"), [Fraction(1, 1)])
+
+    def test_time_limit(self):
+        """Test that an exhausted search returns a valid decomposition."""
+        value = Fraction(340, 809)
+        self.assertDecomposes(egyptian_fractions(value, "shortest", time_limit=0), value)
+        with self.assertRaises(SearchLimitError):
+            egyptian_fractions(Fraction(5, 121), "greedy", time_limit=0)
+
+    def test_max_terms(self):
+        """Test the limit on the number of terms."""
+        self.assertEqual(len(egyptian_fractions(Fraction(5, 121), "shortest", max_terms=3)), 3)
+        with self.assertRaises(SearchLimitError):
+            egyptian_fractions(Fraction(5, 121), "shortest", max_terms=2)
+        with self.assertRaises(SearchLimitError):
+            egyptian_fractions(Fraction(5, 121), "greedy", max_terms=4)
+        with self.assertRaises(SearchLimitError):
+            egyptian_fractions(Fraction(5, 121), "binary", max_terms=4)
+
+    def test_batch(self):
+        """Test the batch decomposition, with repeated values and several threads."""
+        values = [Fraction(3, 7), 0.5, Fraction(5, 121), Fraction(3, 7)] * 300
+        for workers in (1, 3):
+            results = egyptian_fractions_all(values, "shortest", workers=workers)
+            self.assertEqual(len(results), len(values))
+            for value, terms in zip(values, results):
+                self.assertEqual(terms, egyptian_fractions(value, "shortest"))
+
+    def test_errors(self):
+        """Test the invalid values and strategies."""
+        for value in (0, Fraction(-1, 2), Fraction(3, 2)):
+            with self.assertRaises(ValueError):
+                egyptian_fractions(value)
+        with self.assertRaises(ValueError):
+            egyptian_fractions(Fraction(1, 2), "fastest")
+        with self.assertRaises(ValueError):
+            egyptian_fractions_all([], "fastest")
+        with self.assertRaises(WrongTypeError):
+            egyptian_fractions("1/2")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+import itertools
+import unittest
+
+from Fraction import Fraction, WrongTypeError
+from Fraction.farey import farey_pairs, farey_sequence, AdjacencyIndex, simplest_between, simplest_between_all
+
+
+class TestFarey(unittest.TestCase):
+    """Unit tests for the Farey sequence generators."""
+
+    def test_farey_order_one(self):
+        """Test the Farey sequence of order 1 (0/1, 1/1)."""
+        self.assertEqual(list(farey_pairs(1)), [(0, 1), (1, 1)])
+
+    def test_farey_order_five(self):
+        """Test the Farey sequence of order 5."""
+        expected = [(0, 1), (1, 5), (1, 4), (1, 3), (2, 5), (1, 2), (3, 5), (2, 3), (3, 4), (4, 5), (1, 1)]
+        self.assertEqual(list(farey_pairs(5)), expected)
+
+    def test_farey_terms_are_consecutive_neighbours(self):
+        """Test that consecutive terms of a Farey sequence are adjacent fractions."""
+        terms = list(farey_sequence(12))
+        for left, right in zip(terms, terms[1:]):
+            self.assertTrue(left.is_adjacent_to(right))
+
+    def test_farey_sequence_yields_fractions(self):
+        """Test that farey_sequence yields Fraction instances."""
+        self.assertTrue(all(isinstance(f, Fraction) for f in farey_sequence(4)))
+
+    def test_farey_invalid_order(self):
+        """Test that an order lower than 1 raises a ValueError."""
+        with self.assertRaises(ValueError):
+            list(farey_pairs(0))
+
+    def test_farey_invalid_type(self):
+        """Test that a non integer order raises a TypeError."""
+        with self.assertRaises(TypeError):
+            list(farey_pairs(2.5))
+
+
+class TestAdjacencyIndex(unittest.TestCase):
+    """Unit tests for the AdjacencyIndex class."""
+
+    def test_len_and_contains(self):
+        """Test that duplicates are stored once and membership works for ints and floats."""
+        index = AdjacencyIndex([Fraction(1, 2), Fraction(2, 4), 3, 0.25])
+        self.assertEqual(len(index), 3)
+        self.assertIn(Fraction(1, 4), index)
+        self.assertIn(0.5, index)
+        self.assertNotIn(Fraction(1, 3), index)
+
+    def test_discard(self):
+        """Test that a discarded fraction is no longer found."""
+        index = AdjacencyIndex([Fraction(1, 2), Fraction(1, 3)])
+        index.discard(Fraction(1, 2))
+        index.discard(Fraction(5, 7))  # Absent : aucun effet
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.neighbours(Fraction(1, 2)), [Fraction(1, 3)])
+
+    def test_neighbours(self):
+        """Test the neighbours of 1/5 (1/6, 1/4 and 2/5 are adjacent, -1/5 is not)."""
+        index = AdjacencyIndex([Fraction(1, 6), Fraction(1, 4), Fraction(2, 5), Fraction(-1, 5), Fraction(7, 9)])
+        result = index.neighbours(Fraction(1, 5))
+        self.assertEqual([str(f) for f in result], ["1/6", "1/4", "2/5"])
+
+    def test_neighbours_with_integer_query(self):
+        """Test the neighbours of an integer query (3 and 7/2, 5/2, 4)."""
+        index = AdjacencyIndex([Fraction(7, 2), Fraction(5, 2), Fraction(4, 1), Fraction(10, 3)])
+        result = index.neighbours(3)
+        self.assertEqual([str(f) for f in result], ["5/2", "10/3", "7/2", "4"])
+
+    def test_adjacent_pairs_match_brute_force(self):
+        """Test that adjacent_pairs finds exactly the pairs found by is_adjacent_to."""
+        values = [Fraction(n, d) for d in range(1, 13) for n in range(-d, 2 * d)]
+        unique = list({(f.numerator, f.denominator): f for f in values}.values())
+        index = AdjacencyIndex(unique)
+        expected = set()
+        for x, y in itertools.combinations(unique, 2):
+            if x.is_adjacent_to(y):
+                expected.add(frozenset((str(x), str(y))))
+        result = [frozenset((str(x), str(y))) for x, y in index.adjacent_pairs()]
+        self.assertEqual(len(result), len(expected))
+        self.assertEqual(set(result), expected)
+
+    def test_adjacent_pairs_are_ordered(self):
+        """Test that each adjacent pair is yielded with its smallest fraction first."""
+        index = AdjacencyIndex(farey_sequence(6))
+        for x, y in index.adjacent_pairs():
+            self.assertLess(float(x), float(y))
+
+    def test_invalid_type(self):
+        """Test that adding an invalid type raises WrongTypeError."""
+        index = AdjacencyIndex()
+        with self.assertRaises(WrongTypeError):
+            index.add("1/2")
+
+
+class TestSimplestBetween(unittest.TestCase):
+    """Unit tests for the simplest_between and simplest_between_all functions."""
+
+    def brute_force(self, lo, hi, lo_closed, hi_closed):
+        for den in itertools.count(1):
+            candidates = [num for num in range(-50 * den, 50 * den + 1)
+                          if (lo < Fraction(num, den) or lo_closed and lo == Fraction(num, den))
+                          and (Fraction(num, den) < hi or hi_closed and hi == Fraction(num, den))]
+            if candidates:
+                return Fraction(min(candidates, key=abs), den)
+
+    def test_matches_brute_force(self):
+        """Test every interval between small fractions, for the four kinds of bounds."""
+        fractions = (Fraction(num, den) for num in range(-6, 7) for den in range(1, 5))
+        values = sorted(Fraction(num, den) for num, den in {(f.numerator, f.denominator) for f in fractions})
+        for lo, hi in itertools.combinations(values, 2):
+            for inclusive in itertools.product((True, False), repeat=2):
+                self.assertEqual(simplest_between(lo, hi, inclusive), self.brute_force(lo, hi, *inclusive))
+
+    def test_known_values(self):
+        """Test some classic simplest fractions, with int and float bounds."""
+        self.assertEqual(simplest_between(0.333, 0.334), Fraction(1, 3))
+        self.assertEqual(simplest_between(Fraction(314, 100), Fraction(315, 100)), Fraction(22, 7))
+        self.assertEqual(simplest_between(3, 7, (False, False)), Fraction(4, 1))
+        self.assertEqual(simplest_between(-3, 7), Fraction(0, 1))
+        self.assertEqual(simplest_between(Fraction(-3, 4), Fraction(-2, 3), (False, False)), Fraction(-5, 7))
+        self.assertEqual(simplest_between(Fraction(1, 2), Fraction(1, 2)), Fraction(1, 2))
+
+    def test_open_bounds(self):
+        """Test that an open bound excludes the simplest value lying on it."""
+        self.assertEqual(simplest_between(Fraction(1, 2), 1, (False, True)), Fraction(1, 1))
+        self.assertEqual(simplest_between(Fraction(1, 2), 1, (False, False)), Fraction(2, 3))
+        self.assertEqual(simplest_between(0, Fraction(1, 3), (False, False)), Fraction(1, 4))
+        self.assertEqual(simplest_between(Fraction(-1, 3), 0, (True, False)), Fraction(-1, 3))
+
+    def test_empty_interval(self):
+        """Test that an empty interval or unknown bounds raise a ValueError."""
+        for lo, hi, inclusive in ((1, 0, (True, True)), (1, 1, (True, False)), (1, 1, (False, False))):
+            with self.assertRaises(ValueError):
+                simplest_between(lo, hi, inclusive)
+        with self.assertRaises(ValueError):
+            simplest_between(0, 1, "closed")
+        with self.assertRaises(ValueError):
+            simplest_between(0, 1, (True, True, False))
+
+    def test_float_bounds(self):
+        """Test float bounds, read by their decimal writing like everywhere else in the package."""
+        self.assertEqual(simplest_between(0.1, 0.1), Fraction(1, 10))
+        self.assertEqual(simplest_between(Fraction(3, 10), 0.3), Fraction(3, 10))
+        self.assertEqual(simplest_between(1e-5, 0.5), Fraction(1, 2))
+        self.assertEqual(simplest_between(1e-5, 0.5, (True, False)), Fraction(1, 3))
+        self.assertEqual(simplest_between(0.1, 1e20), Fraction(1, 1))
+        self.assertEqual(simplest_between(1e-20, 2e-20), Fraction(1, 5 * 10 ** 19))
+        self.assertEqual(simplest_between_all([1e-5], [0.5]), [Fraction(1, 2)])
+
+    def test_infinite_bounds(self):
+        """Test that an infinite float bound raises an OverflowError and a NaN bound a ValueError."""
+        for lo, hi in ((float("inf"), 1), (0, float("inf")), (float("-inf"), 0)):
+            with self.assertRaises(OverflowError):
+                simplest_between(lo, hi)
+        with self.assertRaises(ValueError):
+            simplest_between(float("nan"), 1)
+        with self.assertRaises(OverflowError):
+            simplest_between_all([0], [float("inf")])
+
+    def test_invalid_type(self):
+        """Test that a bound of an unsupported type raises a WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            simplest_between("0", 1)
+
+    def test_batch(self):
+        """Test that the batched version matches simplest_between, in order, with several threads."""
+        lows = [Fraction(num, 7) for num in range(-20, 20)]
+        highs = [low + Fraction(1, 5) for low in lows]
+        expected = [simplest_between(lo, hi, (False, False)) for lo, hi in zip(lows, highs)]
+        for workers in (1, 3):
+            self.assertEqual(simplest_between_all(lows, highs, (False, False), workers=workers), expected)
+        self.assertEqual(simplest_between_all([], []), [])
+
+    def test_batch_length_mismatch(self):
+        """Test that lists of different lengths raise a ValueError."""
+        with self.assertRaises(ValueError):
+            simplest_between_all([0, 1], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
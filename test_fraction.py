@@ -1,4 +1,9 @@
+import fractions
+import importlib.util
+import math
+import random
 import unittest
+from decimal import Decimal, Context
 
 from Fraction import Fraction, DenominatorIsZero, WrongTypeError
 
@@ -198,6 +203,17 @@ class TestFraction(unittest.TestCase):
         self.assertEqual(result.numerator, 14)
         self.assertEqual(result.denominator, 15)
 
+    def test_float_conversion_reads_decimal_writing(self):
+        """Test that floats are converted by their shortest decimal writing, including the exponent notation."""
+        for value, (num, den) in ((0.29, (29, 100)), (-2.675, (-107, 40)), (1e-05, (1, 100000)),
+                                  (-1.5e-07, (-3, 20000000)), (1e+20, (10 ** 20, 1)), (123.0, (123, 1))):
+            result = Fraction.convert_to_fraction(value)
+            self.assertEqual((result.numerator, result.denominator), (num, den))
+        with self.assertRaises(OverflowError):
+            Fraction(1, 2) + float("inf")
+        with self.assertRaises(ValueError):
+            Fraction(1, 2) + float("nan")
+
     def test_addition_with_negative_fraction(self):
         """Test addition of a fraction with a negative fraction."""
         f = Fraction(1, 2)
@@ -972,5 +988,460 @@ class TestFraction(unittest.TestCase):
             result = Fraction.convert_to_fraction(val)  # Invalid None
 
 
+    """Test continued fraction expansions, convergents and comparison."""
+
+    def test_to_continued_fraction(self):
+        """Test the continued fraction expansion of 415/93 ([4; 2, 6, 7])."""
+        f = Fraction(415, 93)
+        self.assertEqual(f.to_continued_fraction(), [4, 2, 6, 7])
+
+    def test_to_continued_fraction_negative(self):
+        """Test the continued fraction expansion of a negative fraction (-7/3 = [-3; 1, 2])."""
+        f = Fraction(-7, 3)
+        self.assertEqual(f.to_continued_fraction(), [-3, 1, 2])
+
+    def test_to_continued_fraction_integer(self):
+        """Test the continued fraction expansion of an integer."""
+        f = Fraction(5, 1)
+        self.assertEqual(f.to_continued_fraction(), [5])
+
+    def test_from_continued_fraction(self):
+        """Test building a fraction from its continued fraction terms."""
+        result = Fraction.from_continued_fraction([4, 2, 6, 7])
+        self.assertEqual(result.numerator, 415)
+        self.assertEqual(result.denominator, 93)
+
+    def test_from_continued_fraction_round_trip(self):
+        """Test that from_continued_fraction inverts to_continued_fraction."""
+        for f in (Fraction(-123456789, 987654), Fraction(0, 1), Fraction(1, 7), Fraction(355, 113)):
+            self.assertEqual(Fraction.from_continued_fraction(f.to_continued_fraction()), f)
+
+    def test_from_continued_fraction_empty(self):
+        """Test that an empty list of terms raises a ValueError."""
+        with self.assertRaises(ValueError):
+            Fraction.from_continued_fraction([])
+
+    def test_from_continued_fraction_non_positive_term(self):
+        """Test that a non positive term after the first raises a ValueError."""
+        with self.assertRaises(ValueError):
+            Fraction.from_continued_fraction([1, 0, 2])
+
+    def test_from_continued_fraction_invalid_type(self):
+        """Test that a non integer term raises a TypeError."""
+        with self.assertRaises(TypeError):
+            Fraction.from_continued_fraction([1, 2.5])
+
+    def test_convergents(self):
+        """Test the convergents of 415/93."""
+        f = Fraction(415, 93)
+        self.assertEqual([str(c) for c in f.convergents()], ["4", "9/2", "58/13", "415/93"])
+
+    def test_semiconvergents(self):
+        """Test the convergents and semiconvergents of 415/93."""
+        f = Fraction(415, 93)
+        result = [str(c) for c in f.convergents(semiconvergents=True)]
+        self.assertEqual(result[:5], ["4", "5", "9/2", "13/3", "22/5"])
+        self.assertEqual(result[-1], "415/93")
+        self.assertEqual(len(result), 1 + 2 + 6 + 7)
+
+    def test_convergents_is_lazy(self):
+        """Test that convergents are generated lazily."""
+        f = Fraction(2 ** 4000 + 1, 3 ** 2500)
+        first = next(f.convergents())
+        self.assertTrue(first.is_integer())
+
+    def test_limit_denominator_pi(self):
+        """Test the best approximation of an approximation of pi with a small denominator."""
+        f = Fraction(3141592653589793, 1000000000000000)
+        self.assertEqual(f.limit_denominator(10), Fraction(22, 7))
+        self.assertEqual(f.limit_denominator(1000), Fraction(355, 113))
+
+    def test_limit_denominator_uses_semiconvergent(self):
+        """Test that limit_denominator can return a semiconvergent (415/93 with max 10 gives 40/9)."""
+        f = Fraction(415, 93)
+        self.assertEqual(f.limit_denominator(10), Fraction(40, 9))
+
+    def test_limit_denominator_small_fraction_unchanged(self):
+        """Test that a fraction with a small enough denominator is returned unchanged."""
+        f = Fraction(3, 7)
+        self.assertIs(f.limit_denominator(7), f)
+
+    def test_limit_denominator_invalid(self):
+        """Test that a denominator bound lower than 1 raises a ValueError."""
+        f = Fraction(3, 7)
+        with self.assertRaises(ValueError):
+            f.limit_denominator(0)
+
+    def test_compare(self):
+        """Test the comparison of fractions through their continued fraction expansions."""
+        self.assertEqual(Fraction(1, 3).compare(Fraction(1, 2)), -1)
+        self.assertEqual(Fraction(1, 2).compare(Fraction(1, 3)), 1)
+        self.assertEqual(Fraction(2, 4).compare(Fraction(1, 2)), 0)
+        self.assertEqual(Fraction(-1, 2).compare(0), -1)
+        self.assertEqual(Fraction(7, 2).compare(3.5), 0)
+
+    def test_compare_prefix_expansions(self):
+        """Test the comparison when one expansion is a prefix of the other ([0; 2] and [0; 2, 3])."""
+        self.assertEqual(Fraction(1, 2).compare(Fraction(3, 7)), 1)
+        self.assertEqual(Fraction(3, 7).compare(Fraction(1, 2)), -1)
+
+    def test_compare_huge_fractions(self):
+        """Test the comparison of two huge fractions differing by a tiny amount."""
+        big = 7 ** 3000
+        f = Fraction(big + 1, big)
+        f2 = Fraction(big + 2, big + 1)
+        self.assertEqual(f.compare(f2), 1)
+        self.assertEqual(f2.compare(f), -1)
+
+    def test_compare_invalid_type(self):
+        """Test that comparing with an invalid type raises WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            Fraction(1, 2).compare("1/2")
+
+
+    """Test ordering between fractions and other types."""
+
+    def test_less_than(self):
+        """Test the < operator between fractions."""
+        self.assertTrue(Fraction(1, 3) < Fraction(1, 2))
+        self.assertFalse(Fraction(1, 2) < Fraction(2, 4))
+
+    def test_less_or_equal(self):
+        """Test the <= operator between fractions."""
+        self.assertTrue(Fraction(1, 2) <= Fraction(2, 4))
+        self.assertFalse(Fraction(3, 4) <= Fraction(2, 3))
+
+    def test_greater_than_with_negative_denominator(self):
+        """Test the > operator with a fraction built from a negative denominator."""
+        self.assertTrue(Fraction(1, 3) > Fraction(1, -2))
+
+    def test_greater_or_equal_with_integer_and_float(self):
+        """Test the >= operator with an integer and a float."""
+        self.assertTrue(Fraction(7, 2) >= 3)
+        self.assertTrue(Fraction(1, 2) >= 0.5)
+        self.assertFalse(Fraction(1, 3) >= 0.5)
+
+    def test_ordering_of_close_huge_fractions(self):
+        """Test that ordering is exact for fractions closer than float precision."""
+        big = 2 ** 100
+        self.assertTrue(Fraction(big + 1, big) < Fraction(big + 2, big))
+
+    def test_sorted_fractions(self):
+        """Test that a list of fractions can be sorted exactly."""
+        values = [Fraction(3, 4), Fraction(-1, 2), Fraction(1, 3)]
+        self.assertEqual(sorted(values), [Fraction(-1, 2), Fraction(1, 3), Fraction(3, 4)])
+
+    def test_ordering_with_invalid_type(self):
+        """Test that ordering with an invalid type raises WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            result = Fraction(1, 2) < "1"
+
+
+    """Test interoperability with fractions.Fraction, Decimal and reflected operators."""
+
+    def test_from_std_fraction(self):
+        """Test the conversion from a fractions.Fraction."""
+        result = Fraction.from_std_fraction(fractions.Fraction(-6, 8))
+        self.assertEqual(result.numerator, -3)
+        self.assertEqual(result.denominator, 4)
+
+    def test_to_std_fraction(self):
+        """Test the conversion to a fractions.Fraction."""
+        result = Fraction(3, -9).to_std_fraction()
+        self.assertIsInstance(result, fractions.Fraction)
+        self.assertEqual(result, fractions.Fraction(-1, 3))
+
+    def test_from_decimal_is_exact(self):
+        """Test that a Decimal is converted exactly (0.1 gives 1/10)."""
+        self.assertEqual(Fraction.from_decimal(Decimal("0.1")), Fraction(1, 10))
+        self.assertEqual(Fraction.from_decimal(Decimal("-1.5E+3")), Fraction(-1500, 1))
+
+    def test_from_decimal_infinite(self):
+        """Test that an infinite Decimal raises an OverflowError."""
+        with self.assertRaises(OverflowError):
+            Fraction.from_decimal(Decimal("Infinity"))
+
+    def test_to_decimal(self):
+        """Test the conversion to a Decimal with the current and a given context."""
+        self.assertEqual(Fraction(1, 4).to_decimal(), Decimal("0.25"))
+        self.assertEqual(Fraction(1, 3).to_decimal(Context(prec=5)), Decimal("0.33333"))
+
+    def test_arithmetic_with_std_fraction(self):
+        """Test arithmetic between Fraction and fractions.Fraction in both orders."""
+        f = Fraction(1, 3)
+        other = fractions.Fraction(1, 6)
+        self.assertEqual(f + other, Fraction(1, 2))
+        self.assertEqual(other - f, Fraction(-1, 6))
+        self.assertIsInstance(other * f, Fraction)
+
+    def test_arithmetic_with_decimal(self):
+        """Test arithmetic between Fraction and Decimal in both orders."""
+        f = Fraction(1, 3)
+        self.assertEqual(f * Decimal("0.25"), Fraction(1, 12))
+        self.assertEqual(Decimal("0.25") / f, Fraction(3, 4))
+
+    def test_reflected_operators_with_integers(self):
+        """Test the reflected operators with an integer on the left."""
+        f = Fraction(1, 3)
+        self.assertEqual(1 + f, Fraction(4, 3))
+        self.assertEqual(2 - f, Fraction(5, 3))
+        self.assertEqual(3 * f, Fraction(1, 1))
+        self.assertEqual(3 / f, Fraction(9, 1))
+        self.assertEqual(sum([f, f, f]), Fraction(1, 1))
+
+    def test_reflected_division_by_zero_fraction(self):
+        """Test that dividing by a zero fraction from the left raises DenominatorIsZero."""
+        with self.assertRaises(DenominatorIsZero):
+            result = 1 / Fraction(0, 1)
+
+    def test_comparisons_with_std_fraction_and_decimal(self):
+        """Test equality and ordering with fractions.Fraction and Decimal in both orders."""
+        f = Fraction(1, 10)
+        self.assertTrue(f == fractions.Fraction(2, 20))
+        self.assertTrue(fractions.Fraction(2, 20) == f)
+        self.assertTrue(Decimal("0.1") == f)
+        self.assertTrue(fractions.Fraction(1, 11) < f)
+        self.assertTrue(Decimal("0.2") > f)
+
+    def test_reflected_operator_with_invalid_type(self):
+        """Test that a reflected operator with an invalid type raises WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            result = "1" + Fraction(1, 2)
+
+
+    # ------------------ Float conversion ------------------
+
+    def test_float_of_huge_terms(self):
+        """Test the float of a fraction whose terms overflow floats but whose value does not."""
+        f = Fraction(10 ** 400 + 1, 3 * 10 ** 399)
+        self.assertEqual(float(f), float(fractions.Fraction(10 ** 400 + 1, 3 * 10 ** 399)))
+
+    def test_float_is_correctly_rounded(self):
+        """Test that float conversion matches fractions.Fraction on huge random terms."""
+        rng = random.Random(34)
+        for _ in range(200):
+            num = rng.randint(-10 ** 500, 10 ** 500)
+            den = rng.randint(1, 10 ** rng.randint(450, 550))
+            self.assertEqual(float(Fraction(num, den)), float(fractions.Fraction(num, den)))
+
+    def test_float_overflow_saturates(self):
+        """Test that a value beyond the largest float converts to +/- inf."""
+        self.assertEqual(float(Fraction(10 ** 400, 3)), float("inf"))
+        self.assertEqual(float(Fraction(10 ** 400, -3)), float("-inf"))
+
+    def test_float_underflow(self):
+        """Test that a value below the smallest float converts to 0.0."""
+        self.assertEqual(float(Fraction(1, 10 ** 400)), 0.0)
+        self.assertEqual(float(Fraction(3, 2 ** 1074 * 4)), 5e-324)
+
+
+    # ------------------ Operand coercion ------------------
+
+    def test_boolean_operand_rejected(self):
+        """Test that a boolean operand is consistently rejected."""
+        with self.assertRaises(WrongTypeError):
+            result = Fraction(1, 2) + True
+        with self.assertRaises(WrongTypeError):
+            result = False * Fraction(1, 2)
+        with self.assertRaises(WrongTypeError):
+            Fraction.is_correct(True)
+
+    def test_int_subclass_operand(self):
+        """Test that a subclass of int is converted like an integer."""
+        class Count(int):
+            pass
+
+        self.assertEqual(Fraction(1, 2) + Count(2), Fraction(5, 2))
+        self.assertEqual(Count(3) - Fraction(1, 2), Fraction(5, 2))
+
+    def test_index_operand(self):
+        """Test that a type implementing __index__ is converted like an integer."""
+        class Index:
+            def __index__(self):
+                return 4
+
+        self.assertEqual(Fraction(1, 2) * Index(), Fraction(2, 1))
+        self.assertEqual(Fraction.convert_to_fraction(Index()), Fraction(4, 1))
+
+    def test_float_subclass_operand(self):
+        """Test that a subclass of float is converted like a float."""
+        class Ratio(float):
+            pass
+
+        self.assertEqual(Fraction(1, 4) + Ratio(0.5), Fraction(3, 4))
+
+    def test_coercion_is_cached(self):
+        """Test that the coercion routine of a type is resolved once and cached."""
+        class Unknown:
+            pass
+
+        result = Fraction(1, 2) + 1.5
+        self.assertIs(Fraction._coercions[float], Fraction._coercion(float))
+        for _ in range(2):
+            with self.assertRaises(WrongTypeError):
+                result = Fraction(1, 2) + Unknown()
+        self.assertIsNone(Fraction._coercions[Unknown])
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "NumPy n'est pas installé")
+    def test_numpy_scalar_operands(self):
+        """Test the NumPy integer, float and boolean scalars."""
+        import numpy
+
+        self.assertEqual(Fraction(1, 2) + numpy.int64(1), Fraction(3, 2))
+        self.assertEqual(numpy.int8(2) * Fraction(1, 4), Fraction(1, 2))
+        self.assertEqual(Fraction(1, 2) + numpy.float64(0.25), Fraction(3, 4))
+        self.assertEqual(Fraction(1, 1) + numpy.float32(0.5), Fraction(3, 2))
+        with self.assertRaises(WrongTypeError):
+            result = Fraction(1, 2) + numpy.bool_(True)
+
+
+    # ------------------ Integer parts and remainders ------------------
+
+    def test_floor_and_ceil(self):
+        """Test math.floor and math.ceil on positive, negative and integer fractions."""
+        self.assertEqual((math.floor(Fraction(7, 2)), math.ceil(Fraction(7, 2))), (3, 4))
+        self.assertEqual((math.floor(Fraction(-7, 2)), math.ceil(Fraction(-7, 2))), (-4, -3))
+        self.assertEqual((math.floor(Fraction(6, 3)), math.ceil(Fraction(6, 3))), (2, 2))
+
+    def test_trunc(self):
+        """Test that math.trunc rounds towards zero."""
+        self.assertEqual(math.trunc(Fraction(7, 2)), 3)
+        self.assertEqual(math.trunc(Fraction(-7, 2)), -3)
+
+    def test_integer_parts_beyond_float_precision(self):
+        """Test exact integer parts of fractions beyond 2**53."""
+        f = Fraction(3 * 2 ** 80 + 1, 3)
+        self.assertEqual(math.floor(f), 2 ** 80)
+        self.assertEqual(math.ceil(f), 2 ** 80 + 1)
+        self.assertEqual(Fraction(2 ** 60 + 1, 1).as_mixed_number(), str(2 ** 60 + 1))
+
+    def test_round_half_to_even(self):
+        """Test banker's rounding to an integer."""
+        self.assertEqual([round(Fraction(n, 2)) for n in (1, 3, 5, -1, -3)], [0, 2, 2, 0, -2])
+        self.assertEqual(round(Fraction(2, 3)), 1)
+
+    def test_round_with_digits(self):
+        """Test rounding to a number of decimal digits, positive or negative."""
+        self.assertEqual(round(Fraction(2, 3), 2), Fraction(67, 100))
+        self.assertEqual(round(Fraction(1, 8), 2), Fraction(3, 25))  # 0.125 -> 0.12
+        self.assertEqual(round(Fraction(1250, 1), -2), Fraction(1200, 1))
+        self.assertIsInstance(round(Fraction(1, 3), 0), Fraction)
+
+    def test_round_invalid_digits(self):
+        """Test that non integer digits raise a TypeError."""
+        with self.assertRaises(TypeError):
+            round(Fraction(1, 3), 1.5)
+
+    def test_floordiv_mod_divmod(self):
+        """Test //, % and divmod against fractions.Fraction on mixed signs."""
+        for a, b in [((7, 2), (1, 3)), ((-7, 2), (1, 3)), ((7, 2), (-1, 3)), ((-7, 2), (-2, 5))]:
+            x, y = Fraction(*a), Fraction(*b)
+            expected_q, expected_r = divmod(fractions.Fraction(*a), fractions.Fraction(*b))
+            self.assertEqual(x // y, expected_q)
+            self.assertEqual(x % y, Fraction(expected_r.numerator, expected_r.denominator))
+            self.assertEqual(divmod(x, y), (expected_q, Fraction(expected_r.numerator, expected_r.denominator)))
+
+    def test_floordiv_with_integers(self):
+        """Test // and % with integer operands on both sides."""
+        self.assertEqual(Fraction(7, 2) // 2, 1)
+        self.assertEqual(7 // Fraction(2, 1), 3)
+        self.assertEqual(7 % Fraction(3, 2), Fraction(1, 1))
+        self.assertEqual(divmod(5, Fraction(3, 2)), (3, Fraction(1, 2)))
+
+    def test_floordiv_by_zero(self):
+        """Test that dividing by a zero fraction raises DenominatorIsZero."""
+        with self.assertRaises(DenominatorIsZero):
+            Fraction(1, 2) // Fraction(0, 1)
+        with self.assertRaises(DenominatorIsZero):
+            Fraction(1, 2) % 0
+
+    def test_floordiv_invalid_type(self):
+        """Test that an invalid operand raises WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            Fraction(1, 2) // "2"
+
+
+    # ------------------ Linear combinations ------------------
+
+    def test_dot_against_operators(self):
+        """Test dot against the operator loop on mixed int, float and Fraction inputs."""
+        rng = random.Random(46)
+        weights = [rng.choice((rng.randint(-9, 9), Fraction(rng.randint(-9, 9), rng.randint(1, 9)), 0.25))
+                   for _ in range(500)]
+        values = [Fraction(rng.randint(-99, 99), rng.randint(1, 60)) for _ in range(500)]
+        expected = Fraction(0, 1)
+        for w, x in zip(weights, values):
+            expected = expected + Fraction.convert_to_fraction(w) * x
+        result = Fraction.dot(weights, values)
+        self.assertEqual(result, expected)
+        self.assertEqual(math.gcd(result.numerator, result.denominator), 1)
+
+    def test_dot_generators(self):
+        """Test dot on generators."""
+        result = Fraction.dot((k for k in range(1, 5)), (Fraction(1, k) for k in range(1, 5)))
+        self.assertEqual(result, Fraction(4, 1))
+        self.assertEqual(Fraction.dot([], []), Fraction(0, 1))
+
+    def test_linear_combination(self):
+        """Test linear_combination on (coefficient, value) pairs."""
+        pairs = [(Fraction(1, 2), Fraction(2, 3)), (3, Fraction(-1, 9)), (Fraction(5, 6), 2)]
+        self.assertEqual(Fraction.linear_combination(pairs), Fraction(5, 3))
+        self.assertEqual(Fraction.linear_combination(iter(pairs)).denominator, 3)
+
+    def test_dot_errors(self):
+        """Test the length check and the invalid values."""
+        with self.assertRaises(ValueError):
+            Fraction.dot([1, 2], [Fraction(1, 2)])
+        with self.assertRaises(ValueError):
+            Fraction.dot([1], (x for x in [1, 2]))
+        with self.assertRaises(WrongTypeError):
+            Fraction.dot([1, "2"], [1, 2])
+        with self.assertRaises(WrongTypeError):
+            Fraction.linear_combination([(True, 1)])
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "NumPy n'est pas installé")
+    def test_dot_numpy_arrays(self):
+        """Test dot on NumPy integer arrays."""
+        import numpy
+
+        weights = numpy.arange(1, 6, dtype=numpy.int64)
+        values = [Fraction(1, k) for k in range(1, 6)]
+        self.assertEqual(Fraction.dot(weights, values), Fraction(5, 1))
+        self.assertEqual(Fraction.dot(weights, weights), Fraction(55, 1))
+
+    # ------------------ Running totals ------------------
+
+    def test_cumsum_against_operators(self):
+        """Test cumsum against the operator loop on mixed int, float and Fraction inputs."""
+        rng = random.Random(50)
+        values = [rng.choice((rng.randint(-9, 9), Fraction(rng.randint(-99, 99), rng.randint(1, 30)), 0.75))
+                  for _ in range(300)]
+        total = Fraction(0, 1)
+        for value, result in zip(values, Fraction.cumsum(values), strict=True):
+            total = total + value
+            self.assertEqual(result, total)
+            self.assertEqual(math.gcd(result.numerator, result.denominator), 1)
+
+    def test_cumprod_against_operators(self):
+        """Test cumprod against the operator loop, including a zero factor."""
+        values = [Fraction(k, k + 40) for k in range(-5, 30)] + [Fraction(-7, 3)]
+        product = Fraction(1, 1)
+        for value, result in zip(values, Fraction.cumprod(values), strict=True):
+            product = product * value
+            self.assertEqual(result, product)
+            self.assertEqual(math.gcd(result.numerator, result.denominator), 1)
+
+    def test_running_totals_are_lazy(self):
+        """Test that cumsum and cumprod consume their input on demand."""
+        values = iter([Fraction(1, 2), Fraction(1, 3), "x"])
+        sums = Fraction.cumsum(values)
+        self.assertEqual(next(sums), Fraction(1, 2))
+        self.assertEqual(next(sums), Fraction(5, 6))
+        with self.assertRaises(WrongTypeError):
+            next(sums)
+        self.assertEqual(list(Fraction.cumsum([])), [])
+        self.assertEqual(list(Fraction.cumprod((k for k in [2, 3]))), [Fraction(2, 1), Fraction(6, 1)])
+
+
 if __name__ == '__main__':
     unittest.main()
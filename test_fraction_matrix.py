@@ -0,0 +1,125 @@
+import unittest
+
+from Fraction import Fraction, WrongTypeError
+from Fraction.fraction_matrix import FractionMatrix, SingularMatrixError
+
+
+class TestFractionMatrix(unittest.TestCase):
+    """Unit tests for the FractionMatrix class."""
+
+    def test_creation_and_access(self):
+        """Test that coefficients are stored exactly and returned reduced."""
+        m = FractionMatrix([[Fraction(1, 2), 3], [0.25, Fraction(4, 6)]])
+        self.assertEqual(m.shape, (2, 2))
+        self.assertEqual(m[0, 0], Fraction(1, 2))
+        self.assertEqual(m[1, 0], Fraction(1, 4))
+        self.assertEqual(str(m[1, 1]), "2/3")
+
+    def test_ragged_rows(self):
+        """Test that rows of different lengths raise a ValueError."""
+        with self.assertRaises(ValueError):
+            FractionMatrix([[1, 2], [3]])
+
+    def test_empty_matrix(self):
+        """Test that an empty matrix raises a ValueError."""
+        with self.assertRaises(ValueError):
+            FractionMatrix([])
+
+    def test_invalid_coefficient(self):
+        """Test that an invalid coefficient raises WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            FractionMatrix([[1, "2"]])
+
+    def test_str(self):
+        """Test the textual representation of a matrix."""
+        m = FractionMatrix([[Fraction(1, 2), 1], [0, Fraction(-2, 3)]])
+        self.assertEqual(str(m), "[1/2, 1]\n[0, -2/3]")
+
+    def test_determinant(self):
+        """Test the determinant of a 2x2 matrix of fractions."""
+        m = FractionMatrix([[Fraction(1, 2), Fraction(1, 3)], [Fraction(1, 4), Fraction(1, 5)]])
+        self.assertEqual(m.determinant(), Fraction(1, 60))
+
+    def test_determinant_with_row_swap(self):
+        """Test the determinant when a row swap is needed (sign change)."""
+        m = FractionMatrix([[0, 1, 2], [1, 0, 3], [4, -3, 8]])
+        self.assertEqual(m.determinant(), Fraction(-2, 1))
+
+    def test_determinant_singular(self):
+        """Test that a singular matrix has a zero determinant."""
+        m = FractionMatrix([[1, 2], [Fraction(1, 2), 1]])
+        self.assertTrue(m.determinant().is_zero())
+
+    def test_determinant_not_square(self):
+        """Test that the determinant of a non square matrix raises a ValueError."""
+        with self.assertRaises(ValueError):
+            FractionMatrix([[1, 2, 3], [4, 5, 6]]).determinant()
+
+    def test_rank(self):
+        """Test the rank of full rank, deficient and rectangular matrices."""
+        self.assertEqual(FractionMatrix([[1, 2], [3, 4]]).rank(), 2)
+        self.assertEqual(FractionMatrix([[1, 2, 3], [2, 4, 6], [1, 1, 1]]).rank(), 2)
+        self.assertEqual(FractionMatrix([[0, 0, 1], [0, 0, 2]]).rank(), 1)
+        self.assertEqual(FractionMatrix([[0, 0], [0, 0]]).rank(), 0)
+
+    def test_matmul(self):
+        """Test the matrix product of two matrices of fractions."""
+        a = FractionMatrix([[Fraction(1, 2), 1], [0, 2]])
+        b = FractionMatrix([[2, 0], [Fraction(1, 3), 1]])
+        self.assertEqual(a @ b, FractionMatrix([[Fraction(4, 3), 1], [Fraction(2, 3), 2]]))
+
+    def test_matmul_incompatible(self):
+        """Test that the product of incompatible matrices raises a ValueError."""
+        with self.assertRaises(ValueError):
+            FractionMatrix([[1, 2]]) @ FractionMatrix([[1, 2]])
+
+    def test_inverse(self):
+        """Test that a matrix multiplied by its inverse gives the identity."""
+        m = FractionMatrix([[Fraction(1, 2), Fraction(1, 3), 1], [Fraction(1, 4), Fraction(1, 5), 0], [2, 0, 1]])
+        self.assertEqual(m @ m.inverse(), FractionMatrix.identity(3))
+        self.assertEqual(m.inverse() @ m, FractionMatrix.identity(3))
+
+    def test_inverse_singular(self):
+        """Test that inverting a singular matrix raises SingularMatrixError."""
+        with self.assertRaises(SingularMatrixError):
+            FractionMatrix([[1, 2], [2, 4]]).inverse()
+
+    def test_solve_vector(self):
+        """Test the resolution of a linear system with a vector right-hand side."""
+        m = FractionMatrix([[2, 1], [1, 3]])
+        result = m.solve([Fraction(1, 2), 1])
+        self.assertEqual(result, [Fraction(1, 10), Fraction(3, 10)])
+
+    def test_solve_with_pivoting(self):
+        """Test the resolution of a system whose first pivot is zero."""
+        m = FractionMatrix([[0, 1, 1], [1, 0, 1], [1, 1, 0]])
+        result = m.solve([2, Fraction(1, 3), 0.5])
+        self.assertEqual(result, [Fraction(-7, 12), Fraction(13, 12), Fraction(11, 12)])
+
+    def test_solve_matrix(self):
+        """Test the resolution of a system with several right-hand sides."""
+        m = FractionMatrix([[Fraction(1, 2), 1], [3, Fraction(1, 7)]])
+        rhs = FractionMatrix([[1, 0], [Fraction(2, 5), 1]])
+        self.assertEqual(m @ m.solve(rhs), rhs)
+
+    def test_solve_singular(self):
+        """Test that solving a singular system raises SingularMatrixError."""
+        with self.assertRaises(SingularMatrixError):
+            FractionMatrix([[1, 1], [1, 1]]).solve([1, 2])
+
+    def test_solve_wrong_size(self):
+        """Test that a right-hand side of the wrong size raises a ValueError."""
+        with self.assertRaises(ValueError):
+            FractionMatrix([[1, 0], [0, 1]]).solve([1, 2, 3])
+
+    def test_solve_hilbert(self):
+        """Test the resolution of an ill-conditioned Hilbert system (exact arithmetic)."""
+        n = 8
+        m = FractionMatrix([[Fraction(1, i + j + 1) for j in range(n)] for i in range(n)])
+        expected = [Fraction(k + 1, 1) for k in range(n)]
+        rhs = [sum((m[i, j] * expected[j] for j in range(n)), Fraction(0, 1)) for i in range(n)]
+        self.assertEqual(m.solve(rhs), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
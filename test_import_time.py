@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import Fraction
+
+# Budget du temps d'import cumulé de `import Fraction` (bytecode déjà compilé), en microsecondes
+IMPORT_BUDGET_US = 5000
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# Modules standard coûteux et tous les sous-systèmes paresseux du paquet (y compris ceux ajoutés plus tard)
+HEAVY_MODULES = ("fractions", "decimal", "concurrent.futures",
+                 *sorted(f"Fraction.{name}" for name in Fraction._SUBMODULES))
+
+
+def run_python(code, pycache):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def cumulative_import_time(stderr, module):
+    """Return the cumulative import time (us) of module from the output of -X importtime."""
+    for line in stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} absent de la sortie de -X importtime")
+
+
+class TestImportTime(unittest.TestCase):
+    """Check that importing the core Fraction type stays cheap."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pycache = tempfile.TemporaryDirectory()
+        run_python("import Fraction", cls.pycache.name)  # Compilation du bytecode
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pycache.cleanup()
+
+    def test_core_import_within_budget(self):
+        """Test that `import Fraction` stays under the import-time budget (best of 3 runs)."""
+        timings = [cumulative_import_time(run_python("import Fraction", self.pycache.name).stderr, "Fraction")
+                   for _ in range(3)]
+        self.assertLess(min(timings), IMPORT_BUDGET_US)
+
+    def test_subsystems_are_lazy(self):
+        """Test that no optional subsystem nor heavy standard module is loaded by `import Fraction`."""
+        code = f"import sys, Fraction; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        self.assertEqual(run_python(code, self.pycache.name).stdout.strip(), "[]")
+
+    def test_lazy_attribute_loads_subsystem(self):
+        """Test that accessing a lazy attribute loads its subsystem on demand."""
+        code = ("import sys, Fraction; assert 'Fraction.fraction_matrix' not in sys.modules; "
+                "m = Fraction.FractionMatrix([[1]]); print('Fraction.fraction_matrix' in sys.modules)")
+        self.assertEqual(run_python(code, self.pycache.name).stdout.strip(), "True")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import copy
+import gc
+import pickle
+import threading
+import unittest
+
+from Fraction import Fraction
+from Fraction.interning import InternPool, enable_interning, disable_interning, interning_stats
+
+
+class TestInterning(unittest.TestCase):
+    """Unit tests for the interning pool of repeated values."""
+
+    def setUp(self):
+        self.pool = enable_interning(max_size=1000, pinned=(0, 1, Fraction(1, 2)))
+
+    def tearDown(self):
+        disable_interning()
+
+    def test_canonical_instances(self):
+        """Test that constructors and operators return the canonical instance."""
+        half = Fraction(1, 2)
+        self.assertIs(Fraction(2, 4), half)
+        self.assertIs(Fraction(1, 4) + Fraction(1, 4), half)
+        self.assertIs(Fraction(3, 4) - Fraction(1, 4), half)
+        self.assertIs(Fraction(1, 4) * 2, half)
+        self.assertIs(Fraction(10 ** 30, 3 * 10 ** 30), Fraction(1, 3))
+
+    def test_values_unchanged(self):
+        """Test that the interned results keep the exact values."""
+        self.assertEqual(str(Fraction(3, -6)), "-1/2")
+        self.assertEqual(Fraction(5, 10) + Fraction(1, 3), Fraction(5, 6))
+        self.assertEqual(Fraction(0, 5), 0)
+
+    def test_weak_eviction(self):
+        """Test that a value no longer used leaves the pool, unlike the pinned values."""
+        value = Fraction(7, 9)
+        size = len(self.pool)
+        del value
+        gc.collect()
+        self.assertEqual(len(self.pool), size - 1)
+        self.assertIs(Fraction(0, 3), Fraction(0, 1))
+        self.assertEqual(len(self.pool), size - 1)
+
+    def test_bounded_size(self):
+        """Test that values beyond max_size are not interned."""
+        pool = enable_interning(max_size=4)
+        values = [Fraction(1, k) for k in range(2, 10)]
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(pool.rejected, 4)
+        self.assertIsNot(Fraction(1, 9), values[-1])
+        self.assertEqual(Fraction(1, 9), values[-1])
+
+    def test_equality_fast_path(self):
+        """Test the equality of interned, plain and foreign-generation instances."""
+        a, b = Fraction(1, 3), Fraction(2, 3)
+        plain = Fraction._from_reduced(1, 3)
+        self.assertTrue(a == a)
+        self.assertFalse(a == b)
+        self.assertTrue(a == plain and plain == a)
+        self.pool.clear()
+        fresh = Fraction(1, 3)
+        self.assertIsNot(fresh, a)
+        self.assertTrue(fresh == a)
+
+    def test_copy_and_pickle(self):
+        """Test that copies and pickles give back the canonical instance."""
+        half = Fraction(1, 2)
+        self.assertIs(copy.deepcopy(half), half)
+        self.assertIs(pickle.loads(pickle.dumps(half)), half)
+
+    def test_stats(self):
+        """Test the hit rate and the estimated memory saving."""
+        values = [Fraction(1, 4) for _ in range(100)]
+        stats = interning_stats()
+        self.assertGreaterEqual(stats["hits"], 99)
+        self.assertGreater(stats["hit_rate"], 0.5)
+        self.assertGreater(stats["memory_saved_bytes"], 90 * 48)
+        del values
+
+    def test_threads(self):
+        """Test that concurrent constructions share a single canonical instance."""
+        results = []
+        threads = [threading.Thread(target=lambda: results.extend(Fraction(k, 11) for k in range(200)))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        by_value = {}
+        for f in results:
+            by_value.setdefault((f.numerator, f.denominator), set()).add(id(f))
+        self.assertTrue(all(len(ids) == 1 for ids in by_value.values()))
+
+    def test_eviction_does_not_remove_a_new_instance(self):
+        """Test that a weakref callback racing with a new construction keeps the new canonical instance."""
+        pool = enable_interning(max_size=1000)
+        paused, resume = threading.Event(), threading.Event()
+        evicting = []
+
+        class PausingDict(dict):
+            # Suspend the weakref callback between its lookup and its removal
+            def get(self, key, default=None):
+                result = dict.get(self, key, default)
+                if threading.current_thread() in evicting:
+                    paused.set()
+                    resume.wait(5)
+                return result
+
+        pool._refs = PausingDict(pool._refs)
+        created = []
+
+        def evict():
+            value = Fraction(1, 7)
+            evicting.append(threading.current_thread())
+            del value  # Rappel du weakref dans ce thread
+
+        evictor = threading.Thread(target=evict)
+        builder = threading.Thread(target=lambda: created.append(Fraction(1, 7)))
+        evictor.start()
+        self.assertTrue(paused.wait(5))
+        builder.start()
+        builder.join(0.2)
+        resume.set()
+        evictor.join()
+        builder.join()
+        evicting.clear()
+        self.assertIs(Fraction(1, 7), created[0])
+        self.assertTrue(Fraction(2, 14) == created[0])
+
+    def test_disable(self):
+        """Test that disabling the pool gives fresh instances again."""
+        disable_interning()
+        self.assertIsNone(interning_stats())
+        self.assertIsNot(Fraction(1, 2), Fraction(1, 2))
+
+    def test_invalid_size(self):
+        """Test the validation of max_size."""
+        with self.assertRaises(TypeError):
+            InternPool(1.5)
+        with self.assertRaises(ValueError):
+            InternPool(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import fractions
+import unittest
+from array import array
+from decimal import Decimal, Context
+
+from Fraction import Fraction
+from Fraction.interop import from_std_fractions, to_std_fractions, from_decimals, to_decimals, from_ints, \
+    to_float_array
+
+
+class TestInterop(unittest.TestCase):
+    """Unit tests for the bulk converters."""
+
+    def test_from_std_fractions(self):
+        """Test the bulk conversion from fractions.Fraction."""
+        result = from_std_fractions([fractions.Fraction(2, 4), fractions.Fraction(-3), fractions.Fraction(0)])
+        self.assertEqual([str(f) for f in result], ["1/2", "-3", "0"])
+
+    def test_to_std_fractions(self):
+        """Test the bulk conversion to fractions.Fraction."""
+        result = to_std_fractions([Fraction(1, 2), Fraction(-4, 6)])
+        self.assertEqual(result, [fractions.Fraction(1, 2), fractions.Fraction(-2, 3)])
+        self.assertTrue(all(isinstance(f, fractions.Fraction) for f in result))
+
+    def test_from_decimals(self):
+        """Test the exact bulk conversion from Decimal."""
+        result = from_decimals([Decimal("0.1"), Decimal("-2.50"), Decimal("3E+2")])
+        self.assertEqual(result, [Fraction(1, 10), Fraction(-5, 2), Fraction(300, 1)])
+
+    def test_from_decimals_nan(self):
+        """Test that a NaN Decimal raises a ValueError."""
+        with self.assertRaises(ValueError):
+            from_decimals([Decimal("NaN")])
+
+    def test_to_decimals(self):
+        """Test the bulk conversion to Decimal with a given context."""
+        result = to_decimals([Fraction(1, 8), Fraction(2, 3)], Context(prec=4))
+        self.assertEqual(result, [Decimal("0.125"), Decimal("0.6667")])
+
+    def test_from_ints(self):
+        """Test the bulk conversion from integers."""
+        result = from_ints([0, -7, 10 ** 30])
+        self.assertEqual(result, [Fraction(0, 1), Fraction(-7, 1), Fraction(10 ** 30, 1)])
+
+    def test_round_trip(self):
+        """Test that converting to fractions.Fraction and back gives the same values."""
+        values = [Fraction(n, d) for n in range(-5, 6) for d in range(1, 6)]
+        self.assertEqual(from_std_fractions(to_std_fractions(values)), values)
+
+    def test_to_float_array(self):
+        """Test the bulk conversion to a new array of doubles."""
+        result = to_float_array([Fraction(1, 4), Fraction(-2, 3), Fraction(10 ** 400 + 1, 10 ** 399)])
+        self.assertIsInstance(result, array)
+        self.assertEqual(result.typecode, "d")
+        self.assertEqual(list(result), [0.25, -2 / 3, 10.0])
+
+    def test_to_float_array_overflow(self):
+        """Test that values beyond the largest float become +/- inf in the array."""
+        result = to_float_array([Fraction(1, 2), Fraction(10 ** 400, 1), Fraction(-10 ** 400, 7)])
+        self.assertEqual(list(result), [0.5, float("inf"), float("-inf")])
+
+    def test_to_float_array_generator_overflow(self):
+        """Test that a generator with an overflowing value is fully converted, in any order."""
+        values = [Fraction(10 ** 400, 1), Fraction(1, 2), Fraction(3, 4)]
+        self.assertEqual(list(to_float_array(v for v in values)), [float("inf"), 0.5, 0.75])
+        self.assertEqual(list(to_float_array(v for v in reversed(values))), [0.75, 0.5, float("inf")])
+
+    def test_to_float_array_into_buffer(self):
+        """Test that a given buffer of doubles is filled in place."""
+        out = array("d", [9.0] * 4)
+        self.assertIs(to_float_array([Fraction(1, 2), Fraction(3, 1)], out), out)
+        self.assertEqual(list(out), [0.5, 3.0, 9.0, 9.0])
+
+    def test_to_float_array_wrong_buffer(self):
+        """Test that a buffer of the wrong type or size raises a ValueError."""
+        with self.assertRaises(ValueError):
+            to_float_array([Fraction(1, 2)], array("f", [0.0]))
+        with self.assertRaises(ValueError):
+            to_float_array([Fraction(1, 2), Fraction(1, 3)], array("d", [0.0]))
+        with self.assertRaises(ValueError):
+            to_float_array([Fraction(1, 2)], bytes(8))
+
+    def test_to_float_array_not_a_buffer(self):
+        """Test that an out argument which is not a buffer raises a ValueError."""
+        for out in ([0.0], (0.0,), 0.0, "0.0"):
+            with self.subTest(out=out):
+                with self.assertRaises(ValueError):
+                    to_float_array([Fraction(1, 2)], out)
+
+
+if __name__ == '__main__':
+    unittest.main()
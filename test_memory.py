@@ -0,0 +1,41 @@
+import sys
+import unittest
+
+from Fraction import Fraction
+from benchmarks import MEMORY_BASELINE, memory_operations, memory_per_call, memory_regressions, peak_memory
+
+
+class TestMemoryFootprint(unittest.TestCase):
+    """Check that the operators of Fraction do not allocate more than the recorded baseline."""
+
+    def test_operations_within_baseline(self):
+        """Test that no measured operation keeps more blocks or peaks higher than MEMORY_BASELINE."""
+        if MEMORY_BASELINE is None:
+            self.skipTest(f"Pas d'allocations de référence pour Python {sys.version_info[0]}.{sys.version_info[1]}")
+        measures = {name: memory_per_call(function, 500) for name, function in memory_operations().items()}
+        self.assertEqual(set(measures), set(MEMORY_BASELINE))
+        self.assertEqual(memory_regressions(measures), [])
+
+    def test_comparison_allocates_nothing(self):
+        """Test that == and < between two Fraction neither keep nor create any object."""
+        a, b = Fraction(3, 4), Fraction(5, 6)
+        for function in (lambda: a == b, lambda: a < b):
+            blocks, _, peak = memory_per_call(function, 500)
+            self.assertEqual((round(blocks), peak), (0, 0))
+
+    def test_regression_is_reported(self):
+        """Test that a measure above the baseline is reported as a regression."""
+        baseline = {"Fraction + Fraction": (2, 88)}
+        measures = {"Fraction + Fraction": (3, 0.0, 88)}
+        self.assertEqual(memory_regressions(measures, baseline), [("Fraction + Fraction", (3, 88), (2, 88))])
+        self.assertEqual(memory_regressions({"Fraction + Fraction": (2, 0.0, 100)}, baseline), [])
+
+    def test_peak_memory(self):
+        """Test that peak_memory returns the result and a peak covering the allocated objects."""
+        result, peak = peak_memory(lambda n: [Fraction(i, n) for i in range(n)], 1000)
+        self.assertEqual(len(result), 1000)
+        self.assertGreater(peak, 1000 * 56)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import random
+import unittest
+
+from Fraction import Fraction, WrongTypeError
+from Fraction.modular import modular_sum, modular_dot, rational_reconstruction, is_prime, word_primes, \
+    random_primes, PRIME_BITS
+
+
+class TestModularTools(unittest.TestCase):
+    """Unit tests for the primes and the rational reconstruction."""
+
+    def test_is_prime(self):
+        """Test the primality test on small and large integers."""
+        self.assertEqual([n for n in range(30) if is_prime(n)], [2, 3, 5, 7, 11, 13, 17, 19, 23, 29])
+        self.assertTrue(is_prime(2 ** 61 - 1))
+        self.assertFalse(is_prime(3215031751))  # Pseudo-premier fort pour les bases 2, 3, 5 et 7
+
+    def test_word_primes(self):
+        """Test that the generated primes are decreasing and fit in a word."""
+        primes = word_primes()
+        first = [next(primes) for _ in range(5)]
+        self.assertEqual(first, sorted(first, reverse=True))
+        self.assertTrue(all(p < 2 ** PRIME_BITS and is_prime(p) for p in first))
+
+    def test_rational_reconstruction(self):
+        """Test that a small fraction is recovered from its residue."""
+        modulus = 10 ** 9 + 7
+        residue = -3 * pow(7, -1, modulus) % modulus
+        self.assertEqual(rational_reconstruction(residue, modulus), (-3, 7))
+
+    def test_rational_reconstruction_failure(self):
+        """Test that no fraction is returned when none has small enough terms."""
+        self.assertIsNone(rational_reconstruction(9, 11 * 13))
+
+
+class TestModularSum(unittest.TestCase):
+    """Unit tests for the multi-modular exact sum and dot product."""
+
+    def test_telescoping_sum(self):
+        """Test a sum whose denominators grow but whose result is small, with the early exit."""
+        values = [Fraction(1, k * (k + 1)) for k in range(1, 2001)]
+        self.assertEqual(modular_sum(values), Fraction(2000, 2001))
+
+    def test_certified(self):
+        """Test that with check_primes=None the residues are accumulated up to the a priori bound."""
+        values = [Fraction(1, k * (k + 1)) for k in range(1, 200)]
+        self.assertEqual(modular_sum(values, check_primes=None), Fraction(199, 200))
+        self.assertEqual(modular_sum(values, check_primes=1), Fraction(199, 200))
+
+    def test_values_built_against_the_word_primes(self):
+        """Test a sum congruent to 1/2 modulo the first word primes, which random primes must reject."""
+        primes = word_primes()
+        multiple = 1
+        for _ in range(12):
+            multiple *= next(primes)
+        values = [Fraction(1, 2), multiple]
+        self.assertEqual(modular_sum(values), Fraction(2 * multiple + 1, 2))
+        self.assertEqual(modular_sum(values, check_primes=None), Fraction(2 * multiple + 1, 2))
+
+    def test_random_primes(self):
+        """Test that the verification primes are primes outside the range of word_primes."""
+        for p in random_primes(5):
+            self.assertTrue(is_prime(p))
+            self.assertEqual(p.bit_length(), PRIME_BITS + 1)
+
+    def test_cancelling_sum(self):
+        """Test a sum of opposite values in random order."""
+        rng = random.Random(36)
+        values = [Fraction(rng.randint(1, 10 ** 6), rng.randint(10 ** 5, 10 ** 6)) for _ in range(300)]
+        values += [Fraction(-v.numerator, v.denominator) for v in values] + [Fraction(-5, 3)]
+        rng.shuffle(values)
+        self.assertEqual(modular_sum(values), Fraction(-5, 3))
+
+    def test_large_result(self):
+        """Test a sum whose reduced result is large (certified by the a priori bound)."""
+        primes = [p for p in range(1000, 1400) if is_prime(p)]
+        values = [Fraction(1, p) for p in primes]
+        self.assertEqual(modular_sum(values), sum(values, Fraction(0, 1)))
+
+    def test_random_sums(self):
+        """Test random sums against Fraction arithmetic."""
+        rng = random.Random(36)
+        for size in (1, 2, 10, 100):
+            values = [Fraction(rng.randint(-10 ** 9, 10 ** 9), rng.randint(1, 10 ** 9)) for _ in range(size)]
+            self.assertEqual(modular_sum(values), sum(values, Fraction(0, 1)))
+
+    def test_denominator_multiple_of_a_prime(self):
+        """Test that a prime dividing a denominator is skipped."""
+        prime = next(word_primes())
+        values = [Fraction(1, prime), Fraction(1, 2), Fraction(-1, prime)]
+        self.assertEqual(modular_sum(values), Fraction(1, 2))
+
+    def test_mixed_and_empty(self):
+        """Test integers, floats and the empty sum."""
+        self.assertEqual(modular_sum([1, 0.5, Fraction(1, 4), -2]), Fraction(-1, 4))
+        self.assertEqual(modular_sum([]), Fraction(0, 1))
+
+    def test_several_workers(self):
+        """Test that the result does not depend on the number of threads."""
+        values = [Fraction(1, k * (k + 1)) for k in range(1, 500)]
+        self.assertEqual(modular_sum(values, workers=4), Fraction(499, 500))
+
+    def test_invalid_value(self):
+        """Test that an invalid value raises WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            modular_sum([Fraction(1, 2), "1"])
+
+    def test_dot(self):
+        """Test the exact dot product against Fraction arithmetic."""
+        rng = random.Random(36)
+        lefts = [Fraction(rng.randint(-99, 99), rng.randint(1, 99)) for _ in range(200)]
+        rights = [Fraction(rng.randint(-99, 99), rng.randint(1, 99)) for _ in range(200)]
+        expected = sum((a * b for a, b in zip(lefts, rights)), Fraction(0, 1))
+        self.assertEqual(modular_dot(lefts, rights), expected)
+
+    def test_dot_wrong_length(self):
+        """Test that vectors of different lengths raise a ValueError."""
+        with self.assertRaises(ValueError):
+            modular_dot([1, 2], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+from unittest import mock
+
+from Fraction import Fraction, WrongTypeError, parallel
+from Fraction.parallel import (batch_apply, parallel_sum, parallel_product, parallel_cumsum, parallel_cumprod,
+                               chunk_bounds)
+
+
+class TestParallel(unittest.TestCase):
+    """Unit tests for the thread-pool batch kernels."""
+
+    def setUp(self):
+        self.lefts = [Fraction(n, d) for n in range(-20, 21) for d in range(1, 8)]
+        self.rights = [Fraction(d, n) for n in range(1, 42) for d in range(1, 8)]
+
+    def test_chunk_bounds_cover_range(self):
+        """Test that chunks are contiguous and cover the whole range."""
+        bounds = chunk_bounds(10, 3, chunk_size=4)
+        self.assertEqual(bounds, [(0, 4), (4, 8), (8, 10)])
+        self.assertEqual(chunk_bounds(0, 4), [])
+
+    def test_chunk_bounds_invalid_size(self):
+        """Test that a chunk size which is not an integer >= 1 raises ValueError."""
+        for chunk_size in (0, -3, 2.5, True, "4"):
+            with self.subTest(chunk_size=chunk_size):
+                with self.assertRaises(ValueError):
+                    chunk_bounds(10, 2, chunk_size)
+        with self.assertRaises(ValueError):
+            parallel_sum(self.lefts, chunk_size=0)
+
+    def test_chunk_bounds_depend_on_gil(self):
+        """Test that free-threaded builds get more chunks than GIL builds."""
+        with mock.patch.object(parallel, "gil_enabled", return_value=True):
+            with_gil = chunk_bounds(100_000, 4)
+        with mock.patch.object(parallel, "gil_enabled", return_value=False):
+            without_gil = chunk_bounds(100_000, 4)
+        self.assertEqual(len(with_gil), 4)
+        self.assertEqual(len(without_gil), 16)
+
+    def test_batch_apply_named_operations(self):
+        """Test elementwise operations given by name, with several threads and small chunks."""
+        for name, expected in (("add", [a + b for a, b in zip(self.lefts, self.rights)]),
+                               ("mul", [a * b for a, b in zip(self.lefts, self.rights)]),
+                               ("truediv", [a / b for a, b in zip(self.lefts, self.rights)])):
+            self.assertEqual(batch_apply(name, self.lefts, self.rights, workers=4, chunk_size=10), expected)
+
+    def test_batch_apply_callable(self):
+        """Test an elementwise operation given as a function."""
+        result = batch_apply(lambda a, b: a - b, [Fraction(1, 2)], [Fraction(1, 3)], workers=2)
+        self.assertEqual(result, [Fraction(1, 6)])
+
+    def test_batch_apply_errors(self):
+        """Test that unknown operations, length mismatches and bad worker counts raise ValueError."""
+        with self.assertRaises(ValueError):
+            batch_apply("pow", self.lefts, self.rights)
+        with self.assertRaises(ValueError):
+            batch_apply("add", self.lefts, self.rights[:-1])
+        with self.assertRaises(ValueError):
+            batch_apply("add", self.lefts, self.rights, workers=0)
+
+    def test_parallel_sum(self):
+        """Test that the parallel sum matches the sequential sum."""
+        expected = Fraction(0, 1)
+        for value in self.lefts:
+            expected = expected + value
+        self.assertEqual(parallel_sum(self.lefts, workers=4, chunk_size=7), expected)
+        self.assertEqual(parallel_sum(self.rights, workers=1), sum(self.rights))
+
+    def test_parallel_sum_mixed_and_empty(self):
+        """Test the parallel sum of mixed types and of an empty list."""
+        self.assertEqual(parallel_sum([Fraction(1, 2), 1, 0.25], workers=2, chunk_size=1), Fraction(7, 4))
+        self.assertEqual(parallel_sum([]), Fraction(0, 1))
+
+    def test_parallel_product(self):
+        """Test the parallel product, including a zero factor and an empty list."""
+        values = [Fraction(k, k + 1) for k in range(1, 50)]
+        self.assertEqual(parallel_product(values, workers=3, chunk_size=5), Fraction(1, 50))
+        self.assertEqual(parallel_product(values + [0], workers=3, chunk_size=5), Fraction(0, 1))
+        self.assertEqual(parallel_product([]), Fraction(1, 1))
+
+    def test_parallel_cumsum(self):
+        """Test that the chunked scan matches the sequential running sums, whatever the chunking."""
+        expected = list(Fraction.cumsum(self.lefts))
+        for workers, chunk_size in ((1, None), (4, 7), (3, 1), (2, 10 ** 6)):
+            self.assertEqual(parallel_cumsum(self.lefts, workers=workers, chunk_size=chunk_size), expected)
+        self.assertEqual(parallel_cumsum([Fraction(1, 2), 1, 0.25], workers=2, chunk_size=1),
+                         [Fraction(1, 2), Fraction(3, 2), Fraction(7, 4)])
+        self.assertEqual(parallel_cumsum([]), [])
+
+    def test_parallel_cumprod(self):
+        """Test that the chunked scan matches the sequential running products, with a zero factor."""
+        values = [Fraction(k, k + 1) for k in range(1, 30)] + [0, Fraction(3, 5)]
+        expected = list(Fraction.cumprod(values))
+        for workers, chunk_size in ((1, None), (3, 5), (2, 1)):
+            self.assertEqual(parallel_cumprod(values, workers=workers, chunk_size=chunk_size), expected)
+        self.assertEqual(parallel_cumprod([]), [])
+
+    def test_invalid_value(self):
+        """Test that an invalid value raises WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            parallel_sum([Fraction(1, 2), "1/2"], workers=2, chunk_size=1)
+        with self.assertRaises(WrongTypeError):
+            parallel_cumsum([Fraction(1, 2), "1/2"], workers=2, chunk_size=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import fractions
+import random
+import unittest
+
+from Fraction import Fraction, DenominatorIsZero, WrongTypeError
+from Fraction.polynomial import FractionPolynomial
+
+
+def std(value):
+    value = Fraction.convert_to_fraction(value)
+    return fractions.Fraction(value.numerator, value.denominator)
+
+
+def random_coefficients(rng, count):
+    return [Fraction(rng.randint(-20, 20), rng.randint(1, 12)) for _ in range(count)]
+
+
+class TestFractionPolynomial(unittest.TestCase):
+    """Unit tests for polynomials with exact coefficients."""
+
+    def test_coefficients_and_degree(self):
+        """Test the normalized coefficients, the degree and the text form."""
+        p = FractionPolynomial([1, Fraction(-1, 2), 0, 3, 0])
+        self.assertEqual(p.degree, 3)
+        self.assertEqual(p.coefficients(), [Fraction(1, 1), Fraction(-1, 2), Fraction(0, 1), Fraction(3, 1)])
+        self.assertEqual(p[5], Fraction(0, 1))
+        self.assertEqual(str(p), "3*x^3 - 1/2*x + 1")
+        self.assertEqual(FractionPolynomial([0, 0]).degree, -1)
+        self.assertEqual(str(FractionPolynomial([])), "0")
+
+    def test_evaluate(self):
+        """Test the batched evaluation against the evaluation with fractions.Fraction."""
+        rng = random.Random(47)
+        for _ in range(50):
+            coefficients = random_coefficients(rng, rng.randint(0, 8))
+            points = random_coefficients(rng, 20) + [Fraction(k, 7) for k in range(-5, 5)] + [3, 0.5]
+            p = FractionPolynomial(coefficients)
+            for x, value in zip(points, p.evaluate(points)):
+                self.assertEqual(std(value), sum(std(c) * std(x) ** i for i, c in enumerate(coefficients)))
+
+    def test_call(self):
+        """Test the evaluation at a single point and on a generator."""
+        p = FractionPolynomial([Fraction(1, 2), 0, 1])
+        self.assertEqual(p(Fraction(1, 3)), Fraction(11, 18))
+        self.assertEqual(p.evaluate(x for x in (0, 1)), [Fraction(1, 2), Fraction(3, 2)])
+        self.assertEqual(FractionPolynomial([]).evaluate([1, 2]), [Fraction(0, 1)] * 2)
+
+    def test_arithmetic(self):
+        """Test +, - and * against the values of the operands."""
+        rng = random.Random(47)
+        points = random_coefficients(rng, 6)
+        for _ in range(50):
+            p = FractionPolynomial(random_coefficients(rng, rng.randint(0, 6)))
+            q = FractionPolynomial(random_coefficients(rng, rng.randint(0, 6)))
+            for x, s, d, m in zip(points, (p + q).evaluate(points), (p - q).evaluate(points), (p * q).evaluate(points)):
+                self.assertEqual(s, p(x) + q(x))
+                self.assertEqual(d, p(x) - q(x))
+                self.assertEqual(m, p(x) * q(x))
+
+    def test_constants(self):
+        """Test the operations with constants on both sides."""
+        p = FractionPolynomial([1, 1])
+        self.assertEqual(p + 1, FractionPolynomial([2, 1]))
+        self.assertEqual(1 - p, FractionPolynomial([0, -1]))
+        self.assertEqual(p * Fraction(1, 2), FractionPolynomial([Fraction(1, 2), Fraction(1, 2)]))
+        self.assertEqual(2 * p, FractionPolynomial([2, 2]))
+        self.assertEqual(-p, FractionPolynomial([-1, -1]))
+        with self.assertRaises(TypeError):
+            p + "x"
+
+    def test_division(self):
+        """Test that divmod gives self = quotient * divisor + remainder with a smaller remainder."""
+        rng = random.Random(47)
+        for _ in range(100):
+            p = FractionPolynomial(random_coefficients(rng, rng.randint(0, 8)))
+            d = FractionPolynomial(random_coefficients(rng, rng.randint(1, 5)) + [Fraction(rng.randint(1, 9), 5)])
+            q, r = divmod(p, d)
+            self.assertEqual(q * d + r, p)
+            self.assertLess(r.degree, d.degree)
+            self.assertEqual(p // d, q)
+            self.assertEqual(p % d, r)
+
+    def test_exact_division(self):
+        """Test a division without remainder."""
+        p = FractionPolynomial([Fraction(-1, 4), 0, 1])  # x^2 - 1/4
+        q, r = divmod(p, FractionPolynomial([Fraction(1, 2), 1]))
+        self.assertEqual(q, FractionPolynomial([Fraction(-1, 2), 1]))
+        self.assertEqual(r, FractionPolynomial([]))
+
+    def test_division_by_zero(self):
+        """Test the division by the zero polynomial."""
+        with self.assertRaises(DenominatorIsZero):
+            divmod(FractionPolynomial([1, 2]), FractionPolynomial([0]))
+
+    def test_derivative(self):
+        """Test the exact derivative."""
+        p = FractionPolynomial([5, Fraction(1, 2), Fraction(2, 3), Fraction(-1, 4)])
+        self.assertEqual(p.derivative(), FractionPolynomial([Fraction(1, 2), Fraction(4, 3), Fraction(-3, 4)]))
+        self.assertEqual(FractionPolynomial([7]).derivative(), FractionPolynomial([]))
+
+    def test_invalid_coefficient(self):
+        """Test that an invalid coefficient raises WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            FractionPolynomial([1, "2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import random
+import unittest
+
+from Fraction import Fraction, DenominatorIsZero, WrongTypeError
+from Fraction.bounded import BoundedContext
+from Fraction.roots import iroot, exact_root, root_interval
+
+
+class TestIntegerRoot(unittest.TestCase):
+    """Unit tests for the integer kth root."""
+
+    def test_floor_root(self):
+        """Test that iroot(n, k) is the largest r with r ** k <= n."""
+        rng = random.Random(44)
+        for _ in range(500):
+            n, k = rng.randint(0, 10 ** rng.randint(1, 120)), rng.randint(1, 9)
+            r = iroot(n, k)
+            self.assertLessEqual(r ** k, n)
+            self.assertGreater((r + 1) ** k, n)
+
+    def test_perfect_powers(self):
+        """Test perfect powers and their neighbours."""
+        self.assertEqual(iroot(10 ** 99, 3), 10 ** 33)
+        self.assertEqual(iroot(10 ** 99 - 1, 3), 10 ** 33 - 1)
+        self.assertEqual(iroot(2 ** 640, 64), 1024)
+
+    def test_errors(self):
+        """Test the invalid arguments."""
+        with self.assertRaises(ValueError):
+            iroot(-1, 3)
+        with self.assertRaises(ValueError):
+            iroot(8, 0)
+        with self.assertRaises(TypeError):
+            iroot(8.0, 3)
+
+
+class TestRationalRoots(unittest.TestCase):
+    """Unit tests for exact roots and certified enclosing intervals."""
+
+    def test_exact_root(self):
+        """Test the roots of perfect powers, including negative values for odd indexes."""
+        self.assertEqual(exact_root(Fraction(9, 16)), Fraction(3, 4))
+        self.assertEqual(exact_root(Fraction(-8, 27), 3), Fraction(-2, 3))
+        self.assertEqual(exact_root(Fraction(10 ** 600, 7 ** 200), 100), Fraction(10 ** 6, 49))
+        self.assertEqual(exact_root(0.25), Fraction(1, 2))
+        self.assertIsNone(exact_root(Fraction(2, 9)))
+        self.assertIsNone(exact_root(Fraction(4, 3)))
+
+    def test_interval_encloses_root(self):
+        """Test the enclosure and its width for random values, indexes and precisions."""
+        rng = random.Random(44)
+        for _ in range(500):
+            value = Fraction(rng.randint(1, 10 ** 30), rng.randint(1, 10 ** 20))
+            k = rng.randint(1, 7)
+            if k % 2 and rng.random() < 0.5:
+                value = Fraction(-value.numerator, value.denominator)
+            precision = Fraction(1, rng.randint(1, 10 ** 25))
+            low, high = root_interval(value, k, precision)
+            self.assertLessEqual(high - low, precision)
+            if low == high:
+                self.assertEqual(low ** k, value)
+            else:
+                self.assertLess(low ** k, value)
+                self.assertLess(value, high ** k)
+
+    def test_interval_bounds(self):
+        """Test the dyadic bounds of a square root and the exact case."""
+        low, high = root_interval(2, 2, Fraction(1, 1000))
+        self.assertEqual((low, high), (Fraction(181, 128), Fraction(1449, 1024)))
+        self.assertEqual(root_interval(Fraction(49, 4)), (Fraction(7, 2), Fraction(7, 2)))
+
+    def test_large_values(self):
+        """Test values far beyond the float range."""
+        value = Fraction(2 * 10 ** 400, 3)
+        low, high = root_interval(value, 2, 1)
+        self.assertLess(low ** 2, value)
+        self.assertLess(value, high ** 2)
+        self.assertEqual(Fraction(10 ** 400, 9) ** 0.5, Fraction(10 ** 200, 3))
+
+    def test_errors(self):
+        """Test even roots of negative values, invalid precisions and invalid types."""
+        with self.assertRaises(ValueError):
+            exact_root(Fraction(-4, 9))
+        with self.assertRaises(ValueError):
+            root_interval(Fraction(-2, 1), 4)
+        with self.assertRaises(ValueError):
+            root_interval(2, 2, 0)
+        with self.assertRaises(TypeError):
+            root_interval(2, 2.0)
+        with self.assertRaises(WrongTypeError):
+            exact_root("4")
+
+
+class TestPower(unittest.TestCase):
+    """Unit tests for the exact paths of the ** operator."""
+
+    def test_integer_exponent_is_exact(self):
+        """Test integer exponents on values beyond the float precision."""
+        f = Fraction(10 ** 20 + 1, 3)
+        self.assertEqual(f ** 3, Fraction((10 ** 20 + 1) ** 3, 27))
+        self.assertEqual(Fraction(-2, 3) ** -3, Fraction(-27, 8))
+        self.assertEqual(f ** 2.0, f ** 2)
+        with self.assertRaises(DenominatorIsZero):
+            Fraction(0, 1) ** -1
+
+    def test_float_exponent_roots(self):
+        """Test float exponents giving exact rational results."""
+        self.assertEqual(Fraction(4, 9) ** 1.5, Fraction(8, 27))
+        self.assertEqual(Fraction(16, 81) ** 0.25, Fraction(2, 3))
+        self.assertEqual(Fraction(4, 9) ** -0.5, Fraction(3, 2))
+        self.assertAlmostEqual(float(Fraction(2, 1) ** 0.5), 2 ** 0.5)
+
+    def test_negative_base_with_float_exponent(self):
+        """Test that a negative base is rejected with a non-integer float exponent."""
+        with self.assertRaises(ValueError):
+            Fraction(-4, 9) ** 0.5
+        with self.assertRaises(ValueError):
+            Fraction(-8, 27) ** (1 / 3)
+        self.assertEqual(Fraction(-2, 3) ** 2.0, Fraction(4, 9))
+
+    def test_bounded_context_applies(self):
+        """Test that integer powers and exact roots are snapped inside a BoundedContext."""
+        with BoundedContext(100) as context:
+            self.assertEqual(Fraction(2, 3) ** 10, Fraction(1024, 59049).limit_denominator(100))
+            self.assertEqual(Fraction(3, 7) ** -5, Fraction(16807, 243).limit_denominator(100))
+            self.assertEqual(Fraction(10 ** 6, 127 ** 2) ** 0.5, Fraction(1000, 127).limit_denominator(100))
+        self.assertEqual(context.snapped, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import math
+import random
+import unittest
+
+from Fraction import Fraction, DenominatorIsZero, WrongTypeError
+from Fraction.parallel import batch_apply
+from Fraction.rounding import floor_all, ceil_all, trunc_all, round_all, divmod_all
+
+
+class TestBatchRounding(unittest.TestCase):
+    """Unit tests for the batch integer parts and remainders."""
+
+    def setUp(self):
+        rng = random.Random(39)
+        self.values = [Fraction(rng.randint(-10 ** 20, 10 ** 20), rng.randint(1, 1000)) for _ in range(200)]
+        self.values += [Fraction(5, 2), Fraction(-5, 2), 3, 0.5]
+
+    def test_floor_ceil_trunc(self):
+        """Test the batch floor, ceil and trunc against the scalar versions."""
+        fractions = [Fraction.convert_to_fraction(v) for v in self.values]
+        self.assertEqual(floor_all(self.values), [math.floor(f) for f in fractions])
+        self.assertEqual(ceil_all(self.values), [math.ceil(f) for f in fractions])
+        self.assertEqual(trunc_all(self.values), [math.trunc(f) for f in fractions])
+
+    def test_round_all(self):
+        """Test the batch rounding against the scalar version."""
+        fractions = [Fraction.convert_to_fraction(v) for v in self.values]
+        self.assertEqual(round_all(self.values), [round(f) for f in fractions])
+        self.assertEqual(round_all(self.values, 2), [round(f, 2) for f in fractions])
+
+    def test_divmod_all_common_divisor(self):
+        """Test divmod of every value by a common divisor."""
+        divisor = Fraction(7, 3)
+        expected = [divmod(Fraction.convert_to_fraction(v), divisor) for v in self.values]
+        self.assertEqual(divmod_all(self.values, divisor), expected)
+
+    def test_divmod_all_elementwise(self):
+        """Test elementwise divmod with a list of divisors."""
+        result = divmod_all([Fraction(7, 2), 5], [Fraction(1, 3), Fraction(-3, 2)])
+        self.assertEqual(result, [(10, Fraction(1, 6)), (-4, Fraction(-1, 1))])
+
+    def test_divmod_all_errors(self):
+        """Test the errors of the batch divmod."""
+        with self.assertRaises(ValueError):
+            divmod_all([1, 2], [1])
+        with self.assertRaises(DenominatorIsZero):
+            divmod_all([1, 2], 0)
+        with self.assertRaises(WrongTypeError):
+            floor_all([Fraction(1, 2), "1"])
+
+    def test_batch_apply_integer_division(self):
+        """Test the floordiv, mod and divmod operations of batch_apply."""
+        lefts, rights = [Fraction(7, 2), Fraction(-7, 2)], [Fraction(1, 3), 2]
+        self.assertEqual(batch_apply("floordiv", lefts, rights), [10, -2])
+        self.assertEqual(batch_apply("mod", lefts, rights), [Fraction(1, 6), Fraction(1, 2)])
+        self.assertEqual(batch_apply("divmod", lefts, rights), [(10, Fraction(1, 6)), (-2, Fraction(1, 2))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from Fraction import Fraction, DenominatorIsZero, WrongTypeError
+from Fraction.series import series_sum, hypergeometric_sum
+
+
+def naive_sum(terms):
+    total = Fraction(0, 1)
+    for term in terms:
+        total = total + term
+    return total
+
+
+class TestSeriesSum(unittest.TestCase):
+    """Unit tests for the binary-splitting sum of a term generator."""
+
+    def test_harmonic(self):
+        """Test a harmonic sum against the naive loop."""
+        expected = naive_sum(Fraction(1, k) for k in range(1, 201))
+        self.assertEqual(series_sum(lambda k: Fraction(1, k), 200, start=1), expected)
+
+    def test_small_harmonic(self):
+        """Test the first harmonic numbers."""
+        self.assertEqual(series_sum(lambda k: Fraction(1, k), 4, start=1), Fraction(25, 12))
+        self.assertEqual(series_sum(lambda k: Fraction(1, k), 1, start=1), Fraction(1, 1))
+
+    def test_telescoping(self):
+        """Test a telescoping probability sum."""
+        self.assertEqual(series_sum(lambda k: Fraction(1, k * (k + 1)), 999, start=1), Fraction(999, 1000))
+
+    def test_iterable_of_terms(self):
+        """Test that an iterable is read up to count terms."""
+        terms = iter([Fraction(1, 2), 1, 0.25, Fraction(5, 1)])
+        self.assertEqual(series_sum(terms, 3), Fraction(7, 4))
+        self.assertEqual(next(terms), Fraction(5, 1))
+
+    def test_iterable_too_short(self):
+        """Test that an iterable shorter than count raises a ValueError."""
+        with self.assertRaises(ValueError):
+            series_sum([1, 2], 3)
+
+    def test_empty_sum(self):
+        """Test that zero term gives zero."""
+        self.assertEqual(series_sum(lambda k: Fraction(1, k), 0, start=1), Fraction(0, 1))
+
+    def test_alternating_signs(self):
+        """Test a series with alternating signs and a negative result."""
+        expected = naive_sum(Fraction((-1) ** (k + 1), k) for k in range(2, 60))
+        self.assertEqual(series_sum(lambda k: Fraction((-1) ** (k + 1), k), 58, start=2), expected)
+
+    def test_invalid_count(self):
+        """Test that an invalid count raises a ValueError."""
+        with self.assertRaises(ValueError):
+            series_sum(lambda k: 1, -1)
+        with self.assertRaises(ValueError):
+            series_sum(lambda k: 1, 2.0)
+
+    def test_invalid_term(self):
+        """Test that an invalid term raises WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            series_sum(lambda k: "1", 2)
+
+
+class TestHypergeometricSum(unittest.TestCase):
+    """Unit tests for the binary-splitting sum of a term ratio recurrence."""
+
+    def test_exponential_series(self):
+        """Test the partial sums of sum(1 / k!)."""
+        expected = naive_sum(Fraction(1, 1) / Fraction(_factorial(k), 1) for k in range(30))
+        self.assertEqual(hypergeometric_sum(lambda k: 1, lambda k: k, 30), expected)
+        self.assertEqual(hypergeometric_sum(lambda k: 1, lambda k: k, 4), Fraction(8, 3))
+
+    def test_geometric_series_with_first_term(self):
+        """Test a geometric series of ratio -1/2 starting at 3/4."""
+        expected = naive_sum(Fraction(3, 4) * Fraction((-1) ** k, 2 ** k) for k in range(20))
+        self.assertEqual(hypergeometric_sum(lambda k: -1, lambda k: 2, 20, first=Fraction(3, 4)), expected)
+
+    def test_terminating_series(self):
+        """Test that a zero ratio ends the series."""
+        self.assertEqual(hypergeometric_sum(lambda k: 4 - k, lambda k: k, 10), Fraction(8, 1))  # (1 + 1)^3
+
+    def test_few_terms(self):
+        """Test zero and one term."""
+        self.assertEqual(hypergeometric_sum(lambda k: 1, lambda k: k, 0), Fraction(0, 1))
+        self.assertEqual(hypergeometric_sum(lambda k: 1, lambda k: k, 1, first=5), Fraction(5, 1))
+
+    def test_zero_denominator(self):
+        """Test that a zero q(k) raises DenominatorIsZero."""
+        with self.assertRaises(DenominatorIsZero):
+            hypergeometric_sum(lambda k: 1, lambda k: k - 3, 6)
+
+    def test_non_integer_ratio(self):
+        """Test that a non integer p(k) raises a TypeError."""
+        with self.assertRaises(TypeError):
+            hypergeometric_sum(lambda k: 0.5, lambda k: 1, 3)
+
+
+def _factorial(n):
+    result = 1
+    for k in range(2, n + 1):
+        result *= k
+    return result
+
+
+if __name__ == '__main__':
+    unittest.main()
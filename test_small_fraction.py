@@ -0,0 +1,168 @@
+import pickle
+import random
+import unittest
+
+from Fraction import Fraction, DenominatorIsZero, WrongTypeError
+from Fraction.small_fraction import SmallFraction, SmallFractionArray, NUM_MAX, NUM_MIN, DEN_MAX
+
+
+class TestSmallFraction(unittest.TestCase):
+    """Unit tests for the SmallFraction class."""
+
+    def test_creation_is_reduced(self):
+        """Test that a small fraction is packed in reduced form with a positive denominator."""
+        f = SmallFraction(6, -8)
+        self.assertIsInstance(f, SmallFraction)
+        self.assertEqual((f.numerator, f.denominator), (-3, 4))
+
+    def test_creation_promotes_big_values(self):
+        """Test that a value that does not fit in a word is built as a Fraction."""
+        self.assertIsInstance(SmallFraction(NUM_MAX + 1, 1), Fraction)
+        self.assertIsInstance(SmallFraction(1, DEN_MAX + 1), Fraction)
+        self.assertIsInstance(SmallFraction(NUM_MIN, DEN_MAX), SmallFraction)
+
+    def test_creation_errors(self):
+        """Test the errors raised by the constructor."""
+        with self.assertRaises(DenominatorIsZero):
+            SmallFraction(1, 0)
+        with self.assertRaises(TypeError):
+            SmallFraction(0.5, 1)
+
+    def test_no_instance_dict(self):
+        """Test that instances have no __dict__."""
+        self.assertFalse(hasattr(SmallFraction(1, 2), "__dict__"))
+
+    def test_str_like_fraction(self):
+        """Test that the textual representation is the one of Fraction."""
+        for num, den in [(1, 2), (-4, 2), (0, 5), (-7, 3)]:
+            self.assertEqual(str(SmallFraction(num, den)), str(Fraction(num, den)))
+
+    def test_equality_with_fraction(self):
+        """Test equality in both directions with Fraction, integers and floats."""
+        self.assertEqual(SmallFraction(1, 2), Fraction(1, 2))
+        self.assertEqual(Fraction(1, 2), SmallFraction(2, 4))
+        self.assertEqual(SmallFraction(4, 2), 2)
+        self.assertEqual(SmallFraction(1, 4), 0.25)
+        self.assertNotEqual(SmallFraction(1, 3), SmallFraction(1, 2))
+
+    def test_equality_with_invalid_type(self):
+        """Test that comparing with an invalid type raises WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            SmallFraction(1, 2) == "1/2"
+
+    def test_word_arithmetic(self):
+        """Test that arithmetic between small fractions and integers stays packed."""
+        a, b = SmallFraction(1, 2), SmallFraction(1, 3)
+        for result, expected in [(a + b, (5, 6)), (a - b, (1, 6)), (a * b, (1, 6)), (a / b, (3, 2)),
+                                 (a + 1, (3, 2)), (1 - a, (1, 2)), (3 * b, (1, 1)), (1 / b, (3, 1)), (-a, (-1, 2))]:
+            self.assertIsInstance(result, SmallFraction)
+            self.assertEqual((result.numerator, result.denominator), expected)
+
+    def test_promotion_on_overflow(self):
+        """Test that a result too large for a word is promoted to a Fraction."""
+        big = SmallFraction(NUM_MAX, 1)
+        result = big + 1
+        self.assertIsInstance(result, Fraction)
+        self.assertEqual(result, Fraction(NUM_MAX + 1, 1))
+        self.assertIsInstance(-SmallFraction(NUM_MIN, 1), Fraction)
+        self.assertEqual(SmallFraction(1, 65536) * SmallFraction(1, 65536), Fraction(1, 2 ** 32))
+
+    def test_mixed_arithmetic_with_fraction(self):
+        """Test that operations with a Fraction or a float give a Fraction."""
+        a = SmallFraction(1, 2)
+        self.assertEqual(a + Fraction(1, 3), Fraction(5, 6))
+        self.assertEqual(Fraction(1, 3) + a, Fraction(5, 6))
+        self.assertEqual(Fraction(1, 3) / a, Fraction(2, 3))
+        self.assertEqual(a * 0.5, Fraction(1, 4))
+
+    def test_division_by_zero(self):
+        """Test that dividing by zero raises DenominatorIsZero."""
+        with self.assertRaises(DenominatorIsZero):
+            SmallFraction(1, 2) / 0
+
+    def test_ordering(self):
+        """Test ordering against small fractions and fractions."""
+        self.assertTrue(SmallFraction(1, 3) < SmallFraction(1, 2))
+        self.assertTrue(SmallFraction(1, 2) >= Fraction(1, 2))
+        self.assertTrue(Fraction(1, 3) < SmallFraction(1, 2))
+
+    def test_float_and_pickle(self):
+        """Test float conversion and pickling."""
+        f = SmallFraction(-3, 8)
+        self.assertEqual(float(f), -0.375)
+        self.assertEqual(pickle.loads(pickle.dumps(f)), f)
+
+    def test_random_arithmetic_against_fraction(self):
+        """Test random operations against the arbitrary-precision Fraction."""
+        rng = random.Random(35)
+        for _ in range(500):
+            a = (rng.randint(-2 ** 20, 2 ** 20), rng.randint(1, 2 ** 20))
+            b = (rng.randint(-2 ** 20, 2 ** 20), rng.randint(1, 2 ** 20))
+            small_a, small_b = SmallFraction(*a), SmallFraction(*b)
+            big_a, big_b = Fraction(*a), Fraction(*b)
+            self.assertEqual(small_a + small_b, big_a + big_b)
+            self.assertEqual(small_a * small_b, big_a * big_b)
+            self.assertEqual(small_a - small_b, big_a - big_b)
+
+
+class TestSmallFractionArray(unittest.TestCase):
+    """Unit tests for the SmallFractionArray class."""
+
+    def test_storage_and_access(self):
+        """Test that values are stored in order and returned with their value."""
+        values = [SmallFraction(1, 2), 3, Fraction(-2, 7), 0.25]
+        array = SmallFractionArray(values)
+        self.assertEqual(len(array), 4)
+        self.assertEqual([str(v) for v in array], ["1/2", "3", "-2/7", "1/4"])
+        self.assertEqual(array[-1], SmallFraction(1, 4))
+
+    def test_promoted_values(self):
+        """Test that values beyond a word are kept exactly."""
+        big = Fraction(10 ** 30, 7)
+        array = SmallFractionArray([1, big, SmallFraction(1, 2)])
+        self.assertIs(array[1], big)
+        self.assertIs(list(array)[1], big)
+        self.assertEqual(array.sum(), big + Fraction(3, 2))
+
+    def test_sum(self):
+        """Test the exact sum against Fraction arithmetic."""
+        rng = random.Random(35)
+        values = [Fraction(rng.randint(-1000, 1000), rng.randint(1, 1000)) for _ in range(300)]
+        expected = sum(values, Fraction(0, 1))
+        self.assertEqual(SmallFractionArray(values).sum(), expected)
+
+    def test_invalid_value(self):
+        """Test that an invalid value raises WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            SmallFractionArray(["1/2"])
+
+    def test_index_error(self):
+        """Test that an index out of range raises an IndexError."""
+        with self.assertRaises(IndexError):
+            SmallFractionArray([1])[3]
+
+    def test_slice(self):
+        """Test that a slice returns a new array, promoted values included."""
+        big = Fraction(1, 2 ** 40)
+        array = SmallFractionArray([1, big, SmallFraction(1, 2), 3, big * 3])
+        part = array[1:5:2]
+        self.assertIsInstance(part, SmallFractionArray)
+        self.assertEqual(list(part), [big, 3])
+        self.assertEqual(list(array[::-1]), [big * 3, 3, SmallFraction(1, 2), big, 1])
+        self.assertEqual(list(array[0:2]), [1, big])
+        self.assertEqual(len(array[4:1]), 0)
+        self.assertEqual(array[-2:].sum(), 3 + big * 3)
+
+    def test_invalid_index(self):
+        """Test that an index which is neither an integer nor a slice raises a TypeError."""
+        with self.assertRaises(TypeError):
+            SmallFractionArray([1])["0"]
+
+    def test_memory(self):
+        """Test that packed storage is smaller than a list of Fraction."""
+        values = [Fraction(n, 7) for n in range(1000)]
+        self.assertLess(SmallFractionArray(values).memory_bytes(), 10 * len(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
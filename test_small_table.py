@@ -0,0 +1,109 @@
+import copy
+import os
+import pickle
+import tempfile
+import unittest
+
+from Fraction import Fraction, DenominatorIsZero
+from Fraction.small_table import enable_small_table, disable_small_table, small_table_stats, SmallFractionTable
+
+
+class TestSmallTable(unittest.TestCase):
+    """Unit tests for the precomputed small fraction table."""
+
+    def setUp(self):
+        self.table = enable_small_table(12)
+
+    def tearDown(self):
+        disable_small_table()
+
+    def test_reduced_forms(self):
+        """Test that every fraction of the table is reduced like without the table."""
+        for num in range(-12, 13):
+            for den in range(1, 13):
+                f = Fraction(num, den)
+                disable_small_table()
+                expected = Fraction(num, den)
+                enable_small_table(12)
+                self.assertEqual((f.numerator, f.denominator), (expected.numerator, expected.denominator))
+
+    def test_canonical_instances(self):
+        """Test that equivalent small fractions share the same instance."""
+        self.assertIs(Fraction(2, 4), Fraction(1, 2))
+        self.assertIs(Fraction(0, 7), Fraction(0, 1))
+        self.assertIs(Fraction(3, 6) + Fraction(1, 6), Fraction(2, 3))
+
+    def test_outside_table(self):
+        """Test that fractions outside the table are still built correctly."""
+        f = Fraction(26, 39)
+        self.assertEqual(str(f), "2/3")
+        self.assertEqual(str(Fraction(3, -6)), "-1/2")
+
+    def test_errors_unchanged(self):
+        """Test that invalid arguments still raise errors with a table."""
+        with self.assertRaises(DenominatorIsZero):
+            Fraction(1, 0)
+        with self.assertRaises(TypeError):
+            Fraction(1.5, 2)
+
+    def test_copy_and_pickle_keep_table_intact(self):
+        """Test that copying or unpickling a shared instance does not alter it."""
+        half = Fraction(1, 2)
+        self.assertEqual(copy.copy(half), half)
+        self.assertEqual(pickle.loads(pickle.dumps(Fraction(5, 100))), Fraction(1, 20))
+        self.assertTrue(Fraction(0, 1).is_zero())
+        self.assertEqual(str(Fraction(1, 2)), "1/2")
+
+    def test_stats(self):
+        """Test the hit and miss counters of the table."""
+        Fraction(1, 3)
+        Fraction(1, 300)
+        stats = small_table_stats()
+        self.assertEqual(stats["limit"], 12)
+        self.assertEqual(stats["entries"], 12 * 25)
+        self.assertGreaterEqual(stats["hits"], 1)
+        self.assertGreaterEqual(stats["misses"], 1)
+        self.assertGreater(stats["memory_bytes"], 0)
+        self.assertTrue(0 < stats["hit_rate"] < 1)
+
+    def test_disable(self):
+        """Test that no statistics are available once the table is disabled."""
+        disable_small_table()
+        self.assertIsNone(small_table_stats())
+        self.assertIsNot(Fraction(2, 4), Fraction(1, 2))
+
+    def test_cache_file(self):
+        """Test that a table written to a cache file is loaded back identically."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.bin")
+            built = enable_small_table(20, path)
+            loaded = enable_small_table(20, path)
+            self.assertEqual(list(loaded.canonical_index), list(built.canonical_index))
+            self.assertIsNone(SmallFractionTable.load(path, 21))
+            self.assertEqual(str(Fraction(-18, 20)), "-9/10")
+
+    def test_truncated_cache_file(self):
+        """Test that a truncated cache file is rebuilt and rewritten instead of raising."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.bin")
+            built = enable_small_table(20, path)
+            size = os.path.getsize(path)
+            for length in (size - 3, 12):  # Indices incomplets, puis en-tête incomplet
+                with open(path, "r+b") as cache:
+                    cache.truncate(length)
+                self.assertIsNone(SmallFractionTable.load(path, 20))
+                rebuilt = enable_small_table(20, path)
+                self.assertEqual(list(rebuilt.canonical_index), list(built.canonical_index))
+                self.assertEqual(os.path.getsize(path), size)
+                self.assertIsNotNone(SmallFractionTable.load(path, 20))
+
+    def test_invalid_limit(self):
+        """Test that an invalid limit raises an error."""
+        with self.assertRaises(ValueError):
+            enable_small_table(0)
+        with self.assertRaises(TypeError):
+            enable_small_table(2.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+import os
+import random
+import tempfile
+import unittest
+
+from Fraction import Fraction, WrongTypeError
+from Fraction.sorted_fractions import SortedFractionList, sort_exact, float_key, external_sort
+
+
+class TestSortExact(unittest.TestCase):
+    """Unit tests for the exact sort helpers."""
+
+    def test_float_key_overflow(self):
+        """Test that a fraction too large for a float gets an infinite key."""
+        self.assertEqual(float_key(Fraction(10 ** 400, 3)), float("inf"))
+        self.assertEqual(float_key(Fraction(-10 ** 400, 3)), float("-inf"))
+
+    def test_sort_exact_breaks_float_ties(self):
+        """Test that fractions with the same float value are sorted exactly."""
+        big = 2 ** 80
+        values = [Fraction(big + 2, big), Fraction(big + 1, big), Fraction(1, 1)]
+        self.assertEqual(sort_exact(values), [Fraction(1, 1), Fraction(big + 1, big), Fraction(big + 2, big)])
+
+    def test_sort_exact_huge_values(self):
+        """Test that fractions overflowing floats are sorted exactly."""
+        big = 10 ** 400
+        values = [Fraction(big + 1, 1), Fraction(-big, 1), Fraction(big, 1)]
+        self.assertEqual(sort_exact(values), [Fraction(-big, 1), Fraction(big, 1), Fraction(big + 1, 1)])
+
+    def test_sort_exact_runs_of_ties(self):
+        """Test several runs of float ties separated by distinct values."""
+        big = 2 ** 80
+        values = [Fraction(big + 3, big), Fraction(5, 1), Fraction(big + 1, big), Fraction(2 * big + 1, 2 * big),
+                  Fraction(-1, 3), Fraction(-big - 1, 3 * big), Fraction(1, 1)]
+        expected = [Fraction(-big - 1, 3 * big), Fraction(-1, 3), Fraction(1, 1), Fraction(2 * big + 1, 2 * big),
+                    Fraction(big + 1, big), Fraction(big + 3, big), Fraction(5, 1)]
+        self.assertEqual(sort_exact(values), expected)
+
+    def test_sort_exact_reverse(self):
+        """Test the decreasing order."""
+        values = [Fraction(1, 3), Fraction(-2, 1), Fraction(3, 4)]
+        self.assertEqual(sort_exact(values, reverse=True), [Fraction(3, 4), Fraction(1, 3), Fraction(-2, 1)])
+
+    def test_sort_exact_random(self):
+        """Test random fractions with many duplicates against a cross-multiplication sort."""
+        rng = random.Random(40)
+        values = [Fraction(rng.randint(-50, 50), rng.randint(1, 20)) for _ in range(2000)]
+        result = sort_exact(values)
+        self.assertTrue(all(a <= b for a, b in zip(result, result[1:])))
+        self.assertEqual(len(result), len(values))
+
+
+class TestExternalSort(unittest.TestCase):
+    """Unit tests for the external merge sort."""
+
+    def test_several_runs(self):
+        """Test a sort that spills several runs to disk."""
+        rng = random.Random(40)
+        values = [Fraction(rng.randint(-10 ** 30, 10 ** 30), rng.randint(1, 10 ** 6)) for _ in range(1000)]
+        values += [Fraction(2 ** 80 + 1, 2 ** 80), Fraction(2 ** 80 + 2, 2 ** 80), Fraction(1, 1)]
+        with tempfile.TemporaryDirectory() as directory:
+            result = list(external_sort(iter(values), chunk_size=64, directory=directory))
+            self.assertEqual(os.listdir(directory), [])
+        self.assertEqual(result, sort_exact(values))
+
+    def test_single_run(self):
+        """Test an input that fits in a single chunk, with integers and floats."""
+        result = list(external_sort([3, Fraction(1, 2), 0.25]))
+        self.assertEqual(result, [Fraction(1, 4), Fraction(1, 2), Fraction(3, 1)])
+        self.assertEqual(list(external_sort([])), [])
+
+    def test_abandoned_iteration_removes_files(self):
+        """Test that the temporary files are removed when the iteration is abandoned."""
+        with tempfile.TemporaryDirectory() as directory:
+            result = external_sort([Fraction(n, 7) for n in range(100, 0, -1)], chunk_size=10, directory=directory)
+            self.assertEqual(next(result), Fraction(1, 7))
+            self.assertNotEqual(os.listdir(directory), [])
+            result.close()
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_runs_written_before_next_chunk(self):
+        """Test that each run is on disk before the next chunk is read, and the exact-chunk edge case."""
+        with tempfile.TemporaryDirectory() as directory:
+            files_seen = []
+
+            def values():
+                for n in range(30, 0, -1):
+                    if n % 10 == 9 and n < 29:  # Deuxième élément d'un bloc (le premier est lu d'avance)
+                        files_seen.append(sum(len(files) for _, _, files in os.walk(directory)))
+                    yield Fraction(n, 3)
+
+            result = list(external_sort(values(), chunk_size=10, directory=directory))
+            self.assertEqual(result, [Fraction(n, 3) for n in range(1, 31)])
+            self.assertEqual(files_seen, [1, 2])
+            self.assertEqual(list(external_sort(range(10, 0, -1), chunk_size=10, directory=directory)),
+                             list(range(1, 11)))
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_invalid_arguments(self):
+        """Test the errors on the chunk size and on the values."""
+        with self.assertRaises(ValueError):
+            external_sort([1], chunk_size=0)
+        with self.assertRaises(WrongTypeError):
+            list(external_sort([Fraction(1, 2), "1"]))
+
+
+class TestSortedFractionList(unittest.TestCase):
+    """Unit tests for the SortedFractionList class."""
+
+    def setUp(self):
+        self.values = [Fraction(3, 4), Fraction(1, 3), 2, Fraction(2, 5), 0.5, Fraction(-1, 2), Fraction(1, 3)]
+        self.container = SortedFractionList(self.values)
+
+    def test_bulk_loading(self):
+        """Test that bulk loading sorts the values and keeps duplicates."""
+        self.assertEqual([str(f) for f in self.container], ["-1/2", "1/3", "1/3", "2/5", "1/2", "3/4", "2"])
+        self.assertEqual(len(self.container), 7)
+
+    def test_reversed(self):
+        """Test the iteration in decreasing order."""
+        self.assertEqual([str(f) for f in reversed(self.container)][:3], ["2", "3/4", "1/2"])
+
+    def test_getitem(self):
+        """Test access to the k-th smallest fraction."""
+        self.assertEqual(self.container[0], Fraction(-1, 2))
+        self.assertEqual(self.container[3], Fraction(2, 5))
+        self.assertEqual(self.container[-1], Fraction(2, 1))
+
+    def test_getitem_out_of_range(self):
+        """Test that an index out of range raises an IndexError."""
+        with self.assertRaises(IndexError):
+            self.container[7]
+
+    def test_contains(self):
+        """Test membership of fractions, integers and floats."""
+        self.assertIn(Fraction(2, 6), self.container)
+        self.assertIn(2, self.container)
+        self.assertIn(0.75, self.container)
+        self.assertNotIn(Fraction(1, 4), self.container)
+
+    def test_rank(self):
+        """Test the rank of present and absent values."""
+        self.assertEqual(self.container.rank(Fraction(1, 3)), 1)
+        self.assertEqual(self.container.rank(Fraction(3, 8)), 3)
+        self.assertEqual(self.container.rank(-5), 0)
+        self.assertEqual(self.container.rank(10), 7)
+
+    def test_add(self):
+        """Test that added fractions are inserted at their place."""
+        self.container.add(Fraction(3, 8))
+        self.container.add(-3)
+        self.assertEqual(self.container[0], Fraction(-3, 1))
+        self.assertEqual(self.container.rank(Fraction(3, 8)), 4)
+
+    def test_remove(self):
+        """Test that one occurrence of a fraction is removed."""
+        self.container.remove(Fraction(1, 3))
+        self.assertEqual(len(self.container), 6)
+        self.assertIn(Fraction(1, 3), self.container)
+
+    def test_remove_absent(self):
+        """Test that removing an absent fraction raises a ValueError."""
+        with self.assertRaises(ValueError):
+            self.container.remove(Fraction(1, 7))
+
+    def test_discard_absent(self):
+        """Test that discarding an absent fraction does nothing."""
+        self.container.discard(Fraction(1, 7))
+        self.assertEqual(len(self.container), 7)
+
+    def test_irange_closed(self):
+        """Test iteration over all fractions between 1/3 and 1/2 included."""
+        result = list(self.container.irange(Fraction(1, 3), Fraction(1, 2)))
+        self.assertEqual([str(f) for f in result], ["1/3", "1/3", "2/5", "1/2"])
+
+    def test_irange_open(self):
+        """Test iteration over all fractions strictly between 1/3 and 1/2."""
+        result = list(self.container.irange(Fraction(1, 3), Fraction(1, 2), inclusive=(False, False)))
+        self.assertEqual([str(f) for f in result], ["2/5"])
+
+    def test_irange_unbounded(self):
+        """Test iteration with a missing bound."""
+        self.assertEqual(len(list(self.container.irange(high=0))), 1)
+        self.assertEqual(len(list(self.container.irange(low=Fraction(3, 4)))), 2)
+
+    def test_invalid_type(self):
+        """Test that adding an invalid type raises WrongTypeError."""
+        with self.assertRaises(WrongTypeError):
+            self.container.add("1/2")
+
+    def test_random_operations_against_sorted_list(self):
+        """Test many insertions and removals with small blocks against a sorted reference list."""
+        rng = random.Random(29)
+        container = SortedFractionList()
+        container.LOAD = 4
+        reference = []
+        for _ in range(2000):
+            value = Fraction(rng.randint(-30, 30), rng.randint(1, 9))
+            if reference and rng.random() < 0.4:
+                value = rng.choice(reference)
+                container.remove(value)
+                reference.remove(value)
+            else:
+                container.add(value)
+                reference.append(value)
+        reference = sort_exact(reference)
+        self.assertEqual(list(container), reference)
+        for k in range(0, len(reference), 7):
+            self.assertEqual(container[k], reference[k])
+            self.assertEqual(container.rank(reference[k]), reference.index(reference[k]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import fractions
+import random
+import statistics
+import unittest
+
+from Fraction import Fraction, WrongTypeError
+from Fraction.stats import MomentAccumulator, StatisticsError, mean, variance, pvariance, median, quantile, \
+    weighted_mean, weighted_median, weighted_quantile
+
+
+def std(value):
+    return fractions.Fraction(value.numerator, value.denominator)
+
+
+class TestMoments(unittest.TestCase):
+    """Unit tests for the exact mean and variance accumulators."""
+
+    def setUp(self):
+        rng = random.Random(41)
+        self.values = [Fraction(rng.randint(-100, 100), rng.randint(1, 30)) for _ in range(500)]
+        self.reference = [std(v) for v in self.values]
+
+    def test_mean_and_variances(self):
+        """Test the exact results against the statistics module on fractions.Fraction."""
+        self.assertEqual(std(mean(self.values)), statistics.mean(self.reference))
+        self.assertEqual(std(variance(self.values)), statistics.variance(self.reference))
+        self.assertEqual(std(pvariance(self.values)), statistics.pvariance(self.reference))
+
+    def test_generator_input(self):
+        """Test that a generator is consumed in a single pass."""
+        self.assertEqual(mean(Fraction(k, 3) for k in range(1, 101)), Fraction(101, 6))
+
+    def test_mixed_types(self):
+        """Test integers and floats."""
+        self.assertEqual(mean([1, 0.5, Fraction(3, 2)]), Fraction(1, 1))
+
+    def test_merge(self):
+        """Test that merging chunk accumulators gives the result on the whole data."""
+        whole = MomentAccumulator(self.values)
+        merged = MomentAccumulator(self.values[:123]).merge(MomentAccumulator(self.values[123:]))
+        self.assertEqual(merged.count, whole.count)
+        self.assertEqual(merged.mean(), whole.mean())
+        self.assertEqual(merged.variance(), whole.variance())
+
+    def test_weighted(self):
+        """Test that integer weights act as repetitions."""
+        accumulator = MomentAccumulator()
+        accumulator.update_weighted([(Fraction(1, 2), 3), (2, 1), (Fraction(-1, 3), Fraction(1, 2))])
+        self.assertEqual(accumulator.total_weight, Fraction(9, 2))
+        expanded = [Fraction(1, 2)] * 3 + [Fraction(2, 1)]
+        repeated = MomentAccumulator()
+        repeated.update_weighted([(v, 2) for v in expanded] + [(Fraction(-1, 3), 1)])
+        self.assertEqual(accumulator.mean(), repeated.mean())
+        self.assertEqual(accumulator.pvariance(), repeated.pvariance())
+        self.assertEqual(weighted_mean([(1, 1), (4, 3)]), Fraction(13, 4))
+
+    def test_errors(self):
+        """Test the undefined statistics and invalid values."""
+        with self.assertRaises(StatisticsError):
+            mean([])
+        with self.assertRaises(StatisticsError):
+            variance([Fraction(1, 2)])
+        with self.assertRaises(StatisticsError):
+            weighted_mean([(1, -1)])
+        with self.assertRaises(WrongTypeError):
+            mean([Fraction(1, 2), "1"])
+
+
+class TestSelection(unittest.TestCase):
+    """Unit tests for the exact median and quantiles."""
+
+    def setUp(self):
+        rng = random.Random(41)
+        self.values = [Fraction(rng.randint(-100, 100), rng.randint(1, 30)) for _ in range(1001)]
+        self.reference = sorted(std(v) for v in self.values)
+
+    def test_median_small_buffer(self):
+        """Test the median with a buffer much smaller than the data (several passes)."""
+        for values in (self.values, self.values[:-1]):
+            expected = statistics.median(std(v) for v in values)
+            self.assertEqual(std(median(values, buffer_size=16, seed=1)), expected)
+
+    def test_median_large_buffer(self):
+        """Test the median when the whole data fits in the buffer."""
+        self.assertEqual(std(median(self.values)), statistics.median(self.reference))
+
+    def test_quantiles(self):
+        """Test interpolated quantiles against the sorted reference."""
+        n = len(self.reference)
+        for q in (Fraction(0, 1), Fraction(1, 10), Fraction(1, 3), 0.75, 1):
+            h = (n - 1) * std(Fraction.convert_to_fraction(q))
+            index = int(h)
+            upper = self.reference[min(index + 1, n - 1)]
+            expected = self.reference[index] + (h - index) * (upper - self.reference[index])
+            self.assertEqual(std(quantile(self.values, q, buffer_size=32, seed=2)), expected)
+
+    def test_duplicates(self):
+        """Test data made of a few repeated values."""
+        values = [Fraction(1, 3)] * 500 + [Fraction(1, 2)] * 501
+        self.assertEqual(median(values, buffer_size=8), Fraction(1, 2))
+
+    def test_reiterable_source(self):
+        """Test a zero-argument function giving a fresh generator at each pass."""
+        source = lambda: (Fraction(k, 7) for k in range(1000, 0, -1))
+        self.assertEqual(median(source, buffer_size=10), Fraction(1001, 14))
+
+    def test_one_shot_iterator(self):
+        """Test that a one-shot iterator is accepted."""
+        self.assertEqual(median(iter([3, 1, 2])), Fraction(2, 1))
+
+    def test_weighted_quantiles(self):
+        """Test the weighted median and quantiles."""
+        pairs = [(Fraction(1, 2), 1), (Fraction(3, 2), 5), (2, 1), (0, 0)]
+        self.assertEqual(weighted_median(pairs), Fraction(3, 2))
+        self.assertEqual(weighted_quantile(pairs, 0), Fraction(1, 2))
+        self.assertEqual(weighted_quantile(pairs, Fraction(1, 7)), Fraction(1, 2))
+        self.assertEqual(weighted_quantile(pairs, 1), Fraction(2, 1))
+
+    def test_weighted_median_small_buffer(self):
+        """Test the weighted median against the expanded data."""
+        rng = random.Random(41)
+        pairs = [(Fraction(rng.randint(-50, 50), rng.randint(1, 9)), rng.randint(0, 4)) for _ in range(400)]
+        expanded = sorted(std(v) for v, w in pairs for _ in range(w))
+        total = len(expanded)
+        expected = expanded[(total + 1) // 2 - 1]
+        self.assertEqual(std(weighted_median(pairs, buffer_size=8, seed=3)), expected)
+
+    def test_errors(self):
+        """Test empty data, invalid quantiles and zero total weight."""
+        with self.assertRaises(StatisticsError):
+            median([])
+        with self.assertRaises(StatisticsError):
+            quantile([1, 2], Fraction(3, 2))
+        with self.assertRaises(StatisticsError):
+            weighted_median([(1, 0), (2, 0)])
+        with self.assertRaises(StatisticsError):
+            weighted_median([(1, -1), (2, 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()